@@ -0,0 +1,89 @@
+"""
+Shared fixtures for the performance benchmarks
+
+Synthetic news, price and sentiment frames (see src.synthetic) are
+generated once per session at the size chosen with --scale (10k, 1m or
+10m rows) and a fixed seed, so runs on the same machine time the same work.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.synthetic import generate_articles, generate_ohlcv
+
+SCALES = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+
+# Row-at-a-time Python stages (TextBlob, NLTK) would take hours at 10M rows,
+# so they run on at most this many rows at every scale
+TEXT_ROW_CAP = 100_000
+
+def pytest_addoption(parser):
+    """Register the --scale option"""
+    parser.addoption('--scale', choices=sorted(SCALES), default='10k',
+                     help='Number of synthetic rows to benchmark on')
+
+@pytest.fixture(scope='session')
+def n_rows(request):
+    """Number of rows at the chosen scale"""
+    return SCALES[request.config.getoption('--scale')]
+
+@pytest.fixture(scope='session')
+def rng():
+    """Seeded random generator shared by the generators"""
+    return np.random.default_rng(0)
+
+def make_ohlc(n, rng):
+    """Create n minute bars of a geometric Brownian motion price"""
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.005, n)) * close
+    return pd.DataFrame({
+        'Open': close * (1 + rng.normal(0, 0.002, n)),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(1_000, 1_000_000, n),
+    }, index=pd.date_range('1990-01-01', periods=n, freq='min', name='Date'))
+
+@pytest.fixture(scope='session')
+def news_data(n_rows):
+    """Synthetic articles at the chosen scale"""
+    df = generate_articles(n_rows, seed=0)
+    return df.rename(columns={'date': 'publication_date'}).assign(text=df['headline'])
+
+@pytest.fixture(scope='session')
+def text_data(news_data):
+    """Articles for the row-at-a-time text stages, at most TEXT_ROW_CAP rows"""
+    return news_data.head(TEXT_ROW_CAP).copy()
+
+@pytest.fixture(scope='session')
+def ohlc_data(n_rows, rng):
+    """Synthetic OHLCV bars at the chosen scale"""
+    return make_ohlc(n_rows, rng)
+
+@pytest.fixture(scope='session')
+def panel_data(n_rows):
+    """A long daily price panel of up to ten years per ticker, about n_rows rows in total"""
+    n_days = max(min(n_rows // 100, 2520), 2)
+    dates = pd.bdate_range('2000-01-03', periods=n_days + 1)
+    return generate_ohlcv(n_rows // n_days, start=dates[0], end=dates[-1], seed=0)
+
+@pytest.fixture(scope='session')
+def merged_data(n_rows, rng):
+    """Daily sentiment joined to returns, one row per date and stock"""
+    sentiment = rng.uniform(-1, 1, n_rows)
+    return pd.DataFrame({
+        'sentiment': sentiment,
+        'return': 0.002 * sentiment + rng.normal(0, 0.02, n_rows),
+    })
+
+@pytest.fixture
+def measure(benchmark):
+    """
+    Time func(*args, **kwargs) over a fixed number of rounds and record the
+    rows processed, from which the regression check derives rows per second.
+    """
+    def run(func, *args, rows, rounds=3, **kwargs):
+        benchmark.extra_info['rows'] = int(rows)
+        return benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds,
+                                  iterations=1, warmup_rounds=0)
+    return run
@@ -0,0 +1,59 @@
+"""
+Benchmarks for technical indicators, bar aggregation, outlier detection and correlation
+"""
+
+from src.technical_indicators import TechnicalIndicators
+from src.bars import resample_bars
+from src.outlier import OutlierDetection
+from src.sentiment_analysis import compute_correlation
+
+def test_moving_average(measure, ohlc_data):
+    """50-bar simple moving average"""
+    result = measure(TechnicalIndicators(ohlc_data).moving_average, 50, rows=len(ohlc_data))
+    assert len(result) == len(ohlc_data)
+
+def test_relative_strength_index(measure, ohlc_data):
+    """14-bar RSI"""
+    result = measure(TechnicalIndicators(ohlc_data).relative_strength_index, 14, rows=len(ohlc_data))
+    assert result.dropna().between(0, 100).all()
+
+def test_macd(measure, ohlc_data):
+    """MACD line, signal and histogram"""
+    result = measure(TechnicalIndicators(ohlc_data).moving_average_convergence_divergence,
+                     rows=len(ohlc_data))
+    assert len(result) == len(ohlc_data)
+
+def test_resample_bars(measure, ohlc_data):
+    """Minute bars to 5-minute bars"""
+    result = measure(resample_bars, ohlc_data, '5min', rows=len(ohlc_data))
+    assert result['ticks'].sum() == len(ohlc_data)
+
+def test_outlier_iqr_mask(measure, ohlc_data):
+    """IQR bounds over all numeric columns"""
+    detector = OutlierDetection(ohlc_data)
+    mask, _ = measure(detector.outlier_mask, 'iqr', rows=len(ohlc_data))
+    assert mask.shape[0] == len(ohlc_data)
+
+def test_outlier_z_score_mask(measure, ohlc_data):
+    """Z-score bounds over all numeric columns"""
+    detector = OutlierDetection(ohlc_data)
+    mask, _ = measure(detector.outlier_mask, 'z_score', rows=len(ohlc_data))
+    assert mask.shape[0] == len(ohlc_data)
+
+def test_outlier_grouped_mask(measure, panel_data):
+    """Per-ticker IQR bounds"""
+    detector = OutlierDetection(panel_data)
+    mask, _ = measure(detector.grouped_mask, 'ticker', columns=['Close', 'Volume'], rows=len(panel_data))
+    assert mask.shape[0] == len(panel_data)
+
+def test_outlier_rolling_mask(measure, panel_data):
+    """Trailing-window MAD per ticker"""
+    detector = OutlierDetection(panel_data)
+    mask, _ = measure(detector.rolling_mask, columns=['Close'], window=21, group_col='ticker',
+                      rows=len(panel_data), rounds=1)
+    assert mask.shape[0] == len(panel_data)
+
+def test_compute_correlation(measure, merged_data):
+    """Pearson and Spearman correlation of sentiment and returns"""
+    result = measure(compute_correlation, merged_data, rows=len(merged_data))
+    assert result['pearson'] > 0
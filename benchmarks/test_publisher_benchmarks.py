@@ -0,0 +1,51 @@
+"""
+Benchmarks for publisher aggregations and time binning
+"""
+
+from src.analytics.publisher_analysis import (
+    analyze_publisher_activity,
+    analyze_publisher_domains,
+    analyze_publisher_content,
+    analyze_publisher_timing,
+    publisher_heavy_hitters
+)
+from src.binning import bin_counts, weekday_hour_counts
+
+def test_publisher_activity(measure, news_data):
+    """Article counts and shares per publisher"""
+    counts, _ = measure(analyze_publisher_activity, news_data, rows=len(news_data))
+    assert counts.sum() == len(news_data)
+
+def test_publisher_domains(measure, news_data):
+    """Domain extraction and counts"""
+    df = news_data[['publisher']].copy()
+    domains = measure(analyze_publisher_domains, df, rows=len(df))
+    assert domains.sum() == len(df)
+
+def test_publisher_content(measure, news_data):
+    """Article count and mean text length per publisher"""
+    result = measure(analyze_publisher_content, news_data, rows=len(news_data))
+    assert result['article_count'].sum() == len(news_data)
+
+def test_publisher_timing(measure, news_data):
+    """Hour and weekday patterns per publisher"""
+    df = news_data[['publisher', 'publication_date']].copy()
+    result = measure(analyze_publisher_timing, df, rows=len(df))
+    assert len(result) > 0
+
+def test_publisher_heavy_hitters(measure, news_data):
+    """Top-k publishers, domains and tickers in fixed memory, 100k-row chunks"""
+    chunks = [news_data.iloc[i:i + 100_000] for i in range(0, len(news_data), 100_000)]
+    sketches = measure(publisher_heavy_hitters, chunks, k=100, rows=len(news_data))
+    assert sketches['publisher'].total == len(news_data)
+
+def test_bin_counts(measure, news_data):
+    """Hourly and daily buckets in one pass"""
+    result = measure(bin_counts, news_data['publication_date'], ['h', 'D'], rows=len(news_data))
+    assert result['D'].sum() == len(news_data)
+
+def test_weekday_hour_counts_by_publisher(measure, news_data):
+    """Weekday x hour heatmap per publisher"""
+    result = measure(weekday_hour_counts, news_data['publication_date'],
+                     groups=news_data['publisher'], rows=len(news_data))
+    assert result.to_numpy().sum() == len(news_data)
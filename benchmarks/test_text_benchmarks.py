@@ -0,0 +1,68 @@
+"""
+Benchmarks for sentiment scoring and text processing
+"""
+
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from src.sentiment_analysis import compute_sentiment, aggregate_daily_sentiment
+from src.analytics.text_analysis import preprocess_text, extract_keywords
+from src.phrases import PhraseMiner
+from src.text_stats import text_statistics
+from src.mentions import MentionIndex
+
+def _require_nltk_data():
+    """Skip when the NLTK tokenizer data is not downloaded"""
+    try:
+        preprocess_text('markets rally')
+    except LookupError:
+        pytest.skip('NLTK punkt/stopwords data not available')
+
+def test_compute_sentiment(measure, text_data):
+    """TextBlob polarity per headline"""
+    result = measure(compute_sentiment, text_data, rows=len(text_data), rounds=1)
+    assert result['sentiment'].between(-1, 1).all()
+
+def test_aggregate_daily_sentiment(measure, news_data, rng):
+    """Mean sentiment per date and stock"""
+    df = news_data[['publication_date', 'stock']].assign(sentiment=rng.uniform(-1, 1, len(news_data)))
+    result = measure(aggregate_daily_sentiment, df, date_col='publication_date', rows=len(df))
+    assert len(result) > 0
+
+def test_preprocess_text(measure, text_data):
+    """NLTK tokenization and stop word removal per headline"""
+    _require_nltk_data()
+    result = measure(text_data['headline'].apply, preprocess_text, rows=len(text_data), rounds=1)
+    assert len(result) == len(text_data)
+
+def test_tfidf_vectorize(measure, news_data):
+    """TF-IDF matrix of all headlines"""
+    vectorizer = TfidfVectorizer(max_features=1_000)
+    matrix = measure(vectorizer.fit_transform, news_data['headline'], rows=len(news_data))
+    assert matrix.shape[0] == len(news_data)
+
+def test_extract_keywords(measure, text_data):
+    """Preprocessing plus TF-IDF keyword ranking"""
+    _require_nltk_data()
+    result = measure(extract_keywords, text_data.copy(), rows=len(text_data), rounds=1)
+    assert len(result) > 0
+
+def test_phrase_mining(measure, news_data):
+    """Hashed 1-3 gram counts plus per-ticker phrase TF-IDF"""
+    def mine(df):
+        miner = PhraseMiner().fit(df['headline'])
+        return miner.top_phrases(20), miner.group_tfidf(df['stock'], n=5)
+
+    top, per_ticker = measure(mine, news_data, rows=len(news_data), rounds=1)
+    assert len(top) > 0 and len(per_ticker) > 0
+
+def test_text_statistics(measure, news_data):
+    """Byte-level text statistics of all headlines"""
+    headlines = news_data['headline'].astype('string[pyarrow]')
+    stats = measure(text_statistics, headlines, rows=len(headlines))
+    assert len(stats) == len(headlines)
+
+def test_mention_index(measure, news_data):
+    """Aho-Corasick ticker mention index over all headlines"""
+    tickers = news_data['stock'].unique()
+    index = measure(MentionIndex.build, news_data['headline'], tickers=tickers, rows=len(news_data))
+    assert index.n_docs == len(news_data)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Script to benchmark missing-value filling on a multi-ticker price panel
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.datacleaning import fill_panel
+
+def setup_logging():
+    """Set up logging configuration"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def make_panel(n_tickers, n_days, missing=0.05, seed=0):
+    """Create a stacked OHLC panel with randomly missing closes"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2015-01-01', periods=n_days)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_tickers, n_days)), axis=1))
+    close[rng.random(close.shape) < missing] = np.nan
+    return pd.DataFrame({
+        'ticker': np.repeat([f'T{i:04d}' for i in range(n_tickers)], n_days),
+        'Date': np.tile(dates, n_tickers),
+        'Close': close.ravel()
+    })
+
+def per_ticker_loop(df):
+    """Baseline: fill each ticker separately"""
+    parts = [part.sort_values('Date').ffill() for _, part in df.groupby('ticker')]
+    return pd.concat(parts)
+
+def groupby_ffill(df):
+    """Baseline: pandas groupby forward fill"""
+    df = df.sort_values(['ticker', 'Date'])
+    df['Close'] = df.groupby('ticker')['Close'].ffill()
+    return df
+
+def timed(func, df, repeat):
+    """Return the best wall time of func over repeat runs"""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--days', type=int, default=2520)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    df = make_panel(args.tickers, args.days)
+    logger.info("Panel: %d tickers x %d days = %d rows", args.tickers, args.days, len(df))
+
+    candidates = {
+        'fill_panel (ffill)': lambda d: fill_panel(d, method='ffill'),
+        'fill_panel (time)': lambda d: fill_panel(d, method='time'),
+        'groupby().ffill()': groupby_ffill,
+        'per-ticker loop': per_ticker_loop,
+    }
+    for name, func in candidates.items():
+        seconds = timed(func, df, args.repeat)
+        logger.info("%-20s %8.3f s  %12.0f rows/s", name, seconds, len(df) / seconds)
+
+if __name__ == "__main__":
+    main()
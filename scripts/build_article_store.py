@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Script to load article CSV files into the month and ticker partitioned article store
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+# Add src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.article_store import ArticleStore
+
+def setup_logging():
+    """Set up logging configuration"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def main():
+    """Append article CSV files to the store"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('paths', nargs='+', help='Article CSV files')
+    parser.add_argument('--store', default='data/article_store', help='Store directory')
+    parser.add_argument('--buckets', type=int, default=16, help='Ticker buckets of a new store')
+    parser.add_argument('--date-col', help='Date column of a new store, inferred if omitted')
+    parser.add_argument('--chunksize', type=int, default=500_000, help='Rows held in memory at once')
+    args = parser.parse_args()
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    store = ArticleStore(args.store, n_buckets=args.buckets, date_col=args.date_col)
+    for path in args.paths:
+        start = time.perf_counter()
+        rows = store.import_csv(path, chunksize=args.chunksize)
+        logger.info("Stored %d articles from %s in %.1fs", rows, path, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()
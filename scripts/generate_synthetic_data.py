@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Script to generate synthetic articles and OHLCV prices for load testing
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+# Add src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.synthetic import iter_articles, iter_ohlcv, ticker_symbols, write_frames
+
+def setup_logging():
+    """Set up logging configuration"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def main():
+    """Generate the synthetic data sets"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=1_000_000, help='Number of articles')
+    parser.add_argument('--tickers', type=int, default=5_000, help='Number of tickers')
+    parser.add_argument('--publishers', type=int, default=1_000, help='Number of publishers')
+    parser.add_argument('--start', default='2020-01-01')
+    parser.add_argument('--end', default='2024-01-01')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunksize', type=int, default=1_000_000, help='Rows held in memory at once')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--output-dir', default='data/synthetic')
+    parser.add_argument('--no-prices', action='store_true', help='Only generate articles')
+    args = parser.parse_args()
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    # Articles and prices share one ticker universe
+    tickers = ticker_symbols(args.tickers, args.seed)
+
+    start = time.perf_counter()
+    path = os.path.join(args.output_dir, f'articles.{args.format}')
+    rows = write_frames(iter_articles(args.articles, chunksize=args.chunksize, seed=args.seed,
+                                      start=args.start, end=args.end, tickers=tickers,
+                                      n_publishers=args.publishers), path)
+    logger.info("Wrote %d articles to %s in %.1fs", rows, path, time.perf_counter() - start)
+
+    if not args.no_prices:
+        start = time.perf_counter()
+        path = os.path.join(args.output_dir, f'prices.{args.format}')
+        rows = write_frames(iter_ohlcv(tickers, start=args.start, end=args.end, seed=args.seed,
+                                       chunksize=args.chunksize), path)
+        logger.info("Wrote %d price bars to %s in %.1fs", rows, path, time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()
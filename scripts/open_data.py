@@ -1,6 +1,14 @@
 import pandas as pd
 from pathlib import Path
 import os
+import sys
+
+# Add repository root to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.catalog import DatasetCatalog
+from src.schema import compact_frame
+from src.profiling import profile_frame
 
 class CSVLoader:
     """Handles loading and basic EDA of CSV files from a specified directory"""
@@ -58,6 +66,7 @@ class CSVLoader:
         plt.show()   """
         self.data_dir = Path(data_dir)
         self.available_files = self._list_csv_files()
+        self.catalog = DatasetCatalog(self.data_dir)
         
     def _list_csv_files(self):
         """Scan directory for CSV files and return {filename: path} mapping"""
@@ -73,38 +82,79 @@ class CSVLoader:
             print(f"{i}. {name}")
         return list(self.available_files.keys())
     
-    def load_csv(self, file_input):
+    def _resolve(self, file_input):
+        """Return the file name (without extension) for a filename or 1-based index"""
+        # Handle numeric index input
+        if isinstance(file_input, int):
+            try:
+                return list(self.available_files.keys())[file_input - 1]
+            except IndexError:
+                raise ValueError(f"Invalid index. Choose 1-{len(self.available_files)}")
+        # Handle string filename input
+        file_input = Path(file_input).stem  # Remove extension if provided
+        if file_input not in self.available_files:
+            raise FileNotFoundError(f"File '{file_input}' not found. Available files: {list(self.available_files.keys())}")
+        return file_input
+
+    def describe_files(self):
+        """
+        Return the catalog (schema, rows, bytes, date range) of all files without loading them
+
+        Row counts are estimates unless rows_exact, and the date range covers
+        the first and last rows only unless dates_exact.
+        """
+        return self.catalog.entries
+
+    def load_csv(self, file_input, schema=None, columns=None, start=None, end=None):
         """
         Load CSV by filename (with or without extension) or index
         
         Args:
             file_input: Either filename (str) or index (int) from show_available_files()
+            schema: Optional column to dtype mapping (see src.schema) applied after loading
+            columns: Optional list of columns to read
+            start, end: Optional inclusive date range, only matching rows are kept
         Returns:
             pandas.DataFrame
         """
-        # Handle numeric index input
-        if isinstance(file_input, int):
-            try:
-                file_key = list(self.available_files.keys())[file_input - 1]
-                filepath = self.available_files[file_key]
-            except IndexError:
-                raise ValueError(f"Invalid index. Choose 1-{len(self.available_files)}")
-        # Handle string filename input
+        file_key = self._resolve(file_input)
+        if columns is None and start is None and end is None:
+            df = pd.read_csv(self.available_files[file_key])
         else:
-            file_input = Path(file_input).stem  # Remove extension if provided
-            filepath = self.available_files.get(file_input)
-            if not filepath:
-                raise FileNotFoundError(f"File '{file_input}' not found. Available files: {list(self.available_files.keys())}")
+            df = self.catalog.load(file_key, columns, start, end)
+        if schema is not None:
+            compact_frame(df, schema)
+        return df
+
+    def load_many(self, file_inputs=None, schema=None, columns=None, start=None, end=None, max_workers=None):
+        """
+        Load several files in parallel into one frame with a categorical 'ticker' column
         
-        return pd.read_csv(filepath)
+        Args:
+            file_inputs: Filenames or indices, all files if None
+            schema: Optional column to dtype mapping (see src.schema) applied after loading
+            columns: Optional list of columns to read from each file
+            start, end: Optional inclusive date range
+            max_workers: Number of loader threads
+        Returns:
+            pandas.DataFrame
+        """
+        names = None if file_inputs is None else [self._resolve(f) for f in file_inputs]
+        df = self.catalog.load_many(names, columns, start, end, max_workers=max_workers)
+        if schema is not None:
+            compact_frame(df, schema)
+        return df
     
-    def quick_eda(self, df):
-        """Perform basic EDA on loaded DataFrame"""
-        eda_results = {
-            "head": df.head(),
-            "info": df.info(),
-            "describe": df.describe(include='all'),
-            "nulls": df.isnull().sum(),
-            "duplicates": df.duplicated().sum()
-        }
-        return eda_results
\ No newline at end of file
+    def quick_eda(self, df, sample_size=None, n_jobs=None):
+        """
+        Profile a loaded DataFrame and return the results instead of printing them
+
+        Args:
+            df: DataFrame to profile
+            sample_size: Optional fast mode, statistics from a reservoir sample of this
+                many rows with HyperLogLog distinct counts (see src.profiling)
+            n_jobs: Worker threads for the per-column statistics
+        Returns:
+            dict with head, info, describe (one row per column), nulls and duplicates
+        """
+        return profile_frame(df, sample_size=sample_size, n_jobs=n_jobs)
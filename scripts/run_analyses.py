@@ -6,6 +6,7 @@ Script to run all financial news analyses
 import os
 import sys
 import logging
+import argparse
 from datetime import datetime
 
 # Add src directory to Python path
@@ -15,13 +16,15 @@ from src.analytics.descriptive_statistics import main as run_descriptive_stats
 from src.analytics.text_analysis import main as run_text_analysis
 from src.analytics.time_series_analysis import main as run_time_series
 from src.analytics.publisher_analysis import main as run_publisher_analysis
+from src.state_store import AnalyticsState
+from src.instrumentation import enable_metrics, profile, track
+from src.reporting import ReportWriter
 
-def setup_logging():
+def setup_logging(timestamp):
     """Set up logging configuration"""
     log_dir = 'logs'
     os.makedirs(log_dir, exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f'analysis_{timestamp}.log')
     
     logging.basicConfig(
@@ -33,31 +36,92 @@ def setup_logging():
         ]
     )
 
-def main():
-    """Run all analyses"""
-    setup_logging()
+def run_incremental(delta_files, state_path, report_path):
+    """Fold new delta files into the saved state and report from the state"""
     logger = logging.getLogger(__name__)
-    
-    try:
-        logger.info("Starting financial news analysis")
-        
+    state = AnalyticsState.load(state_path)
+    for path in delta_files:
+        state.update_file(path)
+    state.save(state_path)
+    state.write_report(report_path)
+    logger.info("Incremental report for %d articles written to %s", state.n_articles, report_path)
+
+def run_all(args):
+    """Run the full or incremental analyses, one tracked stage each"""
+    logger = logging.getLogger(__name__)
+
+    if args.delta:
+        logger.info("Starting incremental financial news analysis")
+        with track('incremental'):
+            run_incremental(args.delta, args.state, args.report)
+        return
+
+    logger.info("Starting financial news analysis")
+
+    # Months and tickers to analyze, pushed down to an article store source
+    filters = {'source': args.source, 'start': args.start, 'end': args.end, 'tickers': args.tickers}
+
+    # One run directory for every report, written in the background
+    with ReportWriter(run_id=args.run_id) as writer:
         # Run descriptive statistics
         logger.info("Running descriptive statistics analysis")
-        run_descriptive_stats()
+        with track('descriptive_statistics'):
+            run_descriptive_stats(writer, **filters)
         
         # Run text analysis
         logger.info("Running text analysis")
-        run_text_analysis()
+        with track('text_analysis'):
+            run_text_analysis(writer, **filters)
         
         # Run time series analysis
         logger.info("Running time series analysis")
-        run_time_series()
+        with track('time_series_analysis'):
+            run_time_series(writer, **filters)
         
         # Run publisher analysis
         logger.info("Running publisher analysis")
-        run_publisher_analysis()
-        
-        logger.info("All analyses completed successfully")
+        with track('publisher_analysis'):
+            run_publisher_analysis(writer, **filters)
+
+        with track('flush_reports'):
+            writer.close()
+    
+    logger.info("All analyses completed successfully, results in %s", writer.run_dir)
+
+def main():
+    """Run all analyses"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--delta', nargs='+', help='New article CSV files to fold into the saved state '
+                                                   'instead of recomputing from the full history')
+    parser.add_argument('--state', default='data/state/news_state.pkl')
+    parser.add_argument('--report', default='results/incremental_analysis.txt')
+    parser.add_argument('--source', default='data/processed_data.csv',
+                        help='Article CSV file or article store directory (see src.article_store)')
+    parser.add_argument('--start', help='First publication date to analyze')
+    parser.add_argument('--end', help='Last publication date to analyze')
+    parser.add_argument('--tickers', nargs='+', help='Only analyze articles about these tickers')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Record tracemalloc allocation peaks in the stage metrics')
+    parser.add_argument('--profile', choices=['cprofile', 'sample'],
+                        help='Profile the run and write flamegraph-ready output to logs/')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    args.run_id = timestamp
+    setup_logging(timestamp)
+    logger = logging.getLogger(__name__)
+
+    metrics_path = os.path.join('logs', f'metrics_{timestamp}.jsonl')
+    enable_metrics(metrics_path, trace_memory=args.trace_memory)
+    
+    try:
+        if args.profile:
+            with profile(os.path.join('logs', f'profile_{timestamp}'), mode=args.profile) as output:
+                run_all(args)
+            logger.info("Profile written to %s", output)
+        else:
+            run_all(args)
+        logger.info("Stage metrics written to %s", metrics_path)
         
     except Exception as e:
         logger.error(f"Error running analyses: {str(e)}", exc_info=True)
@@ -1,22 +1,42 @@
 import sys
 import os
+import argparse
+from datetime import datetime
 from pathlib import Path
 
-# Add the src directory to the Python path
-src_path = str(Path(__file__).parent.parent / 'src')
-sys.path.append(src_path)
+# Add the repository root to the Python path
+root_path = str(Path(__file__).parent.parent)
+sys.path.append(root_path)
 
-from article_sentiment_analysis import ArticleSentimentAnalyzer
+from src.article_sentiment_analysis import ArticleSentimentAnalyzer
+from src.instrumentation import enable_metrics, profile
 
 def main():
-    # Initialize the analyzer
-    data_path = "data/raw_analyst_ratings.csv"
-    analyzer = ArticleSentimentAnalyzer(data_path)
-    
+    parser = argparse.ArgumentParser(description="Run the article sentiment analysis")
+    parser.add_argument('--profile', choices=['cprofile', 'sample'],
+                        help='Profile the run and write flamegraph-ready output to logs/')
+    parser.add_argument('--source', default='data/raw_analyst_ratings.csv',
+                        help='Article CSV file or article store directory (see src.article_store)')
+    parser.add_argument('--start', help='First article date to analyze')
+    parser.add_argument('--end', help='Last article date to analyze')
+    parser.add_argument('--tickers', nargs='+', help='Only analyze articles about these tickers')
+    args = parser.parse_args()
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    enable_metrics(os.path.join('logs', f'metrics_{timestamp}.jsonl'))
+
+    # Initialize the analyzer, loading only the requested dates and tickers
+    analyzer = ArticleSentimentAnalyzer(args.source, start=args.start, end=args.end, tickers=args.tickers)
+
     # Run the full analysis
-    analyzer.run_full_analysis()
-    
+    if args.profile:
+        with profile(os.path.join('logs', f'profile_{timestamp}'), mode=args.profile) as output:
+            analyzer.run_full_analysis()
+        print(f"Profile written to {output}")
+    else:
+        analyzer.run_full_analysis()
+
     print("Analysis complete! Check the data/processed directory for results.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
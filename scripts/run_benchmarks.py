@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Script to run the performance benchmarks and check them against a baseline
+
+Each benchmark records the rows it processed, so a result is a throughput
+(rows per second of the fastest round). A run fails when any benchmark's
+throughput drops more than --threshold below the stored baseline for the
+same scale. Baselines are machine specific; refresh them with
+--update-baseline after an intended change or on new hardware.
+"""
+
+import os
+import sys
+import json
+import shutil
+import logging
+import argparse
+import subprocess
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+BASELINE_DIR = os.path.join(ROOT, 'benchmarks', 'baselines')
+
+def setup_logging():
+    """Set up logging configuration"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def throughput(results):
+    """Return {benchmark name: rows per second} from a pytest-benchmark JSON file"""
+    rates = {}
+    for bench in results['benchmarks']:
+        rows = bench.get('extra_info', {}).get('rows')
+        if rows:
+            rates[bench['name']] = rows / bench['stats']['min']
+    return rates
+
+def compare(current, baseline, threshold):
+    """
+    Compare throughputs against a baseline.
+
+    Args:
+        current (dict): Benchmark name to rows per second of this run
+        baseline (dict): Benchmark name to rows per second of the baseline
+        threshold (float): Allowed fractional drop, e.g. 0.25
+
+    Returns:
+        list: (name, baseline rate, current rate, change) of every regression
+    """
+    regressions = []
+    for name, rate in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = rate / reference - 1
+        if change < -threshold:
+            regressions.append((name, reference, rate, change))
+    return regressions
+
+def run_benchmarks(scale, output, select=None):
+    """Run the benchmark suite, writing pytest-benchmark JSON to output"""
+    command = [sys.executable, '-m', 'pytest', 'benchmarks', '--scale', scale,
+               f'--benchmark-json={output}', '--no-cov', '-p', 'no:cacheprovider']
+    if select:
+        command += ['-k', select]
+    return subprocess.run(command, cwd=ROOT).returncode
+
+def main():
+    """Run the benchmarks and check for throughput regressions"""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=['10k', '1m', '10m'], default='10k')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed fractional throughput drop before failing')
+    parser.add_argument('--baseline', help='Baseline JSON, defaults to benchmarks/baselines/<scale>.json')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store this run as the new baseline instead of checking it')
+    parser.add_argument('-k', dest='select', help='Only run benchmarks matching this expression')
+    args = parser.parse_args()
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    results_dir = os.path.join(ROOT, 'results', 'benchmarks')
+    os.makedirs(results_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output = os.path.join(results_dir, f'{args.scale}_{timestamp}.json')
+
+    if run_benchmarks(args.scale, output, args.select) != 0:
+        logger.error("Benchmark run failed")
+        sys.exit(1)
+
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f'{args.scale}.json')
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        shutil.copyfile(output, baseline_path)
+        logger.info("Baseline written to %s", baseline_path)
+        return
+
+    if not os.path.exists(baseline_path):
+        logger.warning("No baseline at %s, run with --update-baseline to create one", baseline_path)
+        return
+
+    with open(output) as f:
+        current = throughput(json.load(f))
+    with open(baseline_path) as f:
+        baseline = throughput(json.load(f))
+
+    for name, rate in sorted(current.items()):
+        reference = baseline.get(name)
+        change = f"{rate / reference - 1:+.1%}" if reference else "new"
+        logger.info("%-45s %14.0f rows/s  %s", name, rate, change)
+
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        for name, reference, rate, change in regressions:
+            logger.error("%s regressed %.1f%%: %.0f -> %.0f rows/s", name, -change * 100, reference, rate)
+        sys.exit(1)
+    logger.info("No throughput regression beyond %.0f%%", args.threshold * 100)
+
+if __name__ == "__main__":
+    main()
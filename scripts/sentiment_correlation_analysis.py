@@ -8,16 +8,29 @@ import seaborn as sns
 from typing import Tuple, List
 import logging
 import os
+import sys
+
+# Add repository root to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.price_store import PriceStore
+from src.mentions import MentionIndex
+from src.schema import load_article_data
+from src.returns import return_matrix
+from src.timestamps import EXCHANGE_TZ, ensure_datetime, exchange_time
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def load_processed_stock_data(ticker: str) -> pd.DataFrame:
+def load_processed_stock_data(ticker: str, store: PriceStore = None) -> pd.DataFrame:
     """
-    Load processed stock data from the data directory
+    Load processed stock data from the data directory, or from a memory-mapped
+    price store when one holding the ticker is given
     """
     try:
+        if store is not None and ticker in store.tickers():
+            return store.frame(ticker)
         file_path = os.path.join('data', 'yfinance_data', 'processed', f'{ticker}_processed_data.csv')
         stock_data = pd.read_csv(file_path)
         stock_data['Date'] = pd.to_datetime(stock_data['Date'])
@@ -29,10 +42,11 @@ def load_processed_stock_data(ticker: str) -> pd.DataFrame:
 
 def calculate_daily_returns(stock_data: pd.DataFrame) -> pd.DataFrame:
     """
-    Calculate daily returns from stock data
+    Calculate daily returns (in percent) from stock data without modifying the input frame
     """
-    stock_data['Daily_Return'] = stock_data['Close'].pct_change() * 100
-    return stock_data
+    close = stock_data['Adj Close' if 'Adj Close' in stock_data.columns else 'Close']
+    daily = return_matrix(close.to_numpy(dtype=np.float64), horizons=(1,))['values'][0, :, 0]
+    return stock_data.assign(Daily_Return=daily * 100)
 
 def analyze_sentiment(text: str) -> float:
     """
@@ -45,18 +59,34 @@ def analyze_sentiment(text: str) -> float:
         logger.warning(f"Error analyzing sentiment: {e}")
         return 0.0
 
+def load_ticker_news(news_data: pd.DataFrame, ticker: str, index: MentionIndex = None,
+                     start=None, end=None) -> pd.DataFrame:
+    """
+    Select the articles mentioning a ticker within [start, end], through the
+    mention index when one is given, otherwise by the stock column
+    """
+    if index is not None:
+        selected = index.select(news_data, ticker, start=start, end=end)
+    else:
+        selected = news_data[news_data['stock'] == ticker]
+        if start is not None:
+            selected = selected[selected['date'] >= pd.Timestamp(start, tz=selected['date'].dt.tz)]
+        if end is not None:
+            selected = selected[selected['date'] <= pd.Timestamp(end, tz=selected['date'].dt.tz)]
+    return selected.rename(columns={'date': 'Date', 'headline': 'Headline'})[['Date', 'Headline']]
+
 def process_news_data(news_data: pd.DataFrame) -> pd.DataFrame:
     """
     Process news data and calculate daily sentiment scores
     """
-    # Ensure date column is datetime
-    news_data['Date'] = pd.to_datetime(news_data['Date'])
+    # Ensure date column is datetime (no-op if already parsed)
+    ensure_datetime(news_data, 'Date', naive_tz=EXCHANGE_TZ)
     
     # Calculate sentiment for each headline
     news_data['Sentiment'] = news_data['Headline'].apply(analyze_sentiment)
     
     # Calculate daily average sentiment
-    daily_sentiment = news_data.groupby(news_data['Date'].dt.date)['Sentiment'].mean().reset_index()
+    daily_sentiment = news_data.groupby(exchange_time(news_data['Date']).dt.date)['Sentiment'].mean().reset_index()
     daily_sentiment['Date'] = pd.to_datetime(daily_sentiment['Date'])
     
     return daily_sentiment
@@ -107,32 +137,39 @@ def plot_correlation(stock_data: pd.DataFrame, news_data: pd.DataFrame, ticker:
     plt.savefig(f'correlation_analysis_{ticker}.png')
     plt.close()
 
-def main():
+def main(news_path: str = None):
     # List of tickers to analyze
     tickers = ['AAPL', 'GOOG', 'META']
+    store = PriceStore()
+    
+    # Index the tickers mentioned in each headline once, for all tickers
+    news = index = None
+    if news_path is not None:
+        news = load_article_data(news_path)
+        index = MentionIndex.build(news['headline'], tickers=tickers)
     
     for ticker in tickers:
         logger.info(f"Processing {ticker}...")
         
         # Load processed stock data
-        stock_data = load_processed_stock_data(ticker)
+        stock_data = load_processed_stock_data(ticker, store)
         stock_data = calculate_daily_returns(stock_data)
         
-        # Load news data (you'll need to implement this based on your news data source)
-        # news_data = pd.read_csv('path_to_news_data.csv')
-        # news_data = process_news_data(news_data)
-        
-        # Align data
-        # aligned_stock, aligned_news = align_data(stock_data, news_data)
-        
-        # Calculate correlation
-        # correlation = calculate_correlation(aligned_stock, aligned_news)
-        # logger.info(f"Correlation between news sentiment and stock returns for {ticker}: {correlation:.4f}")
-        
-        # Plot correlation
-        # plot_correlation(aligned_stock, aligned_news, ticker)
+        if news is not None:
+            # Headlines mentioning the ticker, not only those filed under it
+            news_data = process_news_data(load_ticker_news(news, ticker, index))
+            
+            # Align data
+            aligned_stock, aligned_news = align_data(stock_data, news_data)
+            
+            # Calculate correlation
+            correlation = calculate_correlation(aligned_stock, aligned_news)
+            logger.info(f"Correlation between news sentiment and stock returns for {ticker}: {correlation:.4f}")
+            
+            # Plot correlation
+            plot_correlation(aligned_stock, aligned_news, ticker)
         
         logger.info(f"Completed processing {ticker}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main(sys.argv[1] if len(sys.argv) > 1 else None) 
\ No newline at end of file
@@ -7,33 +7,72 @@ import numpy as np
 from datetime import datetime
 import matplotlib.pyplot as plt
 import seaborn as sns
+from src.schema import enforce_schema
+from src.article_store import load_articles
+from src.timestamps import exchange_dates
+from src.sketches import StreamingSummary
+from src.instrumentation import instrument
+from src.reporting import ReportWriter, finish_figure
+from src.text_stats import text_statistics, rollup_text_statistics
 
-def analyze_headline_lengths(df):
-    """Analyze the length of headlines"""
+@instrument
+def analyze_headline_lengths(df, approximate=False):
+    """Analyze the length of headlines
+
+    With approximate=True the quartiles come from a KLL sketch (see src.sketches)
+    instead of a full sort; count, mean, std, min and max stay exact.
+    """
     df['headline_length'] = df['headline'].str.len()
+    enforce_schema(df, columns=['headline_length'])
+    if approximate:
+        lengths = df['headline_length'].to_numpy(dtype=np.float64, na_value=np.nan)
+        return StreamingSummary().update(lengths).describe()
     headline_stats = df['headline_length'].describe()
     return headline_stats
 
+def headline_length_summary(chunks, column='headline'):
+    """Build a mergeable headline length summary from DataFrame chunks"""
+    summary = StreamingSummary()
+    for chunk in chunks:
+        lengths = chunk[column].str.len()
+        summary.update(lengths.to_numpy(dtype=np.float64, na_value=np.nan))
+    return summary
+
+@instrument
+def analyze_text_statistics(df, column='headline', by=None):
+    """Analyze text statistics of articles
+
+    Returns the describe() of every statistic, or with by set (e.g. 'publisher'
+    or 'stock') the per-group averages and uppercase ratio (see src.text_stats).
+    """
+    stats = text_statistics(df[column])
+    if by is None:
+        return stats.describe()
+    return rollup_text_statistics(stats, df[by])
+
+@instrument
 def analyze_publishers(df):
     """Analyze publisher activity"""
     publisher_counts = df['publisher'].value_counts()
     return publisher_counts
 
+@instrument
 def analyze_publication_dates(df):
     """Analyze publication date trends"""
-    df['publication_date'] = pd.to_datetime(df['publication_date'])
-    df['day_of_week'] = df['publication_date'].dt.day_name()
-    df['hour'] = df['publication_date'].dt.hour
+    local = exchange_dates(df, 'publication_date')
+    df['day_of_week'] = local.dt.day_name()
+    df['hour'] = local.dt.hour
+    enforce_schema(df, columns=['day_of_week', 'hour'])
     
     # Daily publication counts
-    daily_counts = df.groupby('day_of_week').size()
+    daily_counts = df.groupby('day_of_week', observed=True).size()
     
     # Hourly publication counts
     hourly_counts = df.groupby('hour').size()
     
     return daily_counts, hourly_counts
 
-def plot_publication_trends(df):
+def plot_publication_trends(df, writer=None):
     """Plot publication trends"""
     # Daily trend
     plt.figure(figsize=(12, 6))
@@ -43,31 +82,39 @@ def plot_publication_trends(df):
     plt.ylabel('Number of Articles')
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig('publication_trends.png')
-    plt.close()
+    finish_figure('publication_trends.png', writer)
+
+def main(writer=None, source='data/processed_data.csv', start=None, end=None, tickers=None):
+    own_writer = writer is None
+    if own_writer:
+        writer = ReportWriter()
 
-def main():
-    # Load your data
-    df = pd.read_csv('data/processed_data.csv')
+    # Load your data, only the requested months and tickers
+    df = load_articles(source, columns=['headline', 'publisher', 'publication_date', 'stock'],
+                       start=start, end=end, tickers=tickers)
     
     # Perform analyses
     headline_stats = analyze_headline_lengths(df)
+    text_stats = analyze_text_statistics(df)
+    stock_text_stats = analyze_text_statistics(df, by='stock')
     publisher_counts = analyze_publishers(df)
     daily_counts, hourly_counts = analyze_publication_dates(df)
     
-    # Save results
-    with open('results/descriptive_statistics.txt', 'w') as f:
-        f.write("Headline Length Statistics:\n")
-        f.write(str(headline_stats))
-        f.write("\n\nPublisher Activity:\n")
-        f.write(str(publisher_counts))
-        f.write("\n\nDaily Publication Counts:\n")
-        f.write(str(daily_counts))
-        f.write("\n\nHourly Publication Counts:\n")
-        f.write(str(hourly_counts))
+    # Save results in the background
+    writer.write_text('descriptive_statistics.txt', [
+        ("Headline Length Statistics", headline_stats),
+        ("Headline Text Statistics", text_stats),
+        ("Publisher Activity", publisher_counts),
+        ("Daily Publication Counts", daily_counts),
+        ("Hourly Publication Counts", hourly_counts),
+    ])
+    writer.write_table('stock_text_statistics.csv', stock_text_stats)
     
     # Generate plots
-    plot_publication_trends(df)
+    plot_publication_trends(df, writer)
+
+    if own_writer:
+        writer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -8,7 +8,15 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from collections import Counter
 import re
+from src.schema import enforce_schema, publisher_domain
+from src.article_store import load_articles
+from src.timestamps import exchange_dates
+from src.instrumentation import instrument
+from src.reporting import ReportWriter, finish_figure
+from src.sketches import HeavyHitters
+from src.text_stats import text_statistics, rollup_text_statistics
 
+@instrument
 def analyze_publisher_activity(df):
     """Analyze publisher activity and contribution"""
     # Count articles per publisher
@@ -19,50 +27,76 @@ def analyze_publisher_activity(df):
     
     return publisher_counts, publisher_percentages
 
+@instrument
 def analyze_publisher_domains(df):
     """Analyze publisher email domains"""
-    # Extract domains from email addresses
-    def extract_domain(email):
-        if '@' in str(email):
-            return email.split('@')[1]
-        return email
-    
-    df['domain'] = df['publisher'].apply(extract_domain)
+    # Extract domains from email addresses; map() on a categorical
+    # publisher column only visits the categories
+    df['domain'] = df['publisher'].map(publisher_domain)
+    enforce_schema(df, columns=['domain'])
     domain_counts = df['domain'].value_counts()
     
     return domain_counts
 
+def publisher_heavy_hitters(chunks, k=100, columns=('publisher', 'stock')):
+    """Top-k publishers, publisher domains and tickers over DataFrame chunks
+
+    Each sketch holds a fixed number of counters whatever the number of
+    chunks, and sketches from different workers combine with merge().
+    Returns a dict of HeavyHitters keyed by column, plus 'domain'.
+    """
+    sketches = {col: HeavyHitters(k) for col in columns}
+    if 'publisher' in columns:
+        sketches['domain'] = HeavyHitters(k)
+    for chunk in chunks:
+        for col in columns:
+            if col in chunk.columns:
+                sketches[col].update(chunk[col])
+        if 'domain' in sketches and 'publisher' in chunk.columns:
+            # Map the distinct publishers only, then count domains by weight
+            counts = chunk['publisher'].astype(object).value_counts()
+            sketches['domain'].update(counts.index.map(publisher_domain), counts.to_numpy())
+    return sketches
+
+@instrument
 def analyze_publisher_content(df):
-    """Analyze content patterns by publisher"""
-    # Group by publisher and analyze content
-    publisher_content = df.groupby('publisher').agg({
-        'headline': 'count',
-        'text': lambda x: x.str.len().mean()  # Average text length
-    }).rename(columns={
-        'headline': 'article_count',
-        'text': 'avg_text_length'
-    })
+    """Analyze content patterns by publisher
+
+    Text statistics come from src.text_stats and are rolled up with grouped
+    sums: average length, tokens and ticker mentions and the uppercase ratio.
+    Averages skip articles without text; article_count counts headlines.
+    """
+    has_text = df['text'].notna().to_numpy()
+    stats = text_statistics(df['text'][has_text])
+    rollup = rollup_text_statistics(stats, df['publisher'][has_text])
+    article_count = df.groupby('publisher', observed=True)['headline'].count()
+    publisher_content = rollup[['avg_char_length', 'avg_token_count',
+                                'avg_ticker_mentions', 'upper_ratio']].rename(
+        columns={'avg_char_length': 'avg_text_length'}).reindex(article_count.index)
+    publisher_content.insert(0, 'article_count', article_count)
     
     return publisher_content
 
+@instrument
 def analyze_publisher_timing(df):
     """Analyze publishing patterns by publisher"""
     # Convert to datetime
-    df['publication_date'] = pd.to_datetime(df['publication_date'])
+    local = exchange_dates(df, 'publication_date')
     
-    # Extract hour and day
-    df['hour'] = df['publication_date'].dt.hour
-    df['day_of_week'] = df['publication_date'].dt.day_name()
+    # Extract hour and day on the exchange clock
+    df['hour'] = local.dt.hour
+    df['day_of_week'] = local.dt.day_name()
+    enforce_schema(df, columns=['hour', 'day_of_week'])
     
     # Analyze timing patterns by publisher
-    timing_patterns = df.groupby('publisher').agg({
+    timing_patterns = df.groupby('publisher', observed=True).agg({
         'hour': ['mean', 'std'],
         'day_of_week': lambda x: x.mode()[0] if not x.empty else None
     })
     
     return timing_patterns
 
-def plot_publisher_distribution(publisher_counts):
+def plot_publisher_distribution(publisher_counts, writer=None):
     """Plot publisher distribution"""
     plt.figure(figsize=(12, 6))
     publisher_counts.head(10).plot(kind='bar')
@@ -71,10 +105,9 @@ def plot_publisher_distribution(publisher_counts):
     plt.ylabel('Number of Articles')
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig('publisher_distribution.png')
-    plt.close()
+    finish_figure('publisher_distribution.png', writer)
 
-def plot_domain_distribution(domain_counts):
+def plot_domain_distribution(domain_counts, writer=None):
     """Plot domain distribution"""
     plt.figure(figsize=(12, 6))
     domain_counts.head(10).plot(kind='bar')
@@ -83,12 +116,16 @@ def plot_domain_distribution(domain_counts):
     plt.ylabel('Number of Articles')
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig('domain_distribution.png')
-    plt.close()
+    finish_figure('domain_distribution.png', writer)
+
+def main(writer=None, source='data/processed_data.csv', start=None, end=None, tickers=None):
+    own_writer = writer is None
+    if own_writer:
+        writer = ReportWriter()
 
-def main():
-    # Load your data
-    df = pd.read_csv('data/processed_data.csv')
+    # Load your data, only the requested months and tickers
+    df = load_articles(source, columns=['headline', 'text', 'publisher', 'publication_date'],
+                       start=start, end=end, tickers=tickers)
     
     # Analyze publisher activity
     publisher_counts, publisher_percentages = analyze_publisher_activity(df)
@@ -102,23 +139,23 @@ def main():
     # Analyze publisher timing
     timing_patterns = analyze_publisher_timing(df)
     
-    # Save results
-    with open('results/publisher_analysis.txt', 'w') as f:
-        f.write("Publisher Activity Analysis:\n")
-        f.write("\nTop Publishers by Article Count:\n")
-        f.write(str(publisher_counts.head(10)))
-        f.write("\n\nPublisher Percentages:\n")
-        f.write(str(publisher_percentages.head(10)))
-        f.write("\n\nTop Publisher Domains:\n")
-        f.write(str(domain_counts.head(10)))
-        f.write("\n\nPublisher Content Analysis:\n")
-        f.write(str(publisher_content))
-        f.write("\n\nPublisher Timing Patterns:\n")
-        f.write(str(timing_patterns))
+    # Save results in the background
+    writer.write_text('publisher_analysis.txt', [
+        "Publisher Activity Analysis:",
+        ("Top Publishers by Article Count", publisher_counts.head(10)),
+        ("Publisher Percentages", publisher_percentages.head(10)),
+        ("Top Publisher Domains", domain_counts.head(10)),
+        ("Publisher Content Analysis", publisher_content),
+        ("Publisher Timing Patterns", timing_patterns),
+    ])
+    writer.write_table('publisher_counts.csv', publisher_counts)
     
     # Generate plots
-    plot_publisher_distribution(publisher_counts)
-    plot_domain_distribution(domain_counts)
+    plot_publisher_distribution(publisher_counts, writer)
+    plot_domain_distribution(domain_counts, writer)
+
+    if own_writer:
+        writer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
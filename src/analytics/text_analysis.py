@@ -6,34 +6,22 @@ import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import matplotlib.pyplot as plt
 import seaborn as sns
+from src.schema import enforce_schema
+from src.article_store import load_articles
+from src.instrumentation import instrument
+from src.reporting import ReportWriter, finish_figure
+from src.sketches import HeavyHitters
+from src.phrases import PhraseMiner
+from src.text_preprocessing import preprocess_text
 
-# Download required NLTK data
-nltk.download('punkt')
-nltk.download('stopwords')
-
-def preprocess_text(text):
-    """Preprocess text for analysis"""
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Tokenize
-    tokens = word_tokenize(text)
-    
-    # Remove stopwords
-    stop_words = set(stopwords.words('english'))
-    tokens = [word for word in tokens if word not in stop_words]
-    
-    return ' '.join(tokens)
-
+@instrument
 def extract_keywords(df, column='headline', n_keywords=20):
     """Extract most common keywords"""
     # Preprocess text
     df['processed_text'] = df[column].apply(preprocess_text)
+    enforce_schema(df, columns=['processed_text'])
     
     # Create TF-IDF vectorizer
     vectorizer = TfidfVectorizer(max_features=n_keywords)
@@ -53,10 +41,12 @@ def extract_keywords(df, column='headline', n_keywords=20):
     
     return keywords_df
 
+@instrument
 def perform_topic_modeling(df, column='headline', n_topics=5):
     """Perform topic modeling using LDA"""
     # Preprocess text
     df['processed_text'] = df[column].apply(preprocess_text)
+    enforce_schema(df, columns=['processed_text'])
     
     # Create document-term matrix
     vectorizer = CountVectorizer(max_df=0.95, min_df=2)
@@ -77,38 +67,86 @@ def perform_topic_modeling(df, column='headline', n_topics=5):
     
     return topics
 
-def plot_keyword_distribution(keywords_df):
+def keyword_heavy_hitters(chunks, column='headline', k=200, ngram_range=(1, 2)):
+    """Top-k n-grams by occurrence over DataFrame chunks, in fixed memory
+
+    N-grams are counted per chunk with a CountVectorizer and folded into a
+    HeavyHitters sketch, which merges across chunks and worker processes.
+    """
+    sketch = HeavyHitters(k)
+    for chunk in chunks:
+        vectorizer = CountVectorizer(stop_words='english', ngram_range=ngram_range)
+        try:
+            counts = vectorizer.fit_transform(chunk[column].astype(object).fillna(''))
+        except ValueError:
+            # Nothing but stop words in this chunk
+            continue
+        sketch.update(vectorizer.get_feature_names_out(), np.asarray(counts.sum(axis=0)).ravel())
+    return sketch
+
+def top_keywords(sketch, n_keywords=20):
+    """Keyword frame of a keyword_heavy_hitters sketch, with count bounds"""
+    return sketch.top(n_keywords).rename_axis('keyword').reset_index()
+
+@instrument
+def extract_phrases(df, column='headline', group_col=None, n_phrases=20, min_n=2):
+    """Frequent multi-word phrases of the corpus, or the top TF-IDF phrases per group
+
+    Groups are a column name such as 'stock', or any per-row labels such as
+    df['date'].dt.to_period('M').
+    """
+    miner = PhraseMiner().fit(df[column])
+    if group_col is None:
+        return miner.top_phrases(n_phrases, min_n=min_n)
+    groups = df[group_col] if isinstance(group_col, str) else group_col
+    return miner.group_tfidf(groups, n=n_phrases, min_n=min_n)
+
+def plot_keyword_distribution(keywords_df, writer=None, score_col='tfidf_score'):
     """Plot keyword distribution"""
+    label = 'TF-IDF Score' if score_col == 'tfidf_score' else score_col.replace('_', ' ').title()
     plt.figure(figsize=(12, 6))
-    sns.barplot(x='tfidf_score', y='keyword', data=keywords_df.head(10))
-    plt.title('Top 10 Keywords by TF-IDF Score')
-    plt.xlabel('TF-IDF Score')
+    sns.barplot(x=score_col, y='keyword', data=keywords_df.head(10))
+    plt.title(f'Top 10 Keywords by {label}')
+    plt.xlabel(label)
     plt.ylabel('Keyword')
     plt.tight_layout()
-    plt.savefig('keyword_distribution.png')
-    plt.close()
+    finish_figure('keyword_distribution.png', writer)
 
-def main():
-    # Load your data
-    df = pd.read_csv('data/processed_data.csv')
+def main(writer=None, source='data/processed_data.csv', start=None, end=None, tickers=None):
+    own_writer = writer is None
+    if own_writer:
+        writer = ReportWriter()
+
+    # Load your data, only the requested months and tickers
+    df = load_articles(source, columns=['headline', 'stock'],
+                       start=start, end=end, tickers=tickers)
     
     # Extract keywords
     keywords_df = extract_keywords(df)
     
+    # Extract phrases overall and per ticker
+    phrases_df = extract_phrases(df)
+    ticker_phrases = extract_phrases(df, group_col='stock', n_phrases=5)
+
     # Perform topic modeling
     topics = perform_topic_modeling(df)
     
-    # Save results
-    with open('results/text_analysis.txt', 'w') as f:
-        f.write("Top Keywords:\n")
-        f.write(str(keywords_df))
-        f.write("\n\nIdentified Topics:\n")
-        for i, topic in enumerate(topics):
-            f.write(f"\nTopic {i+1}:\n")
-            f.write(', '.join(topic))
+    # Save results in the background
+    writer.write_text('text_analysis.txt', [
+        ("Top Keywords", keywords_df),
+        ("Top Phrases", phrases_df),
+        "Identified Topics:\n" + ''.join(f"\nTopic {i+1}:\n{', '.join(topic)}"
+                                         for i, topic in enumerate(topics)),
+    ])
+    writer.write_table('keywords.csv', keywords_df, index=False)
+    writer.write_table('phrases.csv', phrases_df, index=False)
+    writer.write_table('ticker_phrases.csv', ticker_phrases, index=False)
     
     # Generate plots
-    plot_keyword_distribution(keywords_df)
+    plot_keyword_distribution(keywords_df, writer)
+
+    if own_writer:
+        writer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,33 +4,32 @@ Time Series Analysis Module for Financial News Analysis
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import matplotlib.pyplot as plt
 import seaborn as sns
 from statsmodels.tsa.seasonal import seasonal_decompose
 from statsmodels.tsa.stattools import adfuller
+from src.article_store import load_articles
+from src.timestamps import exchange_dates
+from src.binning import bin_counts, weekday_hour_counts
+from src.instrumentation import instrument
+from src.reporting import ReportWriter, finish_figure
 
+@instrument
 def analyze_publication_frequency(df):
     """Analyze publication frequency over time"""
     # Convert to datetime
-    df['publication_date'] = pd.to_datetime(df['publication_date'])
-    
-    # Create time series
-    ts = df.groupby('publication_date').size()
-    
-    # Resample to daily frequency
-    daily_ts = ts.resample('D').sum()
+    # Count straight into dense exchange-day buckets (see src.binning)
+    daily_ts = bin_counts(exchange_dates(df, 'publication_date'), 'D')
     
     return daily_ts
 
+@instrument
 def analyze_publishing_times(df):
     """Analyze publishing time patterns"""
-    # Extract hour and day of week
-    df['hour'] = df['publication_date'].dt.hour
-    df['day_of_week'] = df['publication_date'].dt.day_name()
-    
-    # Create heatmap data
-    heatmap_data = df.groupby(['day_of_week', 'hour']).size().unstack()
+    # Dense weekday x hour heatmap data, zero where nothing was published
+    heatmap_data = weekday_hour_counts(exchange_dates(df, 'publication_date'))
     
     return heatmap_data
 
@@ -52,7 +51,113 @@ def test_stationarity(ts):
         'Critical Values': result[4]
     }
 
-def plot_time_series(ts, title):
+def series_matrix(df, group_col, date_col='publication_date', value_col=None, freq='D'):
+    """Build one column per group: article counts, or the mean of value_col, per period"""
+    dates = exchange_dates(df, date_col)
+    if value_col is None:
+        return bin_counts(dates, freq, groups=df[group_col])
+    wide = df.groupby([dates.dt.floor(freq), df[group_col]], observed=True)[value_col].mean().unstack()
+    full_range = pd.date_range(wide.index.min(), wide.index.max(), freq=freq)
+    return wide.reindex(full_range)
+
+def _fast_decompose(values, period, model):
+    """Classical moving-average decomposition of every column of a 2-D array at once"""
+    # Centered moving average, a 2 x period MA for even periods as in statsmodels
+    if period % 2 == 0:
+        weights = np.r_[0.5, np.ones(period - 1), 0.5] / period
+    else:
+        weights = np.ones(period) / period
+    half = len(weights) // 2
+    trend = np.full(values.shape, np.nan)
+    if len(values) >= len(weights):
+        windows = np.lib.stride_tricks.sliding_window_view(values, len(weights), axis=0)
+        trend[half:len(values) - half] = windows @ weights
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        detrended = values - trend if model == 'additive' else values / trend
+        phase = np.arange(len(values)) % period
+        period_averages = np.stack([np.nanmean(detrended[phase == i], axis=0) for i in range(period)])
+        if model == 'additive':
+            period_averages -= period_averages.mean(axis=0)
+            seasonal = period_averages[phase]
+            resid = values - trend - seasonal
+        else:
+            period_averages /= period_averages.mean(axis=0)
+            seasonal = period_averages[phase]
+            resid = values / (trend * seasonal)
+    return trend, seasonal, resid
+
+def _decompose_column(args):
+    """Run seasonal_decompose on one series (a process pool task)"""
+    values, period, model = args
+    nan = np.full(len(values), np.nan)
+    try:
+        result = seasonal_decompose(values, period=period, model=model)
+    except ValueError:
+        # Missing values or fewer than two full periods
+        return nan, nan, nan
+    return result.trend, result.seasonal, result.resid
+
+@instrument
+def batch_decompose(wide, period=7, model='additive', fast=True, n_jobs=None):
+    """Decompose every column of a wide frame, returning a tidy frame of components"""
+    values = wide.to_numpy(dtype=np.float64)
+    if fast:
+        trend, seasonal, resid = _fast_decompose(values, period, model)
+    else:
+        tasks = [(values[:, i], period, model) for i in range(values.shape[1])]
+        if n_jobs == 1:
+            results = list(map(_decompose_column, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                results = list(pool.map(_decompose_column, tasks, chunksize=max(1, len(tasks) // 64)))
+        trend, seasonal, resid = (np.column_stack([r[i] for r in results]) if results
+                                  else np.empty(values.shape) for i in range(3))
+
+    # Series-major order: all dates of the first series, then the next
+    n_dates, n_series = values.shape
+    return pd.DataFrame({
+        'series': np.repeat(wide.columns.to_numpy(), n_dates),
+        'date': np.tile(wide.index.to_numpy(), n_series),
+        'observed': values.T.ravel(),
+        'trend': trend.T.ravel(),
+        'seasonal': seasonal.T.ravel(),
+        'resid': resid.T.ravel(),
+    })
+
+def seasonal_strength(components):
+    """Per-series strength of additive seasonality, 1 - var(resid) / var(seasonal + resid)"""
+    grouped = components.assign(detrended=components['seasonal'] + components['resid']) \
+        .groupby('series', sort=False)
+    strength = 1 - grouped['resid'].var() / grouped['detrended'].var()
+    return strength.clip(lower=0).rename('seasonal_strength')
+
+def _adf_row(values):
+    """Run the ADF test on one series (a process pool task)"""
+    values = values[~np.isnan(values)]
+    try:
+        stat, p_value, used_lag, nobs, critical, _ = adfuller(values)
+    except (ValueError, np.linalg.LinAlgError):
+        # Constant or too short series
+        return [np.nan] * 7
+    return [stat, p_value, used_lag, nobs, critical['1%'], critical['5%'], critical['10%']]
+
+@instrument
+def batch_stationarity(wide, n_jobs=None):
+    """Run the ADF test on every column of a wide frame, returning one row per series"""
+    tasks = [wide[col].to_numpy(dtype=np.float64) for col in wide.columns]
+    if n_jobs == 1:
+        rows = list(map(_adf_row, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            rows = list(pool.map(_adf_row, tasks, chunksize=max(1, len(tasks) // 64)))
+    result = pd.DataFrame(rows, columns=['adf_statistic', 'p_value', 'used_lag', 'nobs',
+                                         'critical_1%', 'critical_5%', 'critical_10%'],
+                          index=pd.Index(wide.columns, name='series'))
+    result['stationary_5%'] = result['p_value'] < 0.05
+    return result.reset_index()
+
+def plot_time_series(ts, title, writer=None):
     """Plot time series data"""
     plt.figure(figsize=(15, 6))
     ts.plot()
@@ -61,10 +166,9 @@ def plot_time_series(ts, title):
     plt.ylabel('Number of Articles')
     plt.xticks(rotation=45)
     plt.tight_layout()
-    plt.savefig(f'{title.lower().replace(" ", "_")}.png')
-    plt.close()
+    finish_figure(f'{title.lower().replace(" ", "_")}.png', writer)
 
-def plot_heatmap(heatmap_data):
+def plot_heatmap(heatmap_data, writer=None):
     """Plot publishing time heatmap"""
     plt.figure(figsize=(12, 8))
     sns.heatmap(heatmap_data, cmap='YlOrRd')
@@ -72,12 +176,16 @@ def plot_heatmap(heatmap_data):
     plt.xlabel('Hour of Day')
     plt.ylabel('Day of Week')
     plt.tight_layout()
-    plt.savefig('publication_heatmap.png')
-    plt.close()
+    finish_figure('publication_heatmap.png', writer)
+
+def main(writer=None, source='data/processed_data.csv', start=None, end=None, tickers=None):
+    own_writer = writer is None
+    if own_writer:
+        writer = ReportWriter()
 
-def main():
-    # Load your data
-    df = pd.read_csv('data/processed_data.csv')
+    # Load your data, only the requested months and tickers
+    df = load_articles(source, columns=['publication_date', 'publisher'],
+                       start=start, end=end, tickers=tickers)
     
     # Analyze publication frequency
     daily_ts = analyze_publication_frequency(df)
@@ -91,20 +199,10 @@ def main():
     # Test stationarity
     stationarity_test = test_stationarity(daily_ts)
     
-    # Save results
-    with open('results/time_series_analysis.txt', 'w') as f:
-        f.write("Publication Frequency Statistics:\n")
-        f.write(str(daily_ts.describe()))
-        f.write("\n\nStationarity Test Results:\n")
-        f.write(str(stationarity_test))
-        f.write("\n\nSeasonal Decomposition:\n")
-        f.write(f"Trend:\n{decomposition.trend.describe()}\n")
-        f.write(f"Seasonal:\n{decomposition.seasonal.describe()}\n")
-        f.write(f"Residual:\n{decomposition.resid.describe()}\n")
-    
-    # Generate plots
-    plot_time_series(daily_ts, 'Daily Publication Frequency')
-    plot_heatmap(heatmap_data)
+    # Generate plots, rendered in the background while the per-publisher
+    # analysis below runs
+    plot_time_series(daily_ts, 'Daily Publication Frequency', writer)
+    plot_heatmap(heatmap_data, writer)
     
     # Plot decomposition components
     plt.figure(figsize=(15, 10))
@@ -121,8 +219,29 @@ def main():
     decomposition.resid.plot()
     plt.title('Residual')
     plt.tight_layout()
-    plt.savefig('time_series_decomposition.png')
-    plt.close()
+    finish_figure('time_series_decomposition.png', writer)
+
+    # Same analysis for every publisher at once
+    publisher_ts = series_matrix(df, 'publisher')
+    components = batch_decompose(publisher_ts)
+    stationarity = batch_stationarity(publisher_ts)
+    publisher_summary = (stationarity.set_index('series')
+                         .join(seasonal_strength(components))
+                         .sort_values('seasonal_strength', ascending=False))
+    
+    # Save results in the background
+    writer.write_text('time_series_analysis.txt', [
+        ("Publication Frequency Statistics", daily_ts.describe()),
+        ("Stationarity Test Results", stationarity_test),
+        ("Seasonal Decomposition", f"Trend:\n{decomposition.trend.describe()}\n"
+                                   f"Seasonal:\n{decomposition.seasonal.describe()}\n"
+                                   f"Residual:\n{decomposition.resid.describe()}"),
+        ("Per-Publisher Seasonality and Stationarity", publisher_summary),
+    ])
+    writer.write_table('publisher_stationarity.csv', publisher_summary)
+
+    if own_writer:
+        writer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -5,16 +5,28 @@ import seaborn as sns
 from textblob import TextBlob
 from datetime import datetime
 import os
+from .schema import enforce_schema
+from .state_store import AnalyticsState
+from .instrumentation import track
+from .mentions import MentionIndex
+from .article_store import filter_articles, load_articles
 
 class ArticleSentimentAnalyzer:
-    def __init__(self, data):
+    def __init__(self, data, start=None, end=None, tickers=None):
         """
-        Initialize the ArticleSentimentAnalyzer with data path.
+        Initialize the ArticleSentimentAnalyzer with article data.
         
         Args:
-            data_path (str): Path to the CSV file containing article data
+            data (pd.DataFrame, str or ArticleStore): Articles, a CSV path, or an
+                article store (or its directory) the filters are pushed down to
+            start, end (optional): Inclusive date bounds of the articles analyzed
+            tickers (str or list, optional): Tickers of the articles analyzed
         """
-        self.df = data
+        if isinstance(data, pd.DataFrame):
+            self.df = filter_articles(data, start=start, end=end, tickers=tickers)
+        else:
+            self.df = load_articles(data, start=start, end=end, tickers=tickers)
+        self.mention_index = None
         self.output_dir = 'data/processed'
         os.makedirs(self.output_dir, exist_ok=True)
         
@@ -28,11 +40,56 @@ class ArticleSentimentAnalyzer:
         Returns:
             pd.DataFrame: DataFrame with added sentiment column
         """
-        self.df['sentiment'] = self.df[text_col].astype(str).apply(
-            lambda x: TextBlob(x).sentiment.polarity
-        )
+        with track('ArticleSentimentAnalyzer.compute_sentiment', rows=len(self.df)):
+            self.df['sentiment'] = self.df[text_col].astype(str).apply(
+                lambda x: TextBlob(x).sentiment.polarity
+            )
+        enforce_schema(self.df, columns=['sentiment'])
         return self.df
     
+    def build_mention_index(self, tickers=None, aliases=None, text_col='headline'):
+        """
+        Index the tickers and company names mentioned in each article.
+        
+        Args:
+            tickers (iterable, optional): Ticker symbols, defaults to the stock column
+            aliases (dict, optional): Ticker -> list of company names
+            text_col (str): Column name containing text to index
+            
+        Returns:
+            MentionIndex: The index, also kept as self.mention_index
+        """
+        if tickers is None and 'stock' in self.df.columns:
+            tickers = self.df['stock'].dropna().unique()
+        with track('ArticleSentimentAnalyzer.build_mention_index', rows=len(self.df)):
+            self.mention_index = MentionIndex.build(self.df[text_col], tickers=tickers, aliases=aliases)
+        return self.mention_index
+    
+    def mention_sentiment(self, tickers, start=None, end=None, text_col='headline'):
+        """
+        Sentiment of the articles mentioning any of the tickers within [start, end].
+        
+        Articles are found through the mention index (built on first use), so
+        only they are scored when sentiment has not been computed yet.
+        
+        Args:
+            tickers (str or list): Ticker symbols
+            start, end (optional): Date bounds on the date column, inclusive
+            text_col (str): Column name containing text to analyze
+            
+        Returns:
+            pd.DataFrame: The matching articles with a sentiment column
+        """
+        if self.mention_index is None or self.mention_index.n_docs != len(self.df):
+            self.build_mention_index(text_col=text_col)
+        articles = self.mention_index.select(self.df, tickers, start=start, end=end)
+        if 'sentiment' not in articles.columns:
+            articles = articles.assign(sentiment=articles[text_col].astype(str).apply(
+                lambda x: TextBlob(x).sentiment.polarity
+            ))
+            enforce_schema(articles, columns=['sentiment'])
+        return articles
+    
     def plot_sentiment_distribution(self, save_path=None):
         """
         Plot the distribution of sentiment scores.
@@ -203,6 +260,22 @@ class ArticleSentimentAnalyzer:
         # Save processed data
         self.save_processed_data()
 
+    def run_incremental_analysis(self, state_path='data/state/news_state.pkl'):
+        """
+        Score only the new articles in self.df and fold them into the saved state.
+        
+        Args:
+            state_path (str): Path of the pickled AnalyticsState
+            
+        Returns:
+            pd.Series: Mean sentiment per date and stock over the full history
+        """
+        self.compute_sentiment()
+        state = AnalyticsState.load(state_path)
+        state.update(self.df)
+        state.save(state_path)
+        return state.daily_sentiment()
+
 if __name__ == "__main__":
     # Example usage
     analyzer = ArticleSentimentAnalyzer("data/raw_analyst_ratings.csv")
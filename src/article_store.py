@@ -0,0 +1,263 @@
+"""
+Article Store Module for Financial News Data
+
+Keeps the article history as a Parquet dataset partitioned by month and by
+ticker bucket, in Hive layout:
+
+    store/month=2020-03/bucket=07/part-<id>-0.parquet
+    ...
+
+Tickers are hashed into a fixed number of buckets rather than getting a
+directory each, so thousands of tickers do not turn into millions of small
+files. Within a file rows are sorted by ticker and date, so the Parquet
+row-group statistics locate a ticker or a date range inside a partition.
+
+Loads push every filter down to the dataset scan: a date range prunes
+month directories, a ticker filter prunes bucket directories, both prune
+row groups by their statistics, and only the requested columns are read.
+Dates are stored in UTC, like src.schema.load_article_data produces them.
+"""
+
+import json
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from .schema import ARTICLE_SCHEMA, ARTICLE_TIMESTAMPS, enforce_schema, load_article_data
+from .timestamps import ensure_datetime, utc_bounds
+
+META_FILE = '_store.json'
+PARTITIONING = ds.partitioning(pa.schema([('month', pa.string()), ('bucket', pa.int16())]), flavor='hive')
+
+
+def ticker_buckets(tickers, n_buckets):
+    """Return the bucket of each ticker (stable across runs and processes)"""
+    values = pd.Series(tickers, dtype=object).fillna('').astype(str).to_numpy()
+    return (pd.util.hash_array(values) % np.uint64(n_buckets)).astype(np.int16)
+
+
+def _date_column(df):
+    """Return the first article timestamp column present in df"""
+    for col in ARTICLE_TIMESTAMPS:
+        if col in df.columns:
+            return col
+    raise ValueError(f"Frame has none of the date columns {ARTICLE_TIMESTAMPS}")
+
+
+def _plain_strings(table):
+    """Store categorical and Arrow string columns alike as plain strings, so every file shares one schema"""
+    fields = [pa.field(field.name, pa.string()) if (pa.types.is_dictionary(field.type)
+                                                     or pa.types.is_large_string(field.type)) else field
+              for field in table.schema]
+    return table.cast(pa.schema(fields))
+
+
+def filter_articles(df, start=None, end=None, tickers=None, date_col=None, ticker_col='stock'):
+    """
+    Filter an in-memory article frame the way ArticleStore.load filters the store.
+
+    Args:
+        df (pd.DataFrame): Articles
+        start, end (optional): Inclusive date bounds, naive bounds are taken as UTC
+            and a date-only end covers that whole day
+        tickers (str or list, optional): Tickers to keep
+        date_col (str, optional): Date column, defaults to the first of ARTICLE_TIMESTAMPS
+        ticker_col (str): Ticker column
+
+    Returns:
+        pd.DataFrame: The matching rows
+    """
+    keep = np.ones(len(df), dtype=bool)
+    if start is not None or end is not None:
+        date_col = date_col or _date_column(df)
+        ensure_datetime(df, date_col)
+        dates = df[date_col].dt.tz_convert('UTC') if df[date_col].dt.tz is not None else df[date_col].dt.tz_localize('UTC')
+        start, stop = utc_bounds(start, end)
+        if start is not None:
+            keep &= (dates >= start).to_numpy()
+        if stop is not None:
+            keep &= (dates < stop).to_numpy()
+    if tickers is not None:
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        keep &= df[ticker_col].isin(tickers).to_numpy()
+    return df if keep.all() else df[keep]
+
+
+class ArticleStore:
+    """
+    Parquet article store partitioned by month and ticker bucket.
+
+    Example:
+        store = ArticleStore('data/article_store')
+        store.import_csv('data/raw_analyst_ratings.csv')
+        q1 = store.load(columns=['headline', 'date', 'stock'],
+                        start='2020-01-01', end='2020-03-31', tickers=['AAPL', 'NVDA'])
+    """
+
+    def __init__(self, root='data/article_store', n_buckets=16, date_col=None, ticker_col='stock'):
+        """
+        Args:
+            root (str): Directory of the dataset
+            n_buckets (int): Ticker buckets of a new store
+            date_col (str, optional): Date column of a new store, defaults to the
+                first of ARTICLE_TIMESTAMPS in the first frame written
+            ticker_col (str): Ticker column of a new store
+
+        The settings of an existing store are read from its metadata file.
+        """
+        self.root = Path(root)
+        meta_path = self.root / META_FILE
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            n_buckets, date_col, ticker_col = meta['n_buckets'], meta['date_col'], meta['ticker_col']
+        self.n_buckets = n_buckets
+        self.date_col = date_col
+        self.ticker_col = ticker_col
+
+    def exists(self):
+        """Return True once articles have been written"""
+        return (self.root / META_FILE).exists()
+
+    def _save_meta(self):
+        """Write the store settings next to the data"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta = {'n_buckets': self.n_buckets, 'date_col': self.date_col, 'ticker_col': self.ticker_col}
+        (self.root / META_FILE).write_text(json.dumps(meta, indent=2))
+
+    def write(self, df, row_group_size=64_000):
+        """
+        Append articles to the store.
+
+        Args:
+            df (pd.DataFrame): Articles with a date and a ticker column
+            row_group_size (int): Rows per Parquet row group
+
+        Returns:
+            int: Number of articles written
+        """
+        if self.date_col is None:
+            self.date_col = _date_column(df)
+        if not self.exists():
+            self._save_meta()
+        if not len(df):
+            return 0
+
+        df = df.copy()
+        ensure_datetime(df, self.date_col)
+        dates = df[self.date_col]
+        df[self.date_col] = dates.dt.tz_convert('UTC') if dates.dt.tz is not None else dates.dt.tz_localize('UTC')
+        df[self.ticker_col] = df[self.ticker_col].astype(object).where(df[self.ticker_col].notna(), None)
+        df['month'] = df[self.date_col].dt.strftime('%Y-%m')
+        df['bucket'] = ticker_buckets(df[self.ticker_col], self.n_buckets)
+        df = df.sort_values(['month', 'bucket', self.ticker_col, self.date_col], kind='stable')
+
+        table = _plain_strings(pa.Table.from_pandas(df, preserve_index=False))
+        ds.write_dataset(
+            table, self.root, format='parquet', partitioning=PARTITIONING,
+            basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore', max_rows_per_group=row_group_size,
+        )
+        return len(df)
+
+    def import_csv(self, path, chunksize=500_000, **read_kwargs):
+        """Write an article CSV to the store chunk by chunk"""
+        written = 0
+        for chunk in pd.read_csv(path, chunksize=chunksize, **read_kwargs):
+            written += self.write(chunk)
+        return written
+
+    def dataset(self):
+        """Return the pyarrow dataset of the store"""
+        return ds.dataset(self.root, format='parquet', partitioning=PARTITIONING,
+                          ignore_prefixes=['_', '.'])
+
+    def _filter(self, start=None, end=None, tickers=None):
+        """Build the dataset filter for a date range and tickers"""
+        expression = None
+
+        def both(left, right):
+            return right if left is None else left & right
+
+        # Nanosecond scalars keep the exclusive stop of an inclusive timestamp end exact
+        start, stop = utc_bounds(start, end)
+        date = ds.field(self.date_col)
+        if start is not None:
+            expression = both(expression, (ds.field('month') >= start.strftime('%Y-%m')) & (date >= pa.scalar(start)))
+        if stop is not None:
+            last_month = (stop - pd.Timedelta(1, 'ns')).strftime('%Y-%m')
+            expression = both(expression, (ds.field('month') <= last_month) & (date < pa.scalar(stop, type=pa.timestamp('ns', tz='UTC'))))
+        if tickers is not None:
+            tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+            buckets = sorted(set(ticker_buckets(tickers, self.n_buckets).tolist()))
+            expression = both(expression, ds.field('bucket').isin(buckets) & ds.field(self.ticker_col).isin(tickers))
+        return expression
+
+    def load(self, columns=None, start=None, end=None, tickers=None, schema=None):
+        """
+        Load articles, reading only the partitions, row groups and columns needed.
+
+        Args:
+            columns (list, optional): Columns to return, all stored columns if None
+            start, end (optional): Inclusive date bounds, naive bounds are taken as UTC
+            and a date-only end covers that whole day
+            tickers (str or list, optional): Tickers to keep
+            schema (dict, optional): Column to dtype mapping, defaults to ARTICLE_SCHEMA
+
+        Returns:
+            pd.DataFrame: Articles in date order
+        """
+        if not self.exists():
+            raise FileNotFoundError(f"No article store at {self.root}")
+        dataset = self.dataset()
+        if columns is None:
+            columns = [name for name in dataset.schema.names if name not in ('month', 'bucket')]
+        # The date column is read to restore date order
+        read_columns = list(columns) + ([self.date_col] if self.date_col not in columns else [])
+        table = dataset.to_table(columns=read_columns, filter=self._filter(start, end, tickers))
+
+        df = table.to_pandas()
+        df = df.sort_values(self.date_col, kind='stable').reset_index(drop=True)[list(columns)]
+        enforce_schema(df, schema)
+        return df
+
+    def tickers(self, start=None, end=None):
+        """Article count per ticker in [start, end], reading only the ticker column"""
+        table = self.dataset().to_table(columns=[self.ticker_col], filter=self._filter(start, end))
+        counts = table.column(self.ticker_col).value_counts().to_pandas()
+        result = pd.Series([c['counts'] for c in counts], index=[c['values'] for c in counts], name='count')
+        return result.sort_values(ascending=False, kind='stable')
+
+    def top_tickers(self, n, start=None, end=None):
+        """The n tickers with the most articles in [start, end]"""
+        return self.tickers(start, end).head(n).index.tolist()
+
+
+def load_articles(source='data/processed_data.csv', columns=None, start=None, end=None,
+                  tickers=None, schema=None):
+    """
+    Load articles from an ArticleStore (or its directory) or a CSV file.
+
+    Filters and columns are pushed down to a store; a CSV is read whole and
+    filtered in memory with filter_articles.
+
+    Args:
+        source (str, Path or ArticleStore): Store, store directory or CSV path
+        columns (list, optional): Columns to return (stores only read these)
+        start, end (optional): Inclusive date bounds, naive bounds are taken as UTC
+            and a date-only end covers that whole day
+        tickers (str or list, optional): Tickers to keep
+        schema (dict, optional): Column to dtype mapping, defaults to ARTICLE_SCHEMA
+
+    Returns:
+        pd.DataFrame: The articles
+    """
+    if isinstance(source, ArticleStore) or Path(source).is_dir():
+        store = source if isinstance(source, ArticleStore) else ArticleStore(source)
+        return store.load(columns=columns, start=start, end=end, tickers=tickers, schema=schema)
+    df = load_article_data(source, schema=schema if schema is not None else ARTICLE_SCHEMA)
+    df = filter_articles(df, start=start, end=end, tickers=tickers)
+    return df if columns is None else df[list(columns)]
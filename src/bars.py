@@ -0,0 +1,304 @@
+"""
+Bar Aggregation Module for Tick and Minute Price Data
+
+Resamples ticks or bars into coarser OHLCV bars of any fixed size ('5min',
+'1h', '1D') or into one bar per regular trading session. Rows are sorted by
+ticker and time once, every row gets the start of its bar as an integer
+key, and each bar is a contiguous segment of rows, so all reductions are
+segment operations over the whole array:
+
+    Open   = first value of the segment
+    High   = np.maximum.reduceat
+    Low    = np.minimum.reduceat
+    Close  = last value of the segment
+    Volume = np.add.reduceat
+
+Bar boundaries are computed in exchange local time (src.timestamps
+EXCHANGE_TZ), so hourly and daily bars line up with the trading day across
+daylight saving changes; bar start times keep the timezone of the input.
+Naive timestamps are taken as UTC, as everywhere else in src.
+
+Bars of the same ticker and start from different chunks merge with the
+same reductions, so arbitrarily long histories are aggregated chunk by
+chunk with BarAggregator or resample_chunks in bounded memory.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .timestamps import EXCHANGE_TZ
+
+BAR_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Regular US equity session in exchange local time
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_CLOSE = pd.Timedelta(hours=16)
+
+
+def _local_nanos(times, tz, assume_tz):
+    """Return timestamps as int64 nanoseconds of exchange local wall time"""
+    times = pd.DatetimeIndex(times)
+    if times.tz is None:
+        if assume_tz == tz:
+            return times.asi8
+        times = times.tz_localize(assume_tz)
+    return times.tz_convert(tz).tz_localize(None).asi8
+
+
+def bar_keys(times, rule, tz=EXCHANGE_TZ, offset=None, assume_tz='UTC'):
+    """
+    Return the local start of the bar of every timestamp, as int64 nanoseconds.
+
+    Args:
+        times (array-like): Timestamps
+        rule (str): A fixed bar size such as '5min', '1h' or '1D', or 'session'
+        tz (str): Timezone bar boundaries are aligned in
+        offset (str, optional): Shift of the bar boundaries, e.g. '30min' for
+            hourly bars starting at 9:30
+        assume_tz (str): Timezone of naive timestamps, UTC like PriceStore dates
+
+    Returns:
+        tuple: (bar keys, local nanoseconds of every timestamp)
+    """
+    local = _local_nanos(times, tz, assume_tz)
+    size = pd.Timedelta(days=1) if rule == 'session' else pd.Timedelta(pd.tseries.frequencies.to_offset(rule))
+    size = size.value
+    shift = pd.Timedelta(offset).value if offset is not None else 0
+    return (local - shift) // size * size + shift, local
+
+
+def _segment_bars(starts, open_, high, low, close, volume, ticks):
+    """Reduce the contiguous row segments beginning at starts to one bar each"""
+    ends = np.append(starts[1:], len(close)) - 1
+    return {
+        'Open': open_[starts],
+        'High': np.maximum.reduceat(high, starts),
+        'Low': np.minimum.reduceat(low, starts),
+        'Close': close[ends],
+        'Volume': np.add.reduceat(volume, starts),
+        'ticks': np.add.reduceat(ticks, starts),
+    }
+
+
+def _segment_starts(codes, keys):
+    """Return the first row of every run of equal (ticker, key)"""
+    change = np.ones(len(keys), dtype=bool)
+    change[1:] = (keys[1:] != keys[:-1]) | (codes[1:] != codes[:-1])
+    return np.flatnonzero(change)
+
+
+def resample_bars(df, rule, time_col='Date', ticker_col=None, price_col=None, tz=EXCHANGE_TZ,
+                  offset=None, regular_hours=None, assume_tz='UTC'):
+    """
+    Aggregate ticks or bars into OHLCV bars.
+
+    Args:
+        df (pd.DataFrame): Bars with Open/High/Low/Close/Volume, or ticks with a
+            price_col and an optional Volume column, timed by time_col or a DatetimeIndex
+        rule (str): A fixed bar size such as '5min', '1h' or '1D', or 'session'
+            for one bar per regular trading session
+        time_col (str): Timestamp column, the index is used when absent
+        ticker_col (str, optional): Ticker column of a panel
+        price_col (str, optional): Tick price column, used for all of Open/High/Low/Close
+        tz (str): Timezone bar boundaries are aligned in
+        offset (str, optional): Shift of the bar boundaries (see bar_keys)
+        regular_hours (bool, optional): Keep only 9:30-16:00 local rows, the
+            default for 'session' bars
+        assume_tz (str): Timezone of naive timestamps
+
+    Returns:
+        pd.DataFrame: [ticker_col,] time_col (bar start, in the input's timezone),
+        Open, High, Low, Close, Volume and ticks (rows aggregated), sorted by
+        ticker and time
+
+    Raises:
+        TypeError: If df has neither time_col nor a DatetimeIndex
+    """
+    if time_col in df.columns:
+        times = pd.DatetimeIndex(df[time_col])
+    elif isinstance(df.index, pd.DatetimeIndex):
+        times = df.index
+    else:
+        raise TypeError(f"Bars need a '{time_col}' column or a DatetimeIndex")
+    keys, local = bar_keys(times, rule, tz, offset, assume_tz)
+
+    if regular_hours is None:
+        regular_hours = rule == 'session'
+    rows = np.arange(len(df))
+    if regular_hours:
+        time_of_day = local - local // 86_400_000_000_000 * 86_400_000_000_000
+        rows = rows[(time_of_day >= SESSION_OPEN.value) & (time_of_day < SESSION_CLOSE.value)]
+
+    if ticker_col is not None:
+        codes, tickers = pd.factorize(df[ticker_col].to_numpy()[rows], sort=True)
+    else:
+        codes, tickers = np.zeros(len(rows), dtype=np.int64), None
+
+    # Sort by ticker and time unless the rows already are
+    stamps = times.asi8[rows]
+    if len(rows) > 1 and not ((np.diff(codes) > 0) | ((np.diff(codes) == 0) & (np.diff(stamps) >= 0))).all():
+        order = np.lexsort((stamps, codes))
+        rows, codes, stamps = rows[order], codes[order], stamps[order]
+
+    if price_col is not None:
+        price = df[price_col].to_numpy(dtype=np.float64)[rows]
+        open_ = high = low = close = price
+        volume = (df['Volume'].to_numpy(dtype=np.float64)[rows] if 'Volume' in df.columns
+                  else np.ones(len(rows)))
+    else:
+        open_, high, low, close = (df[col].to_numpy(dtype=np.float64)[rows]
+                                   for col in ('Open', 'High', 'Low', 'Close'))
+        volume = df['Volume'].to_numpy(dtype=np.float64)[rows] if 'Volume' in df.columns else np.zeros(len(rows))
+    ticks = df['ticks'].to_numpy(dtype=np.int64)[rows] if 'ticks' in df.columns else np.ones(len(rows), dtype=np.int64)
+
+    keys = keys[rows]
+    if not len(rows):
+        result = pd.DataFrame({col: pd.Series(dtype=np.float64) for col in BAR_COLUMNS})
+        result.insert(0, time_col, times[:0])
+        result['ticks'] = pd.Series(dtype=np.int64)
+        if ticker_col is not None:
+            result.insert(0, ticker_col, df[ticker_col].iloc[:0])
+        return result
+
+    starts = _segment_starts(codes, keys)
+    bars = _segment_bars(starts, open_, high, low, close, volume, ticks)
+
+    # Bar starts are local wall times; a start skipped by a DST change moves
+    # forward and one repeated by it takes its first (DST) occurrence
+    start_index = pd.DatetimeIndex(keys[starts].astype('datetime64[ns]')).tz_localize(
+        tz, ambiguous=np.ones(len(starts), dtype=bool), nonexistent='shift_forward')
+    start_index = start_index.tz_convert(times.tz) if times.tz is not None else \
+        start_index.tz_convert(assume_tz).tz_localize(None)
+
+    result = pd.DataFrame({time_col: start_index, **bars})
+    if ticker_col is not None:
+        result.insert(0, ticker_col, pd.Categorical.from_codes(codes[starts], categories=tickers))
+    return result
+
+
+def merge_bars(frames, time_col='Date', ticker_col=None):
+    """
+    Merge partial bars of the same ticker and start, e.g. from consecutive chunks.
+
+    Frames must be given in time order; the result is sorted by ticker and time.
+    """
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return pd.DataFrame(columns=([ticker_col] if ticker_col else []) + [time_col] + BAR_COLUMNS + ['ticks'])
+    bars = pd.concat(frames, ignore_index=True)
+    if ticker_col is not None:
+        codes, tickers = pd.factorize(bars[ticker_col].astype(object), sort=True)
+    else:
+        codes, tickers = np.zeros(len(bars), dtype=np.int64), None
+    keys = pd.DatetimeIndex(bars[time_col]).asi8
+    # lexsort is stable, so partial bars of one key stay in chunk order
+    order = np.lexsort((keys, codes))
+    codes, keys = codes[order], keys[order]
+    starts = _segment_starts(codes, keys)
+    merged = _segment_bars(starts, *(bars[col].to_numpy()[order] for col in BAR_COLUMNS + ['ticks']))
+
+    result = pd.DataFrame({time_col: bars[time_col].iloc[order[starts]].reset_index(drop=True), **merged})
+    if ticker_col is not None:
+        result.insert(0, ticker_col, pd.Categorical.from_codes(codes[starts], categories=tickers))
+    return result
+
+
+class BarAggregator:
+    """
+    Aggregates a time-ordered stream of chunks into bars in bounded memory.
+
+    Each chunk is reduced to partial bars; the bars up to the newest start
+    seen are complete and returned, the newest bars are held back and merged
+    with the next chunk.
+
+    Example:
+        aggregator = BarAggregator('5min', ticker_col='ticker')
+        for chunk in pd.read_csv('minute_bars.csv', chunksize=5_000_000, parse_dates=['Date']):
+            write(aggregator.update(chunk))
+        write(aggregator.flush())
+    """
+
+    def __init__(self, rule, time_col='Date', ticker_col=None, **resample_kwargs):
+        """
+        Args:
+            rule (str): Bar size or 'session' (see resample_bars)
+            time_col (str): Timestamp column
+            ticker_col (str, optional): Ticker column of a panel
+            **resample_kwargs: Passed to resample_bars
+        """
+        self.rule = rule
+        self.time_col = time_col
+        self.ticker_col = ticker_col
+        self.resample_kwargs = resample_kwargs
+        self.pending = None
+
+    def update(self, chunk):
+        """Add a chunk and return the bars it completed"""
+        partial = resample_bars(chunk, self.rule, time_col=self.time_col, ticker_col=self.ticker_col,
+                                **self.resample_kwargs)
+        if not len(partial):
+            return partial
+        frames = [partial] if self.pending is None else [self.pending, partial]
+        bars = merge_bars(frames, self.time_col, self.ticker_col)
+        watermark = partial[self.time_col].max()
+        open_bars = (bars[self.time_col] >= watermark).to_numpy()
+        self.pending = bars[open_bars]
+        return bars[~open_bars].reset_index(drop=True)
+
+    def flush(self):
+        """Return the bars still held back"""
+        bars = self.pending
+        self.pending = None
+        if bars is None:
+            return merge_bars([], self.time_col, self.ticker_col)
+        return bars.reset_index(drop=True)
+
+
+def resample_chunks(chunks, rule, **kwargs):
+    """
+    Aggregate time-ordered chunks into bars, yielding completed bars as they appear.
+
+    Args:
+        chunks (iterable): DataFrame chunks in time order
+        rule (str): Bar size or 'session'
+        **kwargs: Passed to BarAggregator
+
+    Yields:
+        pd.DataFrame: Completed bars
+    """
+    aggregator = BarAggregator(rule, **kwargs)
+    for chunk in chunks:
+        bars = aggregator.update(chunk)
+        if len(bars):
+            yield bars
+    bars = aggregator.flush()
+    if len(bars):
+        yield bars
+
+
+def resample_store(store, ticker, rule, start=None, end=None, chunksize=5_000_000, **kwargs):
+    """
+    Aggregate a ticker of a PriceStore into bars, reading chunksize bars at a time.
+
+    Args:
+        store (PriceStore): Store holding minute or tick-sized bars
+        ticker (str): Ticker symbol
+        rule (str): Bar size or 'session'
+        start, end (optional): Inclusive date bounds
+        chunksize (int): Bars materialized at once
+        **kwargs: Passed to BarAggregator
+
+    Returns:
+        pd.DataFrame: Bars indexed by their naive UTC start
+    """
+    fields = [field for field in store.fields(ticker) if field in BAR_COLUMNS]
+    columns = store.columns(ticker, start, end, fields=fields)
+
+    def chunks():
+        for position in range(0, len(columns['Date']), chunksize):
+            window = slice(position, position + chunksize)
+            yield pd.DataFrame({name: np.asarray(values[window]) for name, values in columns.items()})
+
+    frames = list(resample_chunks(chunks(), rule, **kwargs))
+    bars = pd.concat(frames, ignore_index=True) if frames else merge_bars([])
+    return bars.set_index('Date')
@@ -0,0 +1,277 @@
+"""
+Dataset Catalog Module for Financial News and Price Data
+
+Describes every CSV file in a directory without parsing it: the header
+gives the columns, a sample of the first and last rows gives the inferred
+dtypes and the date range, and the row count is estimated from the mean
+line length of the sample (or counted exactly from newlines on request).
+Entries are built lazily on first use and rebuilt when a file changes.
+
+Loads read only the requested columns and, given a date range, filter
+rows chunk by chunk. Files are skipped, and reads stop early, only where
+the date range is exact (the whole file was sampled) or when sample
+pruning is switched on, which trusts the sampled range of a file whose
+ends are in time order.
+"""
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .schema import enforce_schema
+from .timestamps import parse_timestamps, utc_bounds
+
+DATE_COLUMNS = ['Date', 'date']
+
+
+def _count_lines(path, block_size=1 << 20):
+    """Count newlines in a file by scanning raw bytes"""
+    lines = 0
+    with open(path, 'rb') as handle:
+        while block := handle.read(block_size):
+            lines += block.count(b'\n')
+    return lines
+
+
+def _tail_lines(path, n, block_size=1 << 16):
+    """Return the last n lines of a file as bytes, reading backwards from the end"""
+    with open(path, 'rb') as handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        data = b''
+        while position > 0 and data.count(b'\n') <= n:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+    return b'\n'.join(data.rstrip(b'\n').split(b'\n')[-n:])
+
+
+def scan_file(path, sample_rows=1000, exact_rows=False):
+    """
+    Describe a CSV file from its header and a sample of its first and last rows.
+
+    Args:
+        path (str): Path to the CSV file
+        sample_rows (int): Rows read from each end of the file
+        exact_rows (bool): Count rows from newlines instead of estimating them
+
+    Returns:
+        dict: name, path, bytes, mtime, columns, dtypes, rows, rows_exact,
+        date_column, min_date, max_date, date_sorted and dates_exact. The date
+        range and order come from the sample only; dates_exact is True when
+        the sample is the whole file.
+    """
+    path = Path(path)
+    stat = path.stat()
+    with open(path, 'rb') as handle:
+        header = handle.readline()
+        head_bytes = b''.join(handle.readline() for _ in range(sample_rows))
+
+    head = pd.read_csv(io.BytesIO(header + head_bytes))
+    n_head = len(head)
+    if exact_rows or n_head < sample_rows:
+        rows = _count_lines(path) - 1 if n_head == sample_rows else n_head
+        exact = True
+    else:
+        mean_line = len(head_bytes) / n_head
+        rows = int(round((stat.st_size - len(header)) / mean_line))
+        exact = False
+
+    date_column = next((col for col in DATE_COLUMNS if col in head.columns), None)
+    min_date = max_date = None
+    date_sorted = False
+    dates_exact = n_head < sample_rows
+    if date_column is not None and n_head:
+        sample = head[date_column]
+        if n_head == sample_rows:
+            tail = pd.read_csv(io.BytesIO(header + _tail_lines(path, sample_rows)),
+                               usecols=[date_column])
+            sample = pd.concat([sample, tail[date_column]], ignore_index=True)
+        dates = parse_timestamps(sample, errors='coerce')
+        min_date, max_date = dates.min(), dates.max()
+        date_sorted = bool(dates.dropna().is_monotonic_increasing)
+
+    return {
+        'name': path.stem,
+        'path': str(path),
+        'bytes': stat.st_size,
+        'mtime': stat.st_mtime,
+        'columns': head.columns.tolist(),
+        'dtypes': head.dtypes.astype(str).to_dict(),
+        'rows': rows,
+        'rows_exact': exact,
+        'date_column': date_column,
+        'min_date': min_date,
+        'max_date': max_date,
+        'date_sorted': date_sorted,
+        'dates_exact': dates_exact,
+    }
+
+
+class DatasetCatalog:
+    """
+    Lazy catalog of the CSV files in a directory.
+
+    Example:
+        catalog = DatasetCatalog('data')
+        catalog.entries[['rows', 'bytes', 'min_date', 'max_date']]
+        prices = catalog.load_many(['AAPL', 'MSFT'], columns=['Close'], start='2020-01-01')
+    """
+
+    def __init__(self, data_dir="data", sample_rows=1000, exact_rows=False, prune_by_sample=False):
+        """
+        Args:
+            data_dir: Directory containing the CSV files
+            sample_rows: Rows sampled from each end of a file
+            exact_rows: Count rows exactly instead of estimating them
+            prune_by_sample: Skip files and stop reads early from the sampled
+                date range of time-ordered files. A heuristic: rows out of
+                range or out of order between the sampled ends are missed.
+        """
+        self.data_dir = Path(data_dir)
+        self.sample_rows = sample_rows
+        self.exact_rows = exact_rows
+        self.prune_by_sample = prune_by_sample
+        self._entries = {}
+
+    def paths(self):
+        """Return {name: path} for the CSV files currently in the directory"""
+        return {path.stem: path for path in sorted(self.data_dir.glob("*.csv"))}
+
+    def entry(self, name):
+        """Return the catalog entry of one file, scanning it if new or changed"""
+        path = self.paths().get(name)
+        if path is None:
+            raise FileNotFoundError(f"File '{name}' not found in {self.data_dir}")
+        stat = path.stat()
+        cached = self._entries.get(name)
+        if cached is None or (cached['mtime'], cached['bytes']) != (stat.st_mtime, stat.st_size):
+            self._entries[name] = scan_file(path, self.sample_rows, self.exact_rows)
+        return self._entries[name]
+
+    @property
+    def entries(self):
+        """DataFrame with one catalog row per file"""
+        rows = [self.entry(name) for name in self.paths()]
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).set_index('name')
+
+    def _prunable(self, entry):
+        """Return True when a file's date range and order can be trusted to skip rows"""
+        return entry['date_sorted'] and (entry['dates_exact'] or self.prune_by_sample)
+
+    def _overlaps(self, entry, start, stop):
+        """Return False when a time-ordered file lies entirely outside [start, stop)"""
+        if not self._prunable(entry) or entry['min_date'] is None or pd.isna(entry['min_date']):
+            return True
+        if start is not None and entry['max_date'] < start:
+            return False
+        if stop is not None and entry['min_date'] >= stop:
+            return False
+        return True
+
+    def load(self, name, columns=None, start=None, end=None, schema=None, chunksize=250_000):
+        """
+        Load one file, reading only the requested columns and date range.
+
+        The date column is parsed to UTC. With a date range, rows are
+        filtered chunk by chunk. Files with an exact date range, or any
+        time-ordered file with prune_by_sample, are skipped unread when they
+        lie outside it and read only until they pass the end date.
+
+        Args:
+            name: File name without extension
+            columns: Columns to read, all if None
+            start: Optional inclusive lower date bound
+            end: Optional inclusive upper date bound, a date-only end covers that whole day
+            schema: Optional column to dtype mapping (see src.schema)
+            chunksize: Rows per chunk when filtering by date
+
+        Returns:
+            pandas.DataFrame
+        """
+        entry = self.entry(name)
+        date_col = entry['date_column']
+        start, stop = utc_bounds(start, end)
+        filtered = start is not None or stop is not None
+        if filtered and date_col is None:
+            raise ValueError(f"File '{name}' has no date column to filter on")
+
+        columns = entry['columns'] if columns is None else list(columns)
+        usecols = columns + [date_col] if filtered and date_col not in columns else columns
+
+        if not self._overlaps(entry, start, stop):
+            df = pd.DataFrame(columns=columns)
+        elif not filtered:
+            df = pd.read_csv(entry['path'], usecols=usecols)[columns]
+            if date_col in df.columns:
+                df[date_col] = parse_timestamps(df[date_col], errors='coerce')
+        else:
+            parts = []
+            for chunk in pd.read_csv(entry['path'], usecols=usecols, chunksize=chunksize):
+                dates = parse_timestamps(chunk[date_col], errors='coerce')
+                keep = np.ones(len(chunk), dtype=bool)
+                if start is not None:
+                    keep &= (dates >= start).to_numpy()
+                if stop is not None:
+                    keep &= (dates < stop).to_numpy()
+                chunk[date_col] = dates
+                parts.append(chunk.loc[keep, columns])
+                if self._prunable(entry) and stop is not None and dates.iloc[-1] >= stop:
+                    break
+            df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=columns)
+
+        if schema is not None:
+            enforce_schema(df, schema)
+        return df
+
+    def load_many(self, names=None, columns=None, start=None, end=None, schema=None,
+                  max_workers=None):
+        """
+        Load several files on a thread pool into one frame with a categorical ticker column.
+
+        The ticker is the file name, unless a file holds its own ticker column
+        (stacked price files), whose values are kept.
+
+        Args:
+            names: File names without extension, all files if None
+            columns: Columns to read from each file
+            start: Optional inclusive lower date bound
+            end: Optional inclusive upper date bound
+            schema: Optional column to dtype mapping (see src.schema)
+            max_workers: Number of threads
+
+        Returns:
+            pandas.DataFrame
+        """
+        names = list(self.paths()) if names is None else list(names)
+        # Scan up front so worker threads only read
+        for name in names:
+            self.entry(name)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            frames = list(pool.map(
+                lambda name: self.load(name, columns, start, end, schema), names
+            ))
+
+        stacked = [frame['ticker'] for frame in frames if 'ticker' in frame.columns]
+        labels = pd.unique(pd.concat(stacked).dropna()) if stacked else []
+        ticker_dtype = pd.CategoricalDtype(names + sorted(set(labels) - set(names)))
+        for code, frame in enumerate(frames):
+            # Same categories everywhere, so concat keeps the categorical
+            if 'ticker' in frame.columns:
+                tickers = pd.Categorical(frame.pop('ticker'), dtype=ticker_dtype)
+            else:
+                tickers = pd.Categorical.from_codes(np.full(len(frame), code, dtype=np.int16),
+                                                    dtype=ticker_dtype)
+            frame.insert(0, 'ticker', tickers)
+        if not frames:
+            return pd.DataFrame({'ticker': pd.Categorical([], dtype=ticker_dtype)})
+        # Empty frames (files outside the date range) carry object columns
+        return pd.concat([frame for frame in frames if len(frame)] or frames[:1], ignore_index=True)
@@ -1,5 +1,13 @@
+import logging
+import tracemalloc
+
 import pandas as pd 
 import numpy as np
+from .deduplication import duplicate_mask, near_duplicate_mask
+from .outlier import OutlierDetection
+from .timestamps import normalize_timestamps
+
+logger = logging.getLogger(__name__)
 
 
 # data cleamimg class for financial data(stock market data)
@@ -10,6 +18,13 @@ class DataCleaning:
         """
         self.df = df
 
+    def plan(self) -> 'CleaningPlan':
+        """
+        Start a lazy cleaning plan on this DataFrame.
+        Steps are recorded by chaining and run together by CleaningPlan.execute().
+        """
+        return CleaningPlan(self)
+
     def remove_nan_values(self, columns: list) -> pd.DataFrame:
         """
         Remove rows with NaN values in specified columns.
@@ -17,11 +32,24 @@ class DataCleaning:
         self.df = self.df.dropna(subset=columns)
         return self.df
 
-    def remove_duplicates(self) -> pd.DataFrame:
+    def remove_duplicates(self, subset: list = None, method: str = 'exact',
+                          column: str = 'headline', threshold: float = 0.8) -> pd.DataFrame:
         """
         Remove duplicate rows.
+        :param subset: Key columns (e.g. ['headline', 'stock', 'date']). All columns if None.
+        :param method: 'exact' compares full rows, 'hash' compares 64-bit row fingerprints,
+                       'near' drops MinHash near duplicates of the text column.
+        :param column: Text column used by the 'near' method.
+        :param threshold: Minimum estimated Jaccard similarity for the 'near' method.
         """
-        self.df = self.df.drop_duplicates()
+        if method == 'exact':
+            self.df = self.df.drop_duplicates(subset=subset)
+        elif method == 'hash':
+            self.df = self.df[~duplicate_mask(self.df, subset)]
+        elif method == 'near':
+            self.df = self.df[~near_duplicate_mask(self.df[column], threshold)]
+        else:
+            raise ValueError("Method must be 'exact', 'hash' or 'near'")
         return self.df
 
     def reset_index(self) -> pd.DataFrame:
@@ -31,26 +59,340 @@ class DataCleaning:
         self.df = self.df.reset_index(drop=True)
         return self.df
     
-    def convert_to_datetime(self, column: str) -> pd.DataFrame:
+    def convert_to_datetime(self, column: str, tz: str = None) -> pd.DataFrame:
         """
         Convert a specified column to datetime format.
+        :param tz: Target timezone. None keeps naive (UTC) timestamps.
         """
-        self.df[column] = pd.to_datetime(self.df[column], errors='coerce')
+        normalize_timestamps(self.df, column, tz=tz, errors='coerce')
         return self.df
-    def fill_missing_values(self, method: str = 'ffill', value=None) -> pd.DataFrame:
+    def fill_missing_values(self, method: str = 'ffill', value=None, group_col: str = None,
+                            date_col: str = 'Date', limit: int = None) -> pd.DataFrame:
         """
         Fill missing values using specified method or value.
-        :param method: Method to fill missing values ('ffill', 'bfill', 'mean', etc.).
+        :param method: Method to fill missing values ('ffill', 'bfill', 'mean', 'time', etc.).
         :param value: Value to fill missing values with (if method is 'value').
+        :param group_col: Ticker column of a stacked panel. When given, values never
+                          cross from one ticker to another (see fill_panel).
+        :param date_col: Date column used to order each ticker and for 'time' interpolation.
+        :param limit: Maximum number of consecutive missing bars to fill.
         """  
-           
-        if method == 'ffill':
-            self.df = self.df.fillna(method='ffill')
+        if group_col is not None and method in ('ffill', 'bfill', 'mean', 'time'):
+            self.df = fill_panel(self.df, method=method, group_col=group_col,
+                                 date_col=date_col, limit=limit)
+        elif method == 'ffill':
+            self.df = self.df.ffill(limit=limit)
         elif method == 'bfill':
-            self.df = self.df.fillna(method='bfill')
+            self.df = self.df.bfill(limit=limit)
         elif method == 'mean':
-            self.df = self.df.fillna(self.df.mean())
+            self.df = self.df.fillna(self.df.mean(numeric_only=True))
         elif value is not None:
             self.df = self.df.fillna(value)
         else:
-            raise ValueError("Invalid method or value for filling missing values.")
\ No newline at end of file
+            raise ValueError("Invalid method or value for filling missing values.")
+        return self.df
+
+    def align_to_calendar(self, date_col: str = 'Date', group_col: str = 'ticker',
+                          calendar: pd.DatetimeIndex = None) -> pd.DataFrame:
+        """
+        Reindex every ticker onto the exchange sessions between its first and last bar.
+        Missing sessions become rows of NaN, ready for fill_missing_values.
+        """
+        self.df = align_to_calendar(self.df, date_col, group_col, calendar)
+        return self.df
+
+
+def exchange_calendar(start, end, holidays=None) -> pd.DatetimeIndex:
+    """
+    Return trading sessions between start and end: weekdays minus the given holidays.
+    """
+    return pd.bdate_range(start, end, freq='C', holidays=holidays)
+
+
+def align_to_calendar(df: pd.DataFrame, date_col: str = 'Date', group_col: str = 'ticker',
+                      calendar: pd.DatetimeIndex = None) -> pd.DataFrame:
+    """
+    Reindex a stacked multi-ticker frame onto a session calendar.
+
+    Each ticker gets one row per session between its own first and last date,
+    built for all tickers at once from repeated calendar ranges. Rows whose
+    date is not a session are dropped.
+
+    :param calendar: Sessions to align to. Defaults to weekdays over the data's range.
+    :return: New frame sorted by ticker and date.
+    """
+    dates = pd.to_datetime(df[date_col]).dt.normalize()
+    if calendar is None:
+        calendar = exchange_calendar(dates.min(), dates.max())
+    calendar = pd.DatetimeIndex(calendar)
+    if dates.dt.tz is not None and calendar.tz is None:
+        calendar = calendar.tz_localize(dates.dt.tz)
+
+    codes, groups = pd.factorize(df[group_col], sort=True)
+    spans = pd.DataFrame({'code': codes, 'date': dates}).groupby('code')['date'].agg(['min', 'max'])
+    start = calendar.searchsorted(spans['min'].to_numpy())
+    stop = calendar.searchsorted(spans['max'].to_numpy(), side='right')
+
+    # Concatenated session ranges [start, stop) for every ticker
+    lengths = stop - start
+    group_of_row = np.repeat(np.arange(len(spans)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    grid = pd.DataFrame({
+        group_col: groups.take(spans.index.to_numpy()[group_of_row]),
+        date_col: calendar[start[group_of_row] + offsets],
+    })
+
+    aligned = df.drop(columns=[date_col]).assign(**{date_col: dates})
+    return grid.merge(aligned, on=[group_col, date_col], how='left')
+
+
+def _fill_sources(valid: np.ndarray, group_start: np.ndarray, limit: int = None) -> np.ndarray:
+    """
+    For each row, the position of the last valid row of its own group at or
+    before it (-1 if none or further than limit), in one vectorized pass.
+    """
+    positions = np.arange(len(valid))
+    sources = np.maximum.accumulate(np.where(valid, positions, -1))
+    usable = sources >= group_start
+    if limit is not None:
+        usable &= positions - sources <= limit
+    return np.where(usable, sources, -1)
+
+
+def fill_panel(df: pd.DataFrame, columns: list = None, method: str = 'ffill',
+               group_col: str = 'ticker', date_col: str = 'Date', limit: int = None) -> pd.DataFrame:
+    """
+    Fill missing values of a stacked multi-ticker frame without mixing tickers.
+
+    The frame is sorted by ticker and date once; fills are then computed for
+    all tickers together from the group codes (no per-ticker loop).
+
+    :param columns: Columns to fill. If None, uses all numeric columns.
+    :param method: 'ffill', 'bfill', 'mean' (ticker mean) or 'time' (linear in time).
+    :param limit: Maximum number of consecutive missing bars to fill.
+    :return: New frame sorted by ticker and date.
+    """
+    if method not in ('ffill', 'bfill', 'mean', 'time'):
+        raise ValueError("Method must be 'ffill', 'bfill', 'mean' or 'time'")
+
+    codes = pd.factorize(df[group_col], sort=True)[0]
+    times = pd.to_datetime(df[date_col]).to_numpy(dtype='datetime64[ns]').view(np.int64)
+    in_order = np.all((codes[1:] > codes[:-1]) |
+                      ((codes[1:] == codes[:-1]) & (times[1:] >= times[:-1])))
+    if in_order:
+        df = df.reset_index(drop=True)
+    else:
+        order = np.lexsort((times, codes))
+        df = df.iloc[order].reset_index(drop=True)
+        codes, times = codes[order], times[order]
+
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+
+    n = len(df)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    lengths = np.diff(np.r_[starts, n])
+    group_start = np.repeat(starts, lengths)
+    # Group starts of the reversed frame, for backward fills
+    group_start_rev = n - 1 - np.repeat(starts + lengths - 1, lengths)[::-1]
+
+    for col in columns:
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        if valid.all():
+            continue
+
+        if method == 'mean':
+            means = pd.Series(values).groupby(codes).transform('mean').to_numpy()
+            filled = np.where(valid, values, means)
+        else:
+            prev = _fill_sources(valid, group_start, limit if method == 'ffill' else None)
+            nxt = n - 1 - _fill_sources(valid[::-1], group_start_rev,
+                                        limit if method == 'bfill' else None)[::-1]
+            nxt[nxt == n] = -1
+
+            if method == 'ffill':
+                source = prev
+                filled = np.where(source >= 0, values[source], np.nan)
+            elif method == 'bfill':
+                source = nxt
+                filled = np.where(source >= 0, values[source], np.nan)
+            else:
+                both = (prev >= 0) & (nxt >= 0)
+                if limit is not None:
+                    both &= np.arange(n) - prev <= limit
+                t0, t1 = times[prev], times[nxt]
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    weight = np.where(t1 > t0, (times - t0) / (t1 - t0), 0.0)
+                filled = np.where(both, values[prev] + weight * (values[nxt] - values[prev]), np.nan)
+            filled = np.where(valid, values, filled)
+
+        df[col] = filled
+
+    return df
+
+
+class CleaningPlan:
+    """
+    A lazy, chainable sequence of DataCleaning steps.
+
+    Consecutive row filters (NaN dropping, outliers, duplicates) are merged
+    into one boolean row mask and the frame is filtered once; column steps
+    then run on that single filtered frame with copy-on-write enabled, so a
+    multi-step clean does not allocate one full copy per step.
+
+        cleaner = DataCleaning(df)
+        df = (cleaner.plan()
+              .remove_nan_values(['Close'])
+              .remove_outliers('iqr', ['Close', 'Volume'])
+              .remove_duplicates()
+              .fill_missing_values('ffill')
+              .reset_index()
+              .execute())
+    """
+
+    _FILTERS = ('dropna', 'outliers', 'duplicates')
+
+    def __init__(self, cleaner: DataCleaning):
+        """
+        Initialize with the DataCleaning instance whose frame is cleaned.
+        """
+        self.cleaner = cleaner
+        self.steps = []
+        self.report = None
+
+    def _add(self, kind: str, **params) -> 'CleaningPlan':
+        self.steps.append((kind, params))
+        return self
+
+    def remove_nan_values(self, columns: list) -> 'CleaningPlan':
+        """
+        Drop rows with NaN values in specified columns.
+        """
+        return self._add('dropna', columns=columns)
+
+    def remove_outliers(self, method: str = 'iqr', columns: list = None, threshold: float = 3) -> 'CleaningPlan':
+        """
+        Drop outlier rows, with bounds computed on the rows left by earlier filters.
+        """
+        return self._add('outliers', method=method, columns=columns, threshold=threshold)
+
+    def remove_duplicates(self, subset: list = None, method: str = 'exact') -> 'CleaningPlan':
+        """
+        Drop duplicate rows (on key columns if given), keeping the first occurrence.
+        :param method: 'exact' compares full rows, 'hash' compares 64-bit row fingerprints.
+        """
+        if method not in ('exact', 'hash'):
+            raise ValueError("Method must be 'exact' or 'hash'")
+        return self._add('duplicates', subset=subset, method=method)
+
+    def convert_to_datetime(self, column: str, tz: str = None) -> 'CleaningPlan':
+        """
+        Convert a specified column to datetime format.
+        """
+        return self._add('datetime', column=column, tz=tz)
+
+    def fill_missing_values(self, method: str = 'ffill', value=None) -> 'CleaningPlan':
+        """
+        Fill missing values using 'ffill', 'bfill', 'mean' or a constant value.
+        """
+        if method not in ('ffill', 'bfill', 'mean') and value is None:
+            raise ValueError("Invalid method or value for filling missing values.")
+        return self._add('fill', method=method, value=value)
+
+    def reset_index(self) -> 'CleaningPlan':
+        """
+        Reset the index once the plan has run.
+        """
+        return self._add('reset_index')
+
+    def _row_mask(self, df: pd.DataFrame, steps: list) -> np.ndarray:
+        """
+        Evaluate consecutive filter steps into one mask without copying the frame.
+        """
+        keep = np.ones(len(df), dtype=bool)
+        for kind, params in steps:
+            if kind == 'dropna':
+                keep &= df[params['columns']].notna().to_numpy().all(axis=1)
+            elif kind == 'outliers':
+                detector = OutlierDetection(df)
+                columns = detector._resolve_columns(params['columns'])
+                # Bounds from surviving rows only, as the eager steps would see them
+                bounds = OutlierDetection(df.loc[keep, columns]).bounds(
+                    params['method'], columns, params['threshold']
+                )
+                mask, _ = detector.outlier_mask(columns=columns, bounds=bounds)
+                keep &= ~mask.to_numpy().any(axis=1)
+            elif kind == 'duplicates':
+                columns = params['subset'] if params['subset'] is not None else df.columns
+                survivors = df.loc[keep, columns]
+                duplicated = np.zeros(len(df), dtype=bool)
+                if params['method'] == 'hash':
+                    duplicated[keep] = duplicate_mask(survivors)
+                else:
+                    duplicated[keep] = survivors.duplicated().to_numpy()
+                keep &= ~duplicated
+        return keep
+
+    def _apply(self, df: pd.DataFrame, kind: str, params: dict) -> pd.DataFrame:
+        """
+        Run a single column step on the filtered frame.
+        """
+        if kind == 'datetime':
+            normalize_timestamps(df, params['column'], tz=params['tz'], errors='coerce')
+        elif kind == 'fill':
+            method = params['method']
+            if method == 'ffill':
+                df = df.ffill()
+            elif method == 'bfill':
+                df = df.bfill()
+            elif method == 'mean':
+                df = df.fillna(df.mean(numeric_only=True))
+            else:
+                df = df.fillna(params['value'])
+        elif kind == 'reset_index':
+            df = df.reset_index(drop=True)
+        return df
+
+    def execute(self) -> pd.DataFrame:
+        """
+        Run the plan in one pass and store the result on the DataCleaning instance.
+        The peak traced memory of the run is kept in self.report.
+        """
+        df = self.cleaner.df
+        rows_in = len(df)
+
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        with pd.option_context('mode.copy_on_write', True):
+            pending = []
+            for kind, params in self.steps + [('end', {})]:
+                if kind in self._FILTERS:
+                    pending.append((kind, params))
+                    continue
+                if pending:
+                    # Materialize all merged filters with a single take
+                    df = df[self._row_mask(df, pending)]
+                    pending = []
+                if kind != 'end':
+                    df = self._apply(df, kind, params)
+
+        _, peak = tracemalloc.get_traced_memory()
+        if started:
+            tracemalloc.stop()
+
+        self.report = {
+            'steps': [kind for kind, _ in self.steps],
+            'rows_in': rows_in,
+            'rows_out': len(df),
+            'peak_bytes': peak - baseline,
+        }
+        logger.info("Cleaning plan %s: %d -> %d rows, peak %.1f MB",
+                    self.report['steps'], rows_in, len(df), self.report['peak_bytes'] / 1e6)
+
+        self.cleaner.df = df
+        return df
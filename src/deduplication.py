@@ -0,0 +1,184 @@
+"""
+Duplicate Detection Module for Financial News Data
+
+Exact duplicates are found on 64-bit row fingerprints rather than by
+comparing full rows of long text columns. Near duplicates (syndicated
+rewrites of the same headline) are found with MinHash signatures over word
+shingles and locality-sensitive hashing, processed in row chunks so memory
+stays bounded for millions of articles.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.util import hash_array, hash_pandas_object
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+# Mersenne prime for the universal hash family used by MinHash
+_PRIME = np.uint64((1 << 31) - 1)
+_TOKEN = r'\w+'
+
+
+def row_fingerprints(df, columns=None):
+    """
+    Hash each row (or a key subset of columns) to a 64-bit fingerprint.
+
+    Args:
+        df (pd.DataFrame): Frame to fingerprint
+        columns (list, optional): Key columns, e.g. ['headline', 'stock', 'date']
+
+    Returns:
+        np.ndarray: uint64 fingerprint per row
+    """
+    if columns is not None:
+        df = df[columns]
+    return hash_pandas_object(df, index=False).to_numpy()
+
+
+def duplicate_mask(df, columns=None, keep='first'):
+    """
+    Flag duplicate rows by comparing fingerprints instead of full rows.
+
+    Args:
+        df (pd.DataFrame): Frame to check
+        columns (list, optional): Key columns, all columns if None
+        keep (str): 'first', 'last' or False, as in DataFrame.duplicated
+
+    Returns:
+        np.ndarray: Boolean mask of duplicate rows
+    """
+    return pd.Series(row_fingerprints(df, columns)).duplicated(keep=keep).to_numpy()
+
+
+def _shingle_hashes(texts, shingle_size):
+    """Return (row position, shingle hash) pairs for word shingles of each text"""
+    tokens = texts.astype(object).fillna('').str.lower().str.findall(_TOKEN).explode()
+    tokens = tokens.dropna()
+    rows = tokens.index.to_numpy()
+    hashes = hash_array(tokens.to_numpy(dtype=object))
+
+    if shingle_size > 1:
+        # Combine each token hash with its successors in the same row
+        shingle = hashes.copy()
+        valid = np.ones(len(hashes), dtype=bool)
+        for offset in range(1, shingle_size):
+            shifted = np.empty_like(hashes)
+            shifted[:-offset or None] = hashes[offset:]
+            same_row = np.zeros(len(hashes), dtype=bool)
+            same_row[:-offset or None] = rows[offset:] == rows[:-offset or None]
+            shingle = shingle * np.uint64(1099511628211) ^ shifted
+            valid &= same_row
+        # Texts shorter than one shingle keep their first token
+        first = np.r_[True, rows[1:] != rows[:-1]]
+        short = first & ~valid
+        valid |= short
+        hashes = np.where(short, hashes, shingle)[valid]
+        rows = rows[valid]
+
+    return rows, hashes
+
+
+def minhash_signatures(texts, num_perm=64, shingle_size=2, seed=42, chunk_size=20_000):
+    """
+    Compute MinHash signatures of word shingles.
+
+    Args:
+        texts (pd.Series): Headlines or other short texts
+        num_perm (int): Number of hash permutations (signature length)
+        shingle_size (int): Words per shingle
+        seed (int): Seed of the hash family, must match to compare signatures
+        chunk_size (int): Rows processed at a time, bounds peak memory
+
+    Returns:
+        np.ndarray: uint64 array of shape (len(texts), num_perm). Texts without
+        tokens get an all-max signature.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_PRIME), num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_PRIME), num_perm, dtype=np.uint64)
+
+    texts = pd.Series(np.asarray(texts, dtype=object))
+    signatures = np.full((len(texts), num_perm), _PRIME, dtype=np.uint64)
+
+    for start in range(0, len(texts), chunk_size):
+        chunk = texts.iloc[start:start + chunk_size]
+        rows, hashes = _shingle_hashes(chunk, shingle_size)
+        if not len(rows):
+            continue
+        values = (a * (hashes % _PRIME)[:, None] + b) % _PRIME
+        # Rows come out of explode() in order, so each row is one segment
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        signatures[rows[starts]] = np.minimum.reduceat(values, starts, axis=0)
+
+    return signatures
+
+
+def near_duplicate_groups(texts, threshold=0.8, num_perm=64, bands=16, shingle_size=2, seed=42):
+    """
+    Group near-duplicate texts with MinHash and banded LSH.
+
+    Texts sharing a bucket in any band become candidates; a candidate is
+    accepted when the estimated Jaccard similarity of its shingles with the
+    bucket's first member reaches threshold. Accepted pairs are merged into
+    connected groups.
+
+    Args:
+        texts (pd.Series): Headlines or other short texts
+        threshold (float): Minimum estimated Jaccard similarity
+        num_perm (int): Signature length, must be divisible by bands
+        bands (int): Number of LSH bands
+        shingle_size (int): Words per shingle
+        seed (int): Seed of the hash family
+
+    Returns:
+        np.ndarray: For each row, the position of the first row of its group
+    """
+    if num_perm % bands:
+        raise ValueError("num_perm must be divisible by bands")
+
+    signatures = minhash_signatures(texts, num_perm, shingle_size, seed)
+    n = len(signatures)
+    positions = np.arange(n)
+    has_tokens = signatures[:, 0] != _PRIME
+    width = num_perm // bands
+
+    sources, targets = [], []
+    for band in range(bands):
+        # Fold the band's signature columns into one 64-bit bucket key
+        band_keys = np.zeros(n, dtype=np.uint64)
+        for col in range(band * width, (band + 1) * width):
+            band_keys = band_keys * np.uint64(1099511628211) ^ signatures[:, col]
+        members = positions[has_tokens]
+        first = pd.Series(members).groupby(band_keys[has_tokens]).transform('min').to_numpy()
+        linked = members != first
+        sources.append(members[linked])
+        targets.append(first[linked])
+
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    if len(sources):
+        pairs = np.unique(np.stack([sources, targets], axis=1), axis=0)
+        sources, targets = pairs[:, 0], pairs[:, 1]
+        similarity = (signatures[sources] == signatures[targets]).mean(axis=1)
+        accepted = similarity >= threshold
+        sources, targets = sources[accepted], targets[accepted]
+
+    graph = coo_matrix((np.ones(len(sources)), (sources, targets)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    return pd.Series(positions).groupby(labels).transform('min').to_numpy()
+
+
+def near_duplicate_mask(texts, threshold=0.8, **kwargs):
+    """
+    Flag every near duplicate except the first text of its group.
+
+    Args:
+        texts (pd.Series): Headlines or other short texts
+        threshold (float): Minimum estimated Jaccard similarity
+        **kwargs: Passed to near_duplicate_groups
+
+    Returns:
+        np.ndarray: Boolean mask of near-duplicate rows
+    """
+    groups = near_duplicate_groups(texts, threshold, **kwargs)
+    return groups != np.arange(len(groups))
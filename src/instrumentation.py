@@ -0,0 +1,272 @@
+"""
+Instrumentation and Profiling Hooks for the Analysis Pipeline
+
+Per-stage metrics for the analysis functions, written as one JSON object
+per line so they can be loaded with pd.read_json(path, lines=True):
+
+- stage, start time, wall and CPU seconds
+- rows processed and rows per second
+- peak resident set size of the process and, when tracemalloc is on, the
+  peak traced allocation during the stage above what was live at its start
+
+Stages are marked with the @instrument decorator or the track() context
+manager. Until enable_metrics() is called both are pass-through, so the
+decorated functions cost one flag check when metrics are off.
+
+For a look inside a stage, profile() runs a block under cProfile (writing a
+.prof file for snakeviz, tuna or flameprof) or under a sampling profiler
+that writes collapsed stacks (a .folded file for flamegraph.pl or speedscope).
+"""
+
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_state = {'sink': None, 'path': None}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def enable_metrics(path='logs/metrics.jsonl', trace_memory=False):
+    """
+    Start writing stage metrics to a JSON lines file.
+
+    Args:
+        path (str): File to append the records to
+        trace_memory (bool): Start tracemalloc to record allocation peaks,
+            which slows allocation-heavy code down noticeably
+    """
+    disable_metrics()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    _state['sink'] = open(path, 'a')
+    _state['path'] = str(path)
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable_metrics():
+    """Stop writing stage metrics and close the file"""
+    sink = _state['sink']
+    _state['sink'] = _state['path'] = None
+    if sink is not None:
+        sink.close()
+
+
+def metrics_enabled():
+    """Return True if stage metrics are being written"""
+    return _state['sink'] is not None
+
+
+def _peak_rss_mb():
+    """Peak resident set size of the process in MiB, or None where unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 ** 2 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _count_rows(value):
+    """Row count of a DataFrame, Series or array argument, else None"""
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return len(value)
+    return None
+
+
+def _write(record):
+    """Append one record to the metrics file"""
+    line = json.dumps(record, default=str)
+    with _lock:
+        sink = _state['sink']
+        if sink is not None:
+            sink.write(line + '\n')
+            sink.flush()
+
+
+@contextmanager
+def track(stage, rows=None):
+    """
+    Record the metrics of a block of code as one stage.
+
+    The yielded dict can be updated inside the block, e.g. record['rows'] = n
+    once the row count is known. Nested stages are recorded separately.
+
+    Example:
+        with track('load_articles') as record:
+            df = load_article_data(path)
+            record['rows'] = len(df)
+    """
+    record = {'stage': stage, 'rows': rows}
+    if not metrics_enabled():
+        yield record
+        return
+
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        traced_start = tracemalloc.get_traced_memory()[0]
+        # Keep the enclosing stage's peak before resetting it for this one
+        if stack:
+            stack[-1]['peak'] = max(stack[-1]['peak'], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    frame = {'peak': 0}
+    stack.append(frame)
+
+    record['start'] = datetime.now(timezone.utc).isoformat()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield record
+    except BaseException as e:
+        record['error'] = type(e).__name__
+        raise
+    finally:
+        wall = time.perf_counter() - wall_start
+        stack.pop()
+        record['wall_s'] = round(wall, 6)
+        record['cpu_s'] = round(time.process_time() - cpu_start, 6)
+        rows = record.get('rows')
+        record['rows_per_s'] = round(rows / wall, 1) if rows is not None and wall > 0 else None
+        record['peak_rss_mb'] = _peak_rss_mb()
+        if tracing and tracemalloc.is_tracing():
+            peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+            record['tracemalloc_peak_mb'] = round((peak - traced_start) / 1024 ** 2, 3)
+            if stack:
+                stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+        _write(record)
+
+
+def instrument(func=None, *, stage=None):
+    """
+    Decorator recording each call of a function as a stage (see track()).
+
+    Rows are taken from the first DataFrame, Series or array argument.
+
+    Example:
+        @instrument
+        def analyze_publisher_activity(df): ...
+    """
+    if func is None:
+        return functools.partial(instrument, stage=stage)
+    name = stage or f'{func.__module__}.{func.__qualname__}'
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not metrics_enabled():
+            return func(*args, **kwargs)
+        rows = next((n for n in map(_count_rows, list(args) + list(kwargs.values())) if n is not None), None)
+        with track(name, rows=rows):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class SamplingProfiler:
+    """
+    Samples the call stack of one thread at a fixed interval.
+
+    The samples are kept as collapsed stacks ('outer;inner;leaf count' per
+    line), the input format of flamegraph.pl and speedscope. Sampling from a
+    second thread needs no tracing hooks, so the profiled code runs at close
+    to full speed; long C calls that hold the GIL are attributed to the
+    Python frame that made them.
+    """
+
+    def __init__(self, interval=0.005, thread_id=None):
+        """
+        Args:
+            interval (float): Seconds between samples
+            thread_id (int, optional): Thread to sample, defaults to the calling thread
+        """
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        """Sampling loop run on the background thread"""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.samples[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        """Start sampling"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self
+
+    def write(self, path):
+        """Write the collapsed stacks to path"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f'{stack} {count}\n')
+
+
+@contextmanager
+def profile(path, mode='cprofile', interval=0.005):
+    """
+    Profile a block of code and write flamegraph-ready output.
+
+    Args:
+        path (str): Output path without extension; '.prof' (cProfile stats)
+            or '.folded' (collapsed stacks) is appended
+        mode (str): 'cprofile' for deterministic profiling of every call, or
+            'sample' for the low-overhead SamplingProfiler
+        interval (float): Seconds between samples in 'sample' mode
+
+    Yields:
+        str: The file that will be written
+    """
+    if mode == 'cprofile':
+        output = f'{path}.prof'
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield output
+        finally:
+            profiler.disable()
+            Path(output).parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(output)
+    elif mode == 'sample':
+        output = f'{path}.folded'
+        profiler = SamplingProfiler(interval).start()
+        try:
+            yield output
+        finally:
+            profiler.stop().write(output)
+    else:
+        raise ValueError("mode must be 'cprofile' or 'sample'")
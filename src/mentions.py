@@ -0,0 +1,361 @@
+"""
+Ticker and Entity Mention Index for Financial News Data
+
+Maps ticker symbols to the rows of the articles that mention them, by
+symbol ("NVDA", "$NVDA") or by company-name alias ("Nvidia", "Advanced
+Micro Devices"), so questions like "all headlines mentioning NVDA in the
+last 30 days" read one posting list instead of scanning every headline.
+
+The index is built in one Aho-Corasick pass over the tokens of all
+headlines. Texts are split into tokens with Arrow kernels and tokens that
+occur in no pattern collapse into one "other" symbol, which always returns
+the automaton to its root; only the runs of pattern tokens are scanned,
+all runs at once, one token position per step. Symbols match
+case-sensitively (so the word "on" is not the ticker ON), aliases match
+case-insensitively, and patterns match whole tokens only.
+
+Posting lists are the sorted row ids of each ticker, stored as
+delta-encoded varints (one to five bytes per row, usually one or two for
+frequently mentioned tickers) in one byte array.
+"""
+
+import os
+import pickle
+import re
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Token separators for texts and patterns; $ is kept to mark cashtags
+TOKEN_SPLIT = r"[^A-Za-z0-9$&]+"
+
+
+def tokenize(text):
+    """Split a pattern into tokens, the way texts are split in MentionIndex.build"""
+    return [token for token in re.split(TOKEN_SPLIT, text) if token]
+
+
+def encode_varints(values):
+    """Encode non-negative integers below 2**35 as little-endian base-128 varints"""
+    values = np.asarray(values, dtype=np.uint64)
+    n_bytes = 1 + sum((values >> np.uint64(7 * k)) > 0 for k in range(1, 5)).astype(np.int64)
+    owner = np.repeat(np.arange(len(values)), n_bytes)
+    position = np.arange(len(owner)) - np.repeat(np.cumsum(n_bytes) - n_bytes, n_bytes)
+    data = (values[owner] >> (np.uint64(7) * position.astype(np.uint64))) & np.uint64(0x7F)
+    more = position < n_bytes[owner] - 1
+    return (data | (more.astype(np.uint64) << np.uint64(7))).astype(np.uint8)
+
+
+def decode_varints(data):
+    """Decode a byte array of varints written by encode_varints"""
+    data = np.asarray(data, dtype=np.uint8)
+    if not len(data):
+        return np.zeros(0, dtype=np.int64)
+    last = data < 0x80
+    starts = np.concatenate([[0], np.flatnonzero(last)[:-1] + 1])
+    position = np.arange(len(data)) - np.repeat(starts, np.diff(np.append(starts, len(data))))
+    parts = (data & 0x7F).astype(np.int64) << (7 * position)
+    return np.add.reduceat(parts, starts)
+
+
+class MentionIndex:
+    """
+    Inverted index from ticker symbols to the rows of the articles mentioning them.
+
+    Example:
+        index = MentionIndex.build(df['headline'], tickers=['NVDA', 'AMD'],
+                                   aliases={'NVDA': ['Nvidia'], 'AMD': ['Advanced Micro Devices']})
+        index.rows('NVDA')
+        index.select(df, 'NVDA', start=pd.Timestamp.now() - pd.Timedelta(days=30))
+    """
+
+    def __init__(self, tickers, indptr, postings, n_docs):
+        """
+        Args:
+            tickers (list): Indexed ticker symbols
+            indptr (np.ndarray): Start of each ticker's posting list in postings, plus the end
+            postings (np.ndarray): Delta-encoded varint row ids (uint8)
+            n_docs (int): Number of indexed articles
+        """
+        self.tickers = list(tickers)
+        self.indptr = indptr
+        self.postings = postings
+        self.n_docs = n_docs
+        self._positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+    @classmethod
+    def build(cls, texts, tickers=None, aliases=None, min_ticker_length=2):
+        """
+        Index the ticker and alias mentions of every text.
+
+        Args:
+            texts (pd.Series): Article texts; rows are numbered by position
+            tickers (iterable, optional): Ticker symbols, matched as tokens and cashtags
+            aliases (dict, optional): Ticker -> list of company names
+            min_ticker_length (int): Shorter symbols (e.g. 'A') are only matched as cashtags
+
+        Returns:
+            MentionIndex: The index
+        """
+        aliases = aliases or {}
+        tickers = sorted(set(() if tickers is None else tickers) | set(aliases))
+        patterns = []
+        for entity, ticker in enumerate(tickers):
+            # Tokenized like the texts, so '$BRK.B' is the tokens '$BRK', 'B'
+            patterns.append((tokenize(f'${ticker}'), entity))
+            if len(ticker) >= min_ticker_length:
+                patterns.append((tokenize(ticker), entity))
+            for alias in aliases.get(ticker, ()):
+                patterns.append(([token.lower() for token in tokenize(alias)], entity))
+
+        automaton = _Automaton(patterns)
+        docs, entities = automaton.scan(_token_symbols(texts, automaton))
+        return cls.from_pairs(tickers, docs, entities, len(texts))
+
+    @classmethod
+    def from_pairs(cls, tickers, docs, entities, n_docs):
+        """Build the posting lists from (row, ticker position) mention pairs"""
+        keys = np.unique(np.asarray(entities, dtype=np.int64) * max(n_docs, 1) + np.asarray(docs, dtype=np.int64))
+        entities, docs = np.divmod(keys, max(n_docs, 1))
+        counts = np.bincount(entities, minlength=len(tickers))
+        # First row of each list is stored as is, later rows as the gap to the previous row
+        gaps = np.diff(docs, prepend=0)
+        list_starts = np.cumsum(counts) - counts
+        gaps[list_starts[counts > 0]] = docs[list_starts[counts > 0]]
+        encoded = encode_varints(gaps)
+
+        # Byte offset of each list: bytes up to its first value
+        value_bytes = 1 + sum((gaps >> (7 * k)) > 0 for k in range(1, 5))
+        byte_ends = np.concatenate([[0], np.cumsum(value_bytes)])
+        indptr = byte_ends[np.concatenate([list_starts, [len(gaps)]])]
+        return cls(tickers, indptr.astype(np.int64), encoded, n_docs)
+
+    def __contains__(self, ticker):
+        return ticker in self._positions
+
+    def rows(self, ticker):
+        """Return the sorted row ids of the articles mentioning a ticker"""
+        position = self._positions.get(ticker)
+        if position is None:
+            return np.zeros(0, dtype=np.int64)
+        data = self.postings[self.indptr[position]:self.indptr[position + 1]]
+        return np.cumsum(decode_varints(data))
+
+    def rows_any(self, tickers):
+        """Return the sorted row ids of the articles mentioning any of the tickers"""
+        if isinstance(tickers, str):
+            return self.rows(tickers)
+        return np.unique(np.concatenate([self.rows(ticker) for ticker in tickers] or [np.zeros(0, dtype=np.int64)]))
+
+    def counts(self):
+        """Number of articles mentioning each ticker"""
+        counts = [len(self.rows(ticker)) for ticker in self.tickers]
+        return pd.Series(counts, index=self.tickers, name='articles').sort_values(ascending=False)
+
+    def pairs(self):
+        """All mentions as a frame of row and ticker, e.g. to join sentiment to every ticker named"""
+        rows = [self.rows(ticker) for ticker in self.tickers]
+        return pd.DataFrame({
+            'row': np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64),
+            'ticker': pd.Categorical.from_codes(
+                np.repeat(np.arange(len(self.tickers)), [len(r) for r in rows]), categories=self.tickers),
+        })
+
+    def select(self, df, tickers, start=None, end=None, date_col='date'):
+        """
+        Return the articles of df mentioning any of the tickers within [start, end].
+
+        Args:
+            df (pd.DataFrame): The frame the index was built on, in the same row order
+            tickers (str or list): Ticker symbols
+            start, end (optional): Date bounds on date_col, inclusive
+            date_col (str): Date column used by the bounds
+
+        Returns:
+            pd.DataFrame: The matching rows of df
+        """
+        if len(df) != self.n_docs:
+            raise ValueError(f"Index covers {self.n_docs} rows, frame has {len(df)}")
+        selected = df.iloc[self.rows_any(tickers)]
+        if start is not None or end is not None:
+            dates = selected[date_col]
+            keep = np.ones(len(selected), dtype=bool)
+            if start is not None:
+                keep &= (dates >= _as_bound(start, dates)).to_numpy()
+            if end is not None:
+                keep &= (dates <= _as_bound(end, dates)).to_numpy()
+            selected = selected[keep]
+        return selected
+
+    def nbytes(self):
+        """Size of the posting lists in bytes"""
+        return self.postings.nbytes + self.indptr.nbytes
+
+    def save(self, path):
+        """Pickle the index, replacing the file atomically"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(path.suffix + '.tmp')
+        with open(temp, 'wb') as handle:
+            pickle.dump(self, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a pickled index"""
+        with open(path, 'rb') as handle:
+            return pickle.load(handle)
+
+
+def _as_bound(bound, dates):
+    """Convert a date bound to the timezone of the date column"""
+    bound = pd.Timestamp(bound)
+    tz = getattr(dates.dt, 'tz', None)
+    if tz is not None and bound.tzinfo is None:
+        return bound.tz_localize(tz)
+    if tz is None and bound.tzinfo is not None:
+        return bound.tz_convert(None)
+    return bound
+
+
+def _token_symbols(texts, automaton):
+    """
+    Split every text into tokens and map them to automaton symbols.
+
+    Returns:
+        tuple: (symbol per token, row per token), tokens in text order
+    """
+    strings = pa.array(pd.Series(texts).astype(object), type=pa.large_string(), from_pandas=True)
+    tokens = pc.split_pattern_regex(pc.fill_null(strings, ''), TOKEN_SPLIT)
+    lengths = pc.list_value_length(tokens).to_numpy(zero_copy_only=False)
+    flat = pc.list_flatten(tokens)
+
+    # Exact match first (symbols, cashtags), then lowercased (aliases)
+    exact = pc.index_in(flat, value_set=automaton.exact_tokens)
+    lower = pc.index_in(pc.utf8_lower(flat), value_set=automaton.lower_tokens)
+    # Unmatched tokens index the trailing 0 ("other") of the symbol tables
+    exact = pc.fill_null(exact, len(automaton.exact_tokens)).to_numpy(zero_copy_only=False)
+    lower = pc.fill_null(lower, len(automaton.lower_tokens)).to_numpy(zero_copy_only=False)
+    exact = np.append(automaton.exact_symbols, 0)[exact]
+    symbols = np.where(exact > 0, exact, np.append(automaton.lower_symbols, 0)[lower])
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    return symbols, rows
+
+
+class _Automaton:
+    """Aho-Corasick automaton over token symbols, scanning many token runs at once"""
+
+    def __init__(self, patterns):
+        # Symbol 0 is every token in no pattern; exact tokens contain an uppercase
+        # letter or a $, the others are matched lowercased
+        vocabulary = sorted({token for tokens, _ in patterns for token in tokens})
+        self.n_symbols = len(vocabulary) + 1
+        symbol_of = {token: i + 1 for i, token in enumerate(vocabulary)}
+        is_exact = np.array([token != token.lower() or '$' in token for token in vocabulary], dtype=bool)
+        all_symbols = np.arange(1, self.n_symbols)
+        self.exact_tokens = pa.array([t for t, e in zip(vocabulary, is_exact) if e], type=pa.large_string())
+        self.exact_symbols = all_symbols[is_exact]
+        self.lower_tokens = pa.array([t for t, e in zip(vocabulary, is_exact) if not e], type=pa.large_string())
+        self.lower_symbols = all_symbols[~is_exact]
+
+        # Trie
+        children = [{}]
+        outputs = [set()]
+        for tokens, entity in patterns:
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                symbol = symbol_of[token]
+                if symbol not in children[state]:
+                    children[state][symbol] = len(children)
+                    children.append({})
+                    outputs.append(set())
+                state = children[state][symbol]
+            outputs[state].add(entity)
+
+        # Failure links in breadth-first order, outputs inherited along them
+        fail = np.zeros(len(children), dtype=np.int64)
+        queue = deque(children[0].values())
+        while queue:
+            state = queue.popleft()
+            for symbol, child in children[state].items():
+                queue.append(child)
+                if state:
+                    link = fail[state]
+                    while link and symbol not in children[link]:
+                        link = fail[link]
+                    fail[child] = children[link].get(symbol, 0)
+                outputs[child] |= outputs[fail[child]]
+        self.fail = fail
+
+        # Goto edges as sorted parent * n_symbols + symbol keys
+        edges = sorted((parent * self.n_symbols + symbol, child)
+                       for parent, table in enumerate(children) for symbol, child in table.items())
+        self.edge_keys = np.array([key for key, _ in edges], dtype=np.int64)
+        self.edge_targets = np.array([child for _, child in edges], dtype=np.int64)
+        self.out_ptr = np.concatenate([[0], np.cumsum([len(out) for out in outputs])]).astype(np.int64)
+        self.out_entities = np.array([entity for out in outputs for entity in sorted(out)], dtype=np.int64)
+
+    def _goto(self, states, symbols):
+        """Follow goto edges, falling back along failure links, for many states at once"""
+        result = np.zeros(len(states), dtype=np.int64)
+        pending = np.arange(len(states))
+        states = states.copy()
+        while len(pending):
+            keys = states[pending] * self.n_symbols + symbols[pending]
+            found = np.minimum(np.searchsorted(self.edge_keys, keys), max(len(self.edge_keys) - 1, 0))
+            hit = (self.edge_keys[found] == keys) if len(self.edge_keys) else np.zeros(len(keys), dtype=bool)
+            result[pending[hit]] = self.edge_targets[found[hit]]
+            pending = pending[~hit]
+            # At the root an unmatched symbol stays at the root
+            pending = pending[states[pending] != 0]
+            states[pending] = self.fail[states[pending]]
+        return result
+
+    def scan(self, token_symbols):
+        """
+        Run the automaton over the tokens of all texts.
+
+        Args:
+            token_symbols (tuple): (symbol per token, row per token) in text order
+
+        Returns:
+            tuple: (rows, entities) of every match
+        """
+        symbols, rows = token_symbols
+        # Keep pattern tokens only; a run restarts where a row or an "other" token intervenes
+        kept = np.flatnonzero(symbols > 0)
+        symbols, rows = symbols[kept], rows[kept]
+        if not len(kept):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        run_start = np.ones(len(kept), dtype=bool)
+        run_start[1:] = (np.diff(kept) != 1) | (np.diff(rows) != 0)
+        run_id = np.cumsum(run_start) - 1
+        starts = np.flatnonzero(run_start)
+        position = np.arange(len(kept)) - starts[run_id]
+
+        # All runs advance together, one token position per step
+        order = np.argsort(position, kind='stable')
+        step_bounds = np.searchsorted(position[order], np.arange(position.max() + 2))
+        states = np.zeros(len(starts), dtype=np.int64)
+        match_rows, match_entities = [], []
+        for step in range(len(step_bounds) - 1):
+            tokens = order[step_bounds[step]:step_bounds[step + 1]]
+            runs = run_id[tokens]
+            states[runs] = self._goto(states[runs], symbols[tokens])
+            n_out = np.diff(self.out_ptr)[states[runs]]
+            if n_out.any():
+                emitting = n_out > 0
+                first = self.out_ptr[states[runs][emitting]]
+                counts = n_out[emitting]
+                offsets = np.repeat(first - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+                match_entities.append(self.out_entities[offsets])
+                match_rows.append(np.repeat(rows[tokens][emitting], counts))
+        if not match_rows:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(match_rows), np.concatenate(match_entities)
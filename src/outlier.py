@@ -1,16 +1,118 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import zscore
 
 
 class OutlierDetection:
     """
     A class for detecting and removing outliers in a DataFrame using IQR and Z-score methods.
+
+    Bounds for all columns are computed at once on a 2-D array and compared
+    in a single broadcast, giving a boolean mask of shape (rows x columns).
     """
 
     def __init__(self, df: pd.DataFrame):
         self.df = df
 
+    def _resolve_columns(self, columns=None):
+        """Return the given columns, or all numeric columns if None."""
+        if columns is None:
+            columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        return list(columns)
+
+    def _values(self, columns):
+        """Return the columns as one float64 array with NaN for missing values."""
+        return self.df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def bounds(self, method='iqr', columns=None, threshold=3, factor=1.5):
+        """
+        Compute lower and upper outlier bounds for every column in one pass.
+
+        :param method: 'iqr' or 'z_score'
+        :param columns: List of columns to check. If None, uses all numeric columns.
+        :param threshold: Z-score threshold if using z_score method.
+        :param factor: IQR multiplier if using iqr method.
+        :return: DataFrame indexed by column with lower_bound and upper_bound.
+        """
+        columns = self._resolve_columns(columns)
+        return self._bounds(self._values(columns), columns, method, threshold, factor)
+
+    def _bounds(self, values, columns, method, threshold, factor):
+        """Compute the bounds DataFrame from a 2-D values array."""
+        with np.errstate(invalid='ignore'):
+            if method == 'iqr':
+                q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+                iqr = q3 - q1
+                lower, upper = q1 - factor * iqr, q3 + factor * iqr
+            elif method == 'z_score':
+                # Population std (ddof=0), as scipy.stats.zscore
+                mean = np.nanmean(values, axis=0)
+                std = np.nanstd(values, axis=0)
+                lower, upper = mean - threshold * std, mean + threshold * std
+            else:
+                raise ValueError("Method must be 'iqr' or 'z_score'")
+
+        return pd.DataFrame({'lower_bound': lower, 'upper_bound': upper}, index=columns)
+
+    @staticmethod
+    def bounds_from_summaries(summaries, method='iqr', threshold=3, factor=1.5):
+        """
+        Compute outlier bounds from streaming summaries instead of in-memory data.
+
+        Quartiles come from the KLL sketch, so IQR bounds carry its rank error
+        (see src.sketches); z-score bounds use exact running mean and std.
+
+        :param summaries: Dict of column name to src.sketches.StreamingSummary,
+                          e.g. from summarize_chunks() merged across workers.
+        :param method: 'iqr' or 'z_score'
+        :param threshold: Z-score threshold if using z_score method.
+        :param factor: IQR multiplier if using iqr method.
+        :return: DataFrame indexed by column with lower_bound and upper_bound.
+        """
+        columns = list(summaries)
+        if method == 'iqr':
+            q1, q3 = np.array([summaries[col].quantile([0.25, 0.75]) for col in columns]).T
+            lower, upper = q1 - factor * (q3 - q1), q3 + factor * (q3 - q1)
+        elif method == 'z_score':
+            mean = np.array([summaries[col].stats.mean for col in columns])
+            std = np.array([summaries[col].stats.std(ddof=0) for col in columns])
+            lower, upper = mean - threshold * std, mean + threshold * std
+        else:
+            raise ValueError("Method must be 'iqr' or 'z_score'")
+
+        return pd.DataFrame({'lower_bound': lower, 'upper_bound': upper}, index=columns)
+
+    def outlier_mask(self, method='iqr', columns=None, threshold=3, factor=1.5, bounds=None):
+        """
+        Flag outliers for all columns at once.
+
+        :param method: 'iqr' or 'z_score'
+        :param columns: List of columns to check. If None, uses all numeric columns.
+        :param threshold: Z-score threshold if using z_score method.
+        :param factor: IQR multiplier if using iqr method.
+        :param bounds: Precomputed bounds (e.g. from bounds_from_summaries) to apply
+                       to this frame instead of computing them from it.
+        :return: Tuple of (boolean mask DataFrame of rows x columns, summary DataFrame
+                 with bounds and outlier counts per column).
+        """
+        if bounds is not None:
+            columns = bounds.index.tolist() if columns is None else list(columns)
+            values = self._values(columns)
+            summary = bounds.loc[columns].copy()
+        else:
+            columns = self._resolve_columns(columns)
+            values = self._values(columns)
+            summary = self._bounds(values, columns, method, threshold, factor)
+
+        lower = summary['lower_bound'].to_numpy()
+        upper = summary['upper_bound'].to_numpy()
+
+        # NaN compares False on both sides, so missing values are never flagged
+        mask = (values < lower) | (values > upper)
+
+        mask = pd.DataFrame(mask, index=self.df.index, columns=columns)
+        summary['outliers'] = mask.sum().to_numpy()
+        return mask, summary
+
     def iqr_outliers(self, columns=None):
         """
         Detect outliers using the Interquartile Range (IQR) method.
@@ -18,19 +120,8 @@ class OutlierDetection:
         :param columns: List of columns to check. If None, uses all numeric columns.
         :return: Dictionary of DataFrames containing outliers per column.
         """
-        if columns is None:
-            columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
-
-        outliers = {}
-        for col in columns:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers[col] = self.df[(self.df[col] < lower_bound) | (self.df[col] > upper_bound)]
-
-        return outliers
+        mask, _ = self.outlier_mask('iqr', columns)
+        return {col: self.df[mask[col].to_numpy()] for col in mask.columns}
 
     def z_score_outliers(self, columns=None, threshold=3):
         """
@@ -40,15 +131,8 @@ class OutlierDetection:
         :param threshold: Z-score threshold for flagging outliers.
         :return: Dictionary of DataFrames containing outliers per column.
         """
-        if columns is None:
-            columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
-
-        outliers = {}
-        for col in columns:
-            z_scores = np.abs(zscore(self.df[col], nan_policy='omit'))
-            outliers[col] = self.df[z_scores > threshold]
-
-        return outliers
+        mask, _ = self.outlier_mask('z_score', columns, threshold)
+        return {col: self.df[mask[col].to_numpy()] for col in mask.columns}
 
     def remove_outliers(self, method='iqr', columns=None, threshold=3):
         """
@@ -59,14 +143,139 @@ class OutlierDetection:
         :param threshold: Z-score threshold if using z_score method.
         :return: Cleaned DataFrame without outliers.
         """
+        mask, _ = self.outlier_mask(method, columns, threshold)
+
+        # One combined row filter instead of one index lookup per column
+        self.df = self.df[~mask.to_numpy().any(axis=1)]
+
+        return self.df
+
+    def grouped_mask(self, group_col='ticker', method='iqr', columns=None, threshold=3, factor=1.5):
+        """
+        Flag outliers against per-group bounds, e.g. one set of bounds per ticker.
+
+        :param group_col: Column holding the group labels.
+        :param method: 'iqr' or 'z_score'
+        :param columns: List of columns to check. If None, uses all numeric columns.
+        :param threshold: Z-score threshold if using z_score method.
+        :param factor: IQR multiplier if using iqr method.
+        :return: Tuple of (boolean mask DataFrame of rows x columns, DataFrame of
+                 outlier counts per group and column).
+        """
+        columns = self._resolve_columns(columns)
+        codes, groups = pd.factorize(self.df[group_col])
+        valid = codes >= 0
+        values = self._values(columns)
+        grouped = pd.DataFrame(values[valid], columns=columns).groupby(codes[valid])
+
         if method == 'iqr':
-            outliers = self.iqr_outliers(columns)
+            q1 = grouped.quantile(0.25).reindex(range(len(groups))).to_numpy()
+            q3 = grouped.quantile(0.75).reindex(range(len(groups))).to_numpy()
+            lower, upper = q1 - factor * (q3 - q1), q3 + factor * (q3 - q1)
         elif method == 'z_score':
-            outliers = self.z_score_outliers(columns, threshold)
+            mean = grouped.mean().reindex(range(len(groups))).to_numpy()
+            std = grouped.std(ddof=0).reindex(range(len(groups))).to_numpy()
+            lower, upper = mean - threshold * std, mean + threshold * std
         else:
             raise ValueError("Method must be 'iqr' or 'z_score'")
 
-        for col in outliers:
-            self.df = self.df[~self.df.index.isin(outliers[col].index)]
+        # Bounds are indexed by group code; rows without a group (code -1)
+        # pick up the trailing NaN row and are never flagged
+        nan_row = np.full((1, len(columns)), np.nan)
+        lower = np.vstack([lower, nan_row])[codes]
+        upper = np.vstack([upper, nan_row])[codes]
 
-        return self.df
+        mask = pd.DataFrame((values < lower) | (values > upper), index=self.df.index, columns=columns)
+        summary = mask.groupby(self.df[group_col].to_numpy(), sort=False).sum()
+        return mask, summary
+
+    def rolling_mask(self, method='mad', columns=None, window=390, threshold=3.5, factor=1.5,
+                     group_col=None, min_periods=None):
+        """
+        Flag outliers against trailing-window bounds, so drifting prices are judged locally.
+
+        Rolling medians and quantiles use pandas' sliding-window order statistics
+        (a skiplist updated one observation at a time), never a full sort per window.
+        Rows must be in time order within each group.
+
+        :param method: 'mad' for rolling median / MAD robust z-scores, or 'iqr' for rolling quartiles.
+        :param columns: List of columns to check. If None, uses all numeric columns.
+        :param window: Number of bars in the trailing window.
+        :param threshold: Robust z-score threshold if using mad method.
+        :param factor: IQR multiplier if using iqr method.
+        :param group_col: Optional column (e.g. 'ticker') to roll within each group.
+        :param min_periods: Minimum bars before a row is judged. Defaults to window.
+        :return: Tuple of (boolean mask DataFrame of rows x columns, summary DataFrame
+                 with outlier counts per column).
+        """
+        columns = self._resolve_columns(columns)
+        values = self._values(columns)
+        codes = None if group_col is None else pd.factorize(self.df[group_col])[0]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if method == 'mad':
+                median = _rolling(values, codes, window, min_periods, lambda r: r.median())
+                # MAD of each window approximated by the rolling median of the
+                # deviations from each bar's own trailing median
+                mad = _rolling(np.abs(values - median), codes, window, min_periods, lambda r: r.median())
+                # A flat window has no spread, so nothing in it is flagged
+                mad[mad == 0] = np.nan
+                robust_z = 0.6745 * np.abs(values - median) / mad
+                mask = robust_z > threshold
+            elif method == 'iqr':
+                q1 = _rolling(values, codes, window, min_periods, lambda r: r.quantile(0.25))
+                q3 = _rolling(values, codes, window, min_periods, lambda r: r.quantile(0.75))
+                iqr = q3 - q1
+                mask = (values < q1 - factor * iqr) | (values > q3 + factor * iqr)
+            else:
+                raise ValueError("Method must be 'mad' or 'iqr'")
+
+        mask = pd.DataFrame(mask, index=self.df.index, columns=columns)
+        summary = pd.DataFrame({'outliers': mask.sum().to_numpy()}, index=columns)
+        return mask, summary
+
+
+def _rolling(values, codes, window, min_periods, reduce):
+    """Apply a rolling reduction to a 2-D array, restarting the window at each group."""
+    frame = pd.DataFrame(values)
+    if codes is None:
+        return reduce(frame.rolling(window, min_periods=min_periods)).to_numpy()
+    rolled = reduce(frame.groupby(codes, sort=False).rolling(window, min_periods=min_periods))
+    # Drop the group level and restore the original row positions
+    return rolled.droplevel(0).sort_index().to_numpy()
+
+
+def iter_rolling_outliers(chunks, method='mad', columns=None, window=390, group_col=None, **kwargs):
+    """
+    Stream rolling outlier detection over an iterable of DataFrame chunks.
+
+    Each chunk is processed together with a carry of the last rows of every
+    group from the previous chunks, so results match a single in-memory pass
+    while memory stays bounded by one chunk plus the carry.
+
+    :param chunks: Iterable of DataFrames in time order, e.g. pd.read_csv(..., chunksize=n).
+    :param method: 'mad' or 'iqr', see OutlierDetection.rolling_mask.
+    :param columns: List of columns to check. If None, uses all numeric columns.
+    :param window: Number of bars in the trailing window.
+    :param group_col: Optional column (e.g. 'ticker') to roll within each group.
+    :param kwargs: Passed to OutlierDetection.rolling_mask.
+    :return: Generator of (chunk, mask) pairs.
+    """
+    # MAD needs the deviations of the carried rows too, which depend on
+    # their own trailing medians, hence twice the window
+    carry_rows = 2 * (window - 1) if method == 'mad' else window - 1
+    carry = None
+
+    for chunk in chunks:
+        frame = chunk if carry is None else pd.concat([carry, chunk])
+        n_carry = 0 if carry is None else len(carry)
+
+        mask, _ = OutlierDetection(frame).rolling_mask(
+            method, columns, window, group_col=group_col, **kwargs
+        )
+        yield chunk, mask.iloc[n_carry:]
+
+        if group_col is None:
+            carry = frame.tail(carry_rows)
+        else:
+            carry = frame.groupby(group_col, observed=True, sort=False).tail(carry_rows)
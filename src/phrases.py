@@ -0,0 +1,259 @@
+"""
+Phrase Mining Module for Financial News Data
+
+Counts 1-3 word n-grams over the whole corpus in one hashed sparse matrix
+(articles x hash buckets, sklearn's HashingVectorizer), so no vocabulary is
+built or held in memory and the corpus is processed in chunks. From that
+matrix:
+
+- corpus counts, document frequencies and PMI / normalized PMI collocation
+  scores rank phrases such as "price target" or "raises guidance"
+- per-group TF-IDF (per ticker, per month, ...) is one sparse product of a
+  group indicator matrix with the count matrix, with no per-group loop
+
+Hash buckets are turned back into phrases only for the buckets that are
+reported: the first article containing each bucket is re-tokenized and its
+n-grams hashed again. With the default 2**22 buckets, collisions between
+frequent phrases are rare; a collided bucket is reported under one of its
+phrases with the combined count.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, HashingVectorizer
+
+
+def _single_feature(feature):
+    """Analyzer treating a whole string as one feature, for hashing phrases"""
+    return [feature]
+
+
+class PhraseMiner:
+    """
+    Hashed n-gram counts of a corpus with phrase and per-group rankings.
+
+    Example:
+        miner = PhraseMiner().fit(df['headline'])
+        miner.top_phrases(20)
+        miner.group_tfidf(df['stock'], n=5)
+        miner.group_tfidf(df['date'].dt.to_period('M'), n=5)
+    """
+
+    def __init__(self, ngram_range=(1, 3), n_features=2 ** 22, chunksize=200_000,
+                 stop_words=ENGLISH_STOP_WORDS):
+        """
+        Args:
+            ngram_range (tuple): Smallest and largest n-gram length
+            n_features (int): Number of hash buckets
+            chunksize (int): Articles hashed at a time
+            stop_words (set): Words a reported phrase may not start or end with
+        """
+        self.ngram_range = ngram_range
+        self.n_features = n_features
+        self.chunksize = chunksize
+        self.stop_words = frozenset(stop_words or ())
+        self._vectorizer = HashingVectorizer(ngram_range=ngram_range, n_features=n_features,
+                                             alternate_sign=False, norm=None, dtype=np.float32)
+        self._hasher = HashingVectorizer(analyzer=_single_feature, n_features=n_features,
+                                         alternate_sign=False, norm=None)
+        self._analyzer = self._vectorizer.build_analyzer()
+        self._names = {}
+
+    def fit(self, texts):
+        """
+        Hash the n-grams of every text.
+
+        Args:
+            texts (iterable): Article texts, e.g. df['headline']
+
+        Returns:
+            PhraseMiner: self
+        """
+        texts = pd.Series(texts).astype(object).fillna('')
+        self.texts_ = texts.reset_index(drop=True)
+        chunks = [self._vectorizer.transform(self.texts_.iloc[start:start + self.chunksize])
+                  for start in range(0, len(self.texts_), self.chunksize)]
+        self.counts_ = (sparse.vstack(chunks, format='csr') if chunks
+                        else sparse.csr_matrix((0, self.n_features), dtype=np.float32))
+        self.n_docs_ = self.counts_.shape[0]
+        self.term_counts_ = np.asarray(self.counts_.sum(axis=0, dtype=np.float64)).ravel()
+        self.doc_freq_ = np.bincount(self.counts_.indices, minlength=self.n_features)
+        self._ngram_totals()
+        return self
+
+    def _ngram_totals(self):
+        """Total number of n-grams of each length, recovered from the row sums"""
+        lo, hi = self.ngram_range
+        per_doc = np.asarray(self.counts_.sum(axis=1)).ravel().round().astype(np.int64)
+        # A text of L tokens has max(L - n + 1, 0) n-grams of length n; invert that sum
+        lengths = np.arange(per_doc.max() + 2 if len(per_doc) else 1)
+        totals = sum(np.maximum(lengths - n + 1, 0) for n in range(lo, hi + 1))
+        tokens = np.searchsorted(totals, per_doc)
+        self.ngram_totals_ = {n: int(np.maximum(tokens - n + 1, 0).sum()) for n in range(lo, hi + 1)}
+
+    def buckets(self, phrases):
+        """Return the hash bucket of each phrase"""
+        phrases = list(phrases)
+        if not phrases:
+            return np.zeros(0, dtype=np.int32)
+        return self._hasher.transform(phrases).indices
+
+    def names(self, buckets):
+        """
+        Return a phrase for each bucket (None if no article contains it).
+
+        Args:
+            buckets (array-like): Hash bucket ids
+
+        Returns:
+            list: Phrases in the order of buckets
+        """
+        buckets = np.asarray(buckets, dtype=np.int64)
+        missing = np.unique([b for b in buckets if b not in self._names])
+        if len(missing):
+            # First article containing each missing bucket
+            columns = self.counts_[:, missing].tocsc()
+            has_doc = np.diff(columns.indptr) > 0
+            first_docs = columns.indices[columns.indptr[:-1][has_doc]]
+            wanted = set(missing[has_doc].tolist())
+            grams = list({gram for doc in np.unique(first_docs)
+                          for gram in self._analyzer(self.texts_.iat[doc])})
+            for gram, bucket in zip(grams, self.buckets(grams)):
+                if bucket in wanted and bucket not in self._names:
+                    self._names[bucket] = gram
+        return [self._names.get(b) for b in buckets]
+
+    def _is_phrase(self, phrase, min_n):
+        """Check the length and that the phrase does not start or end with a stop word"""
+        if phrase is None:
+            return False
+        words = phrase.split(' ')
+        return len(words) >= min_n and words[0] not in self.stop_words and words[-1] not in self.stop_words
+
+    def _scores(self, phrases, counts):
+        """PMI and normalized PMI of phrases from their counts"""
+        words = [phrase.split(' ') for phrase in phrases]
+        word_buckets = self.buckets([w for ws in words for w in ws])
+        word_p = self.term_counts_[word_buckets] / max(self.ngram_totals_.get(1, 0), 1)
+        offsets = np.cumsum([0] + [len(ws) for ws in words])
+        log_word_p = np.add.reduceat(np.log(word_p), offsets[:-1]) if len(words) else np.zeros(0)
+
+        # All probabilities relative to the token count, so that npmi <= 1
+        n_tokens = np.diff(offsets)
+        log_p = np.log(counts / max(self.ngram_totals_.get(1, 0), 1))
+        pmi = log_p - log_word_p
+        with np.errstate(divide='ignore', invalid='ignore'):
+            npmi = np.where(n_tokens > 1, pmi / -log_p / (n_tokens - 1), np.nan)
+        return n_tokens, np.where(n_tokens > 1, pmi, np.nan), npmi
+
+    def top_phrases(self, n=50, min_n=2, min_count=5, sort_by='count'):
+        """
+        Rank the phrases of the corpus.
+
+        Args:
+            n (int): Number of phrases
+            min_n (int): Minimum number of words
+            min_count (int): Minimum corpus count
+            sort_by (str): 'count', 'doc_freq', 'pmi' or 'npmi'
+
+        Returns:
+            pd.DataFrame: phrase, n_words, count, doc_freq, pmi and npmi
+        """
+        candidates = np.flatnonzero(self.term_counts_ >= min_count)
+        # Many frequent buckets are unigrams or stop word n-grams, look past them
+        order = candidates[np.argsort(-self.term_counts_[candidates], kind='stable')]
+        pool = order if sort_by in ('pmi', 'npmi') else order[:max(20 * n, 1000)]
+
+        names = self.names(pool)
+        keep = np.array([self._is_phrase(name, min_n) for name in names], dtype=bool)
+        pool = pool[keep]
+        phrases = [name for name, k in zip(names, keep) if k]
+        counts = self.term_counts_[pool]
+        n_words, pmi, npmi = self._scores(phrases, counts)
+
+        result = pd.DataFrame({
+            'phrase': phrases,
+            'n_words': n_words,
+            'count': counts.astype(np.int64),
+            'doc_freq': self.doc_freq_[pool],
+            'pmi': pmi,
+            'npmi': npmi,
+        })
+        return result.sort_values(sort_by, ascending=False, kind='stable').head(n).reset_index(drop=True)
+
+    def idf(self):
+        """Smoothed inverse document frequency of every bucket, as TfidfTransformer computes it"""
+        return np.log((1 + self.n_docs_) / (1 + self.doc_freq_)) + 1
+
+    def group_counts(self, groups):
+        """
+        Sum the n-gram counts of the articles of each group.
+
+        Args:
+            groups (array-like): One label per article (ticker, month, ...)
+
+        Returns:
+            tuple: (groups x buckets CSR matrix, group labels Index)
+        """
+        codes, labels = pd.factorize(pd.Series(groups).reset_index(drop=True), sort=True)
+        rows = codes >= 0
+        indicator = sparse.csr_matrix(
+            (np.ones(rows.sum(), dtype=np.float32), (codes[rows], np.flatnonzero(rows))),
+            shape=(len(labels), self.n_docs_))
+        return (indicator @ self.counts_).tocsr(), pd.Index(labels)
+
+    def group_tfidf(self, groups, n=10, min_n=1, min_count=2):
+        """
+        Top phrases of every group by TF-IDF of the group's summed counts.
+
+        Args:
+            groups (array-like): One label per article, e.g. df['stock'] or
+                df['date'].dt.to_period('M')
+            n (int): Phrases per group
+            min_n (int): Minimum number of words
+            min_count (int): Minimum count within the group
+
+        Returns:
+            pd.DataFrame: group, phrase, count and tfidf (L2-normalized per group)
+        """
+        counts, labels = self.group_counts(groups)
+
+        # TF-IDF on the stored entries of the count matrix, one entry per (group, bucket)
+        row = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        col, count = counts.indices, counts.data
+        score = count * self.idf()[col]
+        norms = np.sqrt(np.bincount(row, weights=score ** 2, minlength=counts.shape[0]))
+        score = score / norms[row]
+
+        # Best first within each group
+        keep = count >= min_count
+        row, col, score, count = row[keep], col[keep], score[keep], count[keep]
+        order = np.lexsort((-score, row))
+        row, col, score, count = row[order], col[order], score[order], count[order]
+
+        # Resolve names of the leading candidates, widening the pool until every
+        # group has n valid phrases or runs out of candidates
+        rank = np.arange(len(row)) - np.searchsorted(row, row, side='left')
+        pool = 5 * n
+        while True:
+            candidates = rank < pool
+            names = np.array(self.names(col[candidates]), dtype=object)
+            valid = np.array([self._is_phrase(name, min_n) for name in names], dtype=bool)
+            found = np.bincount(row[candidates][valid], minlength=len(labels))
+            short = found < np.minimum(n, np.bincount(row, minlength=len(labels)))
+            if not (short & (np.bincount(row, minlength=len(labels)) > pool)).any():
+                break
+            pool *= 4
+
+        row, names = row[candidates][valid], names[valid]
+        score, count = score[candidates][valid], count[candidates][valid]
+        rank = np.arange(len(row)) - np.searchsorted(row, row, side='left')
+        top = rank < n
+
+        return pd.DataFrame({
+            'group': labels[row[top]],
+            'phrase': names[top],
+            'count': count[top].astype(np.int64),
+            'tfidf': score[top],
+        })
@@ -0,0 +1,238 @@
+"""
+Price Store Module for yfinance Price Data
+
+Keeps each ticker's bars as one contiguous ``.npy`` file per column
+(OHLCV plus an optional adjusted close) next to a ``Date.npy`` index of
+naive UTC datetime64[ns] values:
+
+    store/AAPL/Date.npy
+    store/AAPL/Open.npy
+    ...
+
+Files are opened memory-mapped, so loading a ticker reads nothing until a
+value is touched and slices are views, not copies. Date ranges are located
+by binary search on the sorted index. New bars are appended in place by
+writing after the last value and rewriting the fixed-size ``.npy`` header
+with the new length.
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import numpy.lib.format as npy_format
+import pandas as pd
+
+from .timestamps import parse_timestamps
+
+logger = logging.getLogger(__name__)
+
+DATE_FIELD = 'Date'
+
+PRICE_FIELDS = {
+    'Open': np.float64,
+    'High': np.float64,
+    'Low': np.float64,
+    'Close': np.float64,
+    'Adj Close': np.float64,
+    'Volume': np.int64,
+}
+
+
+_HEADER_IO = {
+    (1, 0): (npy_format.read_array_header_1_0, npy_format.write_array_header_1_0),
+    (2, 0): (npy_format.read_array_header_2_0, npy_format.write_array_header_2_0),
+}
+
+
+def _field_path(directory, field):
+    """Return the .npy path of one field"""
+    return directory / f"{field.replace(' ', '_')}.npy"
+
+
+def _to_index_dates(values):
+    """Convert dates of any form to naive UTC datetime64[ns]"""
+    return parse_timestamps(pd.Series(values), tz=None).to_numpy(dtype='datetime64[ns]')
+
+
+def _append_npy(path, values, at):
+    """
+    Write values into a 1-D .npy file in place from position at and return the new length.
+
+    Anything stored after position at (left over from an interrupted
+    append) is overwritten and truncated.
+    """
+    with open(path, 'r+b') as handle:
+        version = npy_format.read_magic(handle)
+        read_header, write_header = _HEADER_IO[version]
+        _, fortran_order, dtype = read_header(handle)
+        header_end = handle.tell()
+        values = np.ascontiguousarray(values, dtype=dtype)
+
+        handle.seek(header_end + at * dtype.itemsize)
+        handle.write(values.tobytes())
+        handle.truncate()
+
+        # numpy pads the header so the length field can grow without
+        # changing the header size, so it can be rewritten in place
+        length = at + len(values)
+        handle.seek(0)
+        header = {'descr': npy_format.dtype_to_descr(dtype),
+                  'fortran_order': fortran_order, 'shape': (length,)}
+        write_header(handle, header)
+        if handle.tell() != header_end:
+            raise IOError(f"Header of {path} changed size, cannot append in place")
+    return length
+
+
+class PriceStore:
+    """
+    Memory-mapped per-ticker column store for daily or intraday bars.
+
+    Example:
+        store = PriceStore('data/yfinance_data/store')
+        store.import_csv('data/yfinance_data/processed/AAPL_processed_data.csv', 'AAPL')
+        bars = store.columns('AAPL', start='2020-01-01', end='2020-12-31')
+        TechnicalIndicators(bars).moving_average(20)
+    """
+
+    def __init__(self, root='data/yfinance_data/store'):
+        """
+        Args:
+            root: Directory holding one subdirectory per ticker
+        """
+        self.root = Path(root)
+
+    def _directory(self, ticker):
+        """Return the directory of a ticker, raising if it is not stored"""
+        directory = self.root / ticker
+        if not _field_path(directory, DATE_FIELD).exists():
+            raise KeyError(f"Ticker '{ticker}' not found in {self.root}")
+        return directory
+
+    def tickers(self):
+        """Return the stored tickers"""
+        if not self.root.exists():
+            return []
+        return sorted(path.parent.name for path in self.root.glob(f'*/{DATE_FIELD}.npy'))
+
+    def fields(self, ticker):
+        """Return the price fields stored for a ticker"""
+        directory = self._directory(ticker)
+        return [field for field in PRICE_FIELDS if _field_path(directory, field).exists()]
+
+    def write(self, ticker, df):
+        """
+        Write (or replace) a ticker's bars.
+
+        Args:
+            ticker: Ticker symbol
+            df: DataFrame with a Date column or DatetimeIndex and any of PRICE_FIELDS
+
+        Returns:
+            int: Number of bars stored
+        """
+        dates = df[DATE_FIELD] if DATE_FIELD in df.columns else df.index
+        dates = _to_index_dates(dates)
+        order = np.argsort(dates, kind='stable')
+
+        directory = self.root / ticker
+        directory.mkdir(parents=True, exist_ok=True)
+        # Fields of an earlier write that this one lacks would no longer
+        # line up with the new date index
+        for field in PRICE_FIELDS:
+            if field not in df.columns:
+                _field_path(directory, field).unlink(missing_ok=True)
+        np.save(_field_path(directory, DATE_FIELD), dates[order])
+        for field, dtype in PRICE_FIELDS.items():
+            if field in df.columns:
+                np.save(_field_path(directory, field), df[field].to_numpy(dtype=dtype)[order])
+        return len(dates)
+
+    def import_csv(self, path, ticker=None, **read_kwargs):
+        """Write the bars of a price CSV, the ticker defaults to the file name prefix"""
+        if ticker is None:
+            ticker = Path(path).stem.split('_')[0]
+        return self.write(ticker, pd.read_csv(path, **read_kwargs))
+
+    def append(self, ticker, df):
+        """
+        Append new bars in place. Bars at or before the last stored date are dropped.
+
+        Args:
+            ticker: Ticker symbol
+            df: DataFrame with the same fields as the stored ticker
+
+        Returns:
+            int: Number of bars appended
+        """
+        if not _field_path(self.root / ticker, DATE_FIELD).exists():
+            return self.write(ticker, df)
+
+        directory = self._directory(ticker)
+        dates = df[DATE_FIELD] if DATE_FIELD in df.columns else df.index
+        dates = _to_index_dates(dates)
+        order = np.argsort(dates, kind='stable')
+        stored = self.dates(ticker)
+        n_stored = len(stored)
+        new = order[dates[order] > stored[-1]] if n_stored else order
+        # Release the map before the file is rewritten
+        del stored
+        if len(new) < len(order):
+            logger.info("Dropped %d bars of %s already in the store", len(order) - len(new), ticker)
+        if not len(new):
+            return 0
+
+        fields = self.fields(ticker)
+        missing = [field for field in fields if field not in df.columns]
+        if missing:
+            raise ValueError(f"Bars for {ticker} are missing stored fields {missing}")
+
+        # Prices first and the date index last, so a failed append never
+        # exposes dates without their prices; the date count is the committed
+        # length and a retry overwrites any partially appended prices
+        for field in fields:
+            values = df[field].to_numpy(dtype=PRICE_FIELDS[field])[new]
+            _append_npy(_field_path(directory, field), values, n_stored)
+        _append_npy(_field_path(directory, DATE_FIELD), dates[new], n_stored)
+        return len(new)
+
+    def dates(self, ticker):
+        """Return the memory-mapped date index of a ticker"""
+        return np.load(_field_path(self._directory(ticker), DATE_FIELD), mmap_mode='r')
+
+    def slice_bounds(self, ticker, start=None, end=None):
+        """Return the (first, stop) positions of the bars within [start, end] by binary search"""
+        dates = self.dates(ticker)
+        first = 0 if start is None else np.searchsorted(dates, _to_index_dates([start])[0], side='left')
+        stop = len(dates) if end is None else np.searchsorted(dates, _to_index_dates([end])[0], side='right')
+        return int(first), int(stop)
+
+    def columns(self, ticker, start=None, end=None, fields=None):
+        """
+        Return zero-copy views of a ticker's columns within [start, end].
+
+        Args:
+            ticker: Ticker symbol
+            start: Optional inclusive start date
+            end: Optional inclusive end date
+            fields: Price fields to return, all stored fields if None
+
+        Returns:
+            dict: Field name to read-only memory-mapped array, including 'Date'
+        """
+        directory = self._directory(ticker)
+        first, stop = self.slice_bounds(ticker, start, end)
+        fields = self.fields(ticker) if fields is None else list(fields)
+        # Slicing by the date positions also hides prices left past the
+        # date count by an interrupted append
+        result = {DATE_FIELD: self.dates(ticker)[first:stop]}
+        for field in fields:
+            result[field] = np.load(_field_path(directory, field), mmap_mode='r')[first:stop]
+        return result
+
+    def frame(self, ticker, start=None, end=None, fields=None):
+        """Return a ticker's bars as a DataFrame indexed by Date (materializes the slice)"""
+        columns = self.columns(ticker, start, end, fields)
+        index = pd.DatetimeIndex(columns.pop(DATE_FIELD), name=DATE_FIELD)
+        return pd.DataFrame(columns, index=index)
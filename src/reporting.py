@@ -0,0 +1,223 @@
+"""
+Report Writer for Analysis Outputs
+
+Writes the text reports, tables and figures of an analysis run from
+background threads, so rendering large Series to text, serializing tables
+and writing figures overlap with the computation of the next result.
+Matplotlib is not thread-safe, so figures are rendered to bytes on the
+calling thread and only the file write happens in the background.
+
+All artifacts of a run go into one directory, results/<run_id>/, and a
+manifest.json listing every artifact with its kind, size and write time is
+written when the run closes. At most max_pending artifacts are queued at a
+time; submitting another blocks until one is written, which bounds the
+memory held by pending outputs.
+
+Objects are rendered later on a worker thread, so they must not be
+modified after they are submitted.
+"""
+
+import io
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def format_sections(sections):
+    """
+    Render report sections as text.
+
+    Args:
+        sections (list): (title, value) pairs, rendered as 'title:' followed by
+            str(value), or plain strings written as they are
+
+    Returns:
+        str: The report text
+    """
+    parts = []
+    for section in sections:
+        if isinstance(section, str):
+            parts.append(section)
+        else:
+            title, value = section
+            parts.append(f"{title}:\n{value}")
+    return "\n\n".join(parts)
+
+
+class ReportWriter:
+    """
+    Writes the artifacts of one analysis run in the background.
+
+    Example:
+        with ReportWriter() as writer:
+            writer.write_text('publisher_analysis.txt', [('Top Publishers', counts)])
+            writer.write_table('publisher_counts.parquet', counts.to_frame())
+            plot_publisher_distribution(counts, writer=writer)
+    """
+
+    def __init__(self, root='results', run_id=None, max_pending=8, max_workers=2):
+        """
+        Args:
+            root (str): Directory holding the run directories
+            run_id (str, optional): Name of the run directory, defaults to a timestamp
+            max_pending (int): Artifacts queued before submitting blocks
+            max_workers (int): Writer threads
+        """
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.run_dir = Path(root) / self.run_id
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.started = datetime.now(timezone.utc).isoformat()
+        self.artifacts = []
+        self.errors = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report-writer')
+        self._futures = []
+        self._closed = False
+
+    def path(self, name):
+        """Return the path of an artifact inside the run directory"""
+        return self.run_dir / name
+
+    def _submit(self, name, kind, write):
+        """Queue write(path) on a worker thread and record the artifact when done"""
+        if self._closed:
+            raise RuntimeError("ReportWriter is closed")
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._slots.acquire()
+
+        def task():
+            start = time.perf_counter()
+            try:
+                write(path)
+            except Exception as e:
+                logger.error("Failed to write %s: %s", name, e, exc_info=True)
+                with self._lock:
+                    self.errors.append({'name': name, 'error': f'{type(e).__name__}: {e}'})
+                raise
+            finally:
+                self._slots.release()
+            with self._lock:
+                self.artifacts.append({
+                    'name': name,
+                    'kind': kind,
+                    'bytes': path.stat().st_size,
+                    'seconds': round(time.perf_counter() - start, 4),
+                })
+
+        future = self._pool.submit(task)
+        self._futures.append(future)
+        return future
+
+    def write_text(self, name, sections):
+        """
+        Write a text report of titled sections (see format_sections).
+
+        Returns:
+            concurrent.futures.Future: Completes when the file is written
+        """
+        sections = list(sections)
+        return self._submit(name, 'text', lambda path: path.write_text(format_sections(sections)))
+
+    def write_table(self, name, df, file_format=None, **kwargs):
+        """
+        Write a DataFrame or Series as CSV or Parquet.
+
+        Args:
+            name (str): File name, the format is inferred from a .parquet suffix
+            df (pd.DataFrame or pd.Series): Table to write
+            file_format (str, optional): 'csv' or 'parquet'
+            **kwargs: Passed to to_csv or to_parquet
+        """
+        if file_format is None:
+            file_format = 'parquet' if name.endswith(('.parquet', '.pq')) else 'csv'
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError("file_format must be 'csv' or 'parquet'")
+        if file_format == 'parquet':
+            frame = df.to_frame() if hasattr(df, 'to_frame') else df
+            return self._submit(name, 'table', lambda path: frame.to_parquet(path, **kwargs))
+        return self._submit(name, 'table', lambda path: df.to_csv(path, **kwargs))
+
+    def save_figure(self, name, fig=None, **savefig_kwargs):
+        """
+        Save a matplotlib figure, by default the current one.
+
+        The figure is rendered on the calling thread and closed in pyplot,
+        then its bytes are written in the background. The format defaults
+        to the file name suffix.
+        """
+        import matplotlib.pyplot as plt
+
+        fig = fig if fig is not None else plt.gcf()
+        savefig_kwargs.setdefault('format', Path(name).suffix.lstrip('.') or None)
+        buffer = io.BytesIO()
+        try:
+            fig.savefig(buffer, **savefig_kwargs)
+        finally:
+            plt.close(fig)
+        data = buffer.getvalue()
+        return self._submit(name, 'figure', lambda path: path.write_bytes(data))
+
+    def close(self):
+        """
+        Wait for every pending artifact and write the manifest.
+
+        Returns:
+            Path: The manifest file
+
+        Raises:
+            RuntimeError: If any artifact failed to write
+        """
+        if self._closed:
+            return self.path('manifest.json')
+        self._closed = True
+        for future in self._futures:
+            future.exception()
+        self._pool.shutdown(wait=True)
+
+        manifest = {
+            'run_id': self.run_id,
+            'started': self.started,
+            'finished': datetime.now(timezone.utc).isoformat(),
+            'artifacts': sorted(self.artifacts, key=lambda artifact: artifact['name']),
+            'errors': self.errors,
+        }
+        manifest_path = self.path('manifest.json')
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+        logger.info("Wrote %d artifacts to %s", len(self.artifacts), self.run_dir)
+        if self.errors:
+            raise RuntimeError(f"{len(self.errors)} artifacts failed to write: "
+                               + ', '.join(error['name'] for error in self.errors))
+        return manifest_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep the original error; still flush what was written
+            try:
+                self.close()
+            except RuntimeError:
+                pass
+        return False
+
+
+def finish_figure(filename, writer=None):
+    """Hand the current figure to a ReportWriter, or save and close it directly"""
+    import matplotlib.pyplot as plt
+
+    if writer is None:
+        plt.savefig(filename)
+        plt.close()
+    else:
+        writer.save_figure(filename)
@@ -0,0 +1,147 @@
+"""
+Returns Module for Stock Price Panels
+
+Computes trailing and forward simple or log returns for several horizons
+and every ticker at once. A long price panel (one row per ticker and date)
+is scattered into a dense (ticker, date) matrix without touching the input
+frame, and every horizon is one shifted difference of the log prices, so
+no per-ticker loop, sort of the input or ``pct_change`` call is needed.
+
+Prices are taken from the 'Adj Close' column when present, so split days
+and ex-dividend days do not show up as crashes. Without it 'Close' is used,
+which yfinance already adjusts when downloading with auto_adjust=True; raw
+closes can be adjusted first with adjusted_close().
+"""
+
+import numpy as np
+import pandas as pd
+
+HORIZONS = (1, 5, 21)
+
+
+def adjusted_close(close, dividends=None, splits=None):
+    """
+    Build a split- and dividend-adjusted price index from raw closes.
+
+    Each day's gross return is (close + dividend) * split ratio / previous
+    close, and the index is the cumulative product of the gross returns,
+    scaled to end at the last raw close.
+
+    Args:
+        close (np.ndarray): Raw closes of shape (dates,) or (tickers, dates)
+        dividends (np.ndarray, optional): Cash dividends per share, same shape
+        splits (np.ndarray, optional): Split ratios (0 or 1 means no split), same shape
+
+    Returns:
+        np.ndarray: float64 adjusted closes of the same shape
+    """
+    close = np.asarray(close, dtype=np.float64)
+    payout = close if dividends is None else close + np.nan_to_num(dividends)
+    ratio = np.ones_like(close) if splits is None else np.where(np.asarray(splits) > 0, splits, 1.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_gross = np.log(payout[..., 1:] * ratio[..., 1:]) - np.log(close[..., :-1])
+    log_gross = np.nan_to_num(log_gross, nan=0.0, posinf=0.0, neginf=0.0)
+
+    log_index = np.zeros_like(close)
+    np.cumsum(log_gross, axis=-1, out=log_index[..., 1:])
+    # Anchor on the last close so the newest prices are unchanged
+    anchor = np.log(close[..., -1:]) - log_index[..., -1:]
+    adjusted = np.exp(log_index + anchor)
+    adjusted[np.isnan(close)] = np.nan
+    return adjusted
+
+
+def price_matrix(prices, price_col=None, group_col='ticker', date_col='Date'):
+    """
+    Scatter a long price panel into a dense (ticker, date) matrix.
+
+    Args:
+        prices (pd.DataFrame): One row per ticker and date
+        price_col (str, optional): Price column, defaults to 'Adj Close' when present,
+            otherwise 'Close'
+        group_col (str): Ticker column
+        date_col (str): Date column
+
+    Returns:
+        tuple: (float64 matrix with NaN for missing bars, tickers Index, dates Index)
+    """
+    ticker_codes, tickers = pd.factorize(prices[group_col], sort=True)
+    date_codes, dates = pd.factorize(prices[date_col], sort=True)
+
+    if price_col is None:
+        price_col = 'Adj Close' if 'Adj Close' in prices.columns else 'Close'
+
+    matrix = np.full((len(tickers), len(dates)), np.nan)
+    # to_numpy() of a float64 column is a view, so the input is never copied
+    matrix[ticker_codes, date_codes] = prices[price_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return matrix, pd.Index(tickers), pd.Index(dates)
+
+
+def return_matrix(prices, horizons=HORIZONS, forward_horizons=(), kind='simple', **matrix_kwargs):
+    """
+    Compute trailing and forward returns for every ticker, date and horizon.
+
+    Args:
+        prices (pd.DataFrame or np.ndarray): Long panel (see price_matrix) or an
+            already dense (tickers, dates) price matrix
+        horizons (iterable): Trailing horizons in bars, return over [t - h, t]
+        forward_horizons (iterable): Forward horizons in bars, return over [t, t + h]
+        kind (str): 'simple' or 'log'
+        **matrix_kwargs: Passed to price_matrix
+
+    Returns:
+        dict: values (float32 array of shape (tickers, dates, horizons)), tickers,
+        dates and labels ('ret_5', 'fwd_5', ...) of the last axis
+    """
+    if kind not in ('simple', 'log'):
+        raise ValueError("kind must be 'simple' or 'log'")
+
+    if isinstance(prices, pd.DataFrame):
+        matrix, tickers, dates = price_matrix(prices, **matrix_kwargs)
+    else:
+        matrix = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+        tickers, dates = pd.RangeIndex(matrix.shape[0]), pd.RangeIndex(matrix.shape[1])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_prices = np.log(matrix)
+
+    specs = [('ret', h) for h in horizons] + [('fwd', h) for h in forward_horizons]
+    values = np.full(matrix.shape + (len(specs),), np.nan, dtype=np.float32)
+
+    for k, (direction, h) in enumerate(specs):
+        if h <= 0 or h >= matrix.shape[1]:
+            continue
+        change = log_prices[:, h:] - log_prices[:, :-h]
+        if kind == 'simple':
+            change = np.expm1(change)
+        # The same change belongs to the later date looking back and to
+        # the earlier date looking forward
+        if direction == 'ret':
+            values[:, h:, k] = change
+        else:
+            values[:, :-h, k] = change
+
+    return {
+        'values': values,
+        'tickers': tickers,
+        'dates': dates,
+        'labels': [f'{direction}_{h}' for direction, h in specs],
+    }
+
+
+def returns_frame(result, dropna=True):
+    """
+    Flatten a return_matrix result into a long frame indexed by ticker and date.
+
+    Args:
+        result (dict): Output of return_matrix
+        dropna (bool): Drop rows where every horizon is missing
+
+    Returns:
+        pd.DataFrame: One column per horizon label
+    """
+    values = result['values']
+    index = pd.MultiIndex.from_product([result['tickers'], result['dates']], names=['ticker', 'Date'])
+    frame = pd.DataFrame(values.reshape(-1, values.shape[-1]), index=index, columns=result['labels'])
+    return frame.dropna(how='all') if dropna else frame
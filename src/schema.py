@@ -0,0 +1,164 @@
+"""
+Schema Module for Financial News and Price Data
+
+Declares the canonical column types of article and OHLC frames and casts
+frames to them. Article text is kept in Arrow-backed strings, low
+cardinality columns such as ``publisher`` and ``stock`` become categoricals
+and derived columns use the narrowest integer or float type that fits.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .timestamps import normalize_timestamps
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday',
+            'Friday', 'Saturday', 'Sunday']
+
+WEEKDAY_DTYPE = pd.CategoricalDtype(WEEKDAYS, ordered=True)
+
+ARTICLE_SCHEMA = {
+    'headline': 'string[pyarrow]',
+    'text': 'string[pyarrow]',
+    'url': 'string[pyarrow]',
+    'processed_text': 'string[pyarrow]',
+    'publisher': 'category',
+    'domain': 'category',
+    'stock': 'category',
+    'headline_length': 'int16',
+    'hour': 'int8',
+    'day_of_week': WEEKDAY_DTYPE,
+    'sentiment': 'float32',
+}
+
+# Raw timestamp columns, parsed by src.timestamps rather than cast
+ARTICLE_TIMESTAMPS = ['date', 'publication_date']
+
+OHLC_SCHEMA = {
+    'Open': 'float64',
+    'High': 'float64',
+    'Low': 'float64',
+    'Close': 'float64',
+    'Adj Close': 'float64',
+    'Volume': 'int64',
+    'Dividends': 'float32',
+    'Stock Splits': 'float32',
+    'ticker': 'category',
+}
+
+
+def publisher_domain(publisher):
+    """Return the domain of an e-mail style publisher, else the publisher"""
+    if '@' in str(publisher):
+        return str(publisher).split('@')[1]
+    return publisher
+
+
+def frame_memory(df):
+    """Return the deep memory usage of a DataFrame in bytes"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _target_dtype(series, dtype):
+    """Resolve the dtype a column is cast to, keeping missing values representable"""
+    if isinstance(dtype, str) and dtype.startswith(('int', 'uint')) and series.isna().any():
+        # numpy integers cannot hold NaN, use the matching nullable type
+        return dtype.capitalize() if dtype.startswith('int') else 'U' + dtype[1:].capitalize()
+    return dtype
+
+
+def enforce_schema(df, schema=None, columns=None):
+    """
+    Cast the columns of a DataFrame to their canonical dtypes in place.
+
+    Columns that are not declared in the schema, or that already have the
+    declared dtype, are left untouched.
+
+    Args:
+        df (pd.DataFrame): Frame to cast
+        schema (dict, optional): Column to dtype mapping, defaults to ARTICLE_SCHEMA
+        columns (list, optional): Restrict the cast to these columns
+
+    Returns:
+        pd.DataFrame: The same frame with canonical dtypes
+    """
+    if schema is None:
+        schema = ARTICLE_SCHEMA
+    if columns is None:
+        columns = df.columns
+
+    for col in columns:
+        if col not in schema or col not in df.columns:
+            continue
+        dtype = _target_dtype(df[col], schema[col])
+        if df[col].dtype == dtype:
+            continue
+        if isinstance(dtype, str) and dtype.startswith('float'):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+
+    return df
+
+
+def compact_frame(df, schema=None):
+    """
+    Enforce the schema on a frame and report its memory before and after.
+
+    Args:
+        df (pd.DataFrame): Frame to compact in place
+        schema (dict, optional): Column to dtype mapping, defaults to ARTICLE_SCHEMA
+
+    Returns:
+        dict: before_bytes, after_bytes and the reduction factor
+    """
+    before = frame_memory(df)
+    enforce_schema(df, schema)
+    after = frame_memory(df)
+
+    report = {
+        'before_bytes': before,
+        'after_bytes': after,
+        'reduction': before / after if after else np.nan,
+    }
+    logger.info("Compacted frame from %.1f MB to %.1f MB (%.1fx)",
+                before / 1e6, after / 1e6, report['reduction'])
+    return report
+
+
+def load_article_data(path, schema=None, **read_kwargs):
+    """
+    Load an article CSV directly into its canonical dtypes.
+
+    Timestamp columns listed in ARTICLE_TIMESTAMPS are normalized to UTC.
+
+    Args:
+        path (str): Path to the CSV file
+        schema (dict, optional): Column to dtype mapping, defaults to ARTICLE_SCHEMA
+        **read_kwargs: Extra arguments passed to pd.read_csv
+
+    Returns:
+        pd.DataFrame: Loaded frame
+    """
+    if schema is None:
+        schema = ARTICLE_SCHEMA
+
+    # Parse string and categorical columns straight into their final type
+    # so the object-dtype copy is never materialized
+    read_dtypes = {
+        col: dtype for col, dtype in schema.items()
+        if isinstance(dtype, pd.CategoricalDtype) or dtype in ('category', 'string[pyarrow]')
+    }
+    read_dtypes.update({col: 'string[pyarrow]' for col in ARTICLE_TIMESTAMPS})
+    read_dtypes.update(read_kwargs.pop('dtype', {}))
+
+    df = pd.read_csv(path, dtype=read_dtypes, **read_kwargs)
+    for col in ARTICLE_TIMESTAMPS:
+        if col in df.columns:
+            normalize_timestamps(df, col)
+    compact_frame(df, schema)
+    return df
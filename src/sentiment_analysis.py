@@ -1,29 +1,75 @@
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 from textblob import TextBlob
+from .schema import enforce_schema
+from .timestamps import EXCHANGE_TZ, exchange_dates, parse_timestamps
+from .bars import resample_bars
+from .instrumentation import instrument
 
+@instrument
 def compute_sentiment(df, text_col='headline'):
     """
     Adds a 'sentiment' column to the DataFrame with polarity scores.
     """
     df['sentiment'] = df[text_col].astype(str).apply(lambda x: TextBlob(x).sentiment.polarity)
+    enforce_schema(df, columns=['sentiment'])
     return df
 
+@instrument
 def aggregate_daily_sentiment(df, date_col='date', stock_col='stock', sentiment_col='sentiment'):
     """
-    Aggregates sentiment by date and stock (mean).
+    Aggregates sentiment by exchange date and stock (mean).
     """
-    df[date_col] = pd.to_datetime(df[date_col]).dt.date
-    daily_sentiment = df.groupby([date_col, stock_col])[sentiment_col].mean().reset_index()
+    dates = exchange_dates(df, date_col).dt.date
+    daily_sentiment = df.groupby([dates, stock_col], observed=True)[sentiment_col].mean().reset_index()
     return daily_sentiment
 
+def _price_dates(df, date_col):
+    """Return the date column as datetimes without writing parsed values back to df"""
+    dates = pd.Series(df[date_col], copy=False)
+    return dates if is_datetime64_any_dtype(dates.dtype) else parse_timestamps(dates)
+
+def _is_intraday(dates):
+    """Return True unless every timestamp is a midnight, in UTC or in exchange time"""
+    if dates.dt.tz is None:
+        return bool((dates != dates.dt.normalize()).any())
+    # Daily dates arrive as UTC midnights ('2020-01-02') or as exchange
+    # midnights with an offset ('2020-01-02 00:00:00-05:00')
+    return all(bool((local != local.dt.normalize()).any())
+               for local in (dates.dt.tz_convert('UTC'), dates.dt.tz_convert(EXCHANGE_TZ)))
+
+def compute_returns(df, rule=None, date_col='Date', close_col='Close', **resample_kwargs):
+    """
+    Computes bar-to-bar returns, after resampling to rule bars (e.g. '5min',
+    '1h', 'session') when given. Returns a DataFrame with the bar time and
+    return columns. df may also be a mapping of column arrays, e.g.
+    PriceStore.columns(). The input is not modified.
+    """
+    dates = _price_dates(df, date_col)
+    close = df[close_col] if isinstance(df, pd.DataFrame) else pd.Series(df[close_col], copy=False)
+    if rule is not None:
+        ticks = pd.DataFrame({date_col: dates.to_numpy(), close_col: close.to_numpy()})
+        bars = resample_bars(ticks, rule, time_col=date_col, price_col=close_col, **resample_kwargs)
+        dates, close = bars[date_col], bars['Close']
+    order = dates.argsort(kind='stable')
+    returns = pd.DataFrame({
+        date_col: dates.iloc[order].array,
+        'return': close.iloc[order].pct_change().to_numpy()
+    }, index=dates.index[order])
+    return returns.dropna()
+
 def compute_daily_returns(df, date_col='Date', close_col='Close'):
     """
     Computes daily returns and returns a DataFrame with date and return columns.
+    Intraday bars are first reduced to the close of each regular session.
+    df may also be a mapping of column arrays, e.g. PriceStore.columns().
+    The input is not modified.
     """
-    df[date_col] = pd.to_datetime(df[date_col]).dt.date
-    df = df.sort_values(date_col)
-    df['return'] = df[close_col].pct_change()
-    return df[[date_col, 'return']].dropna()
+    dates = _price_dates(df, date_col)
+    rule = 'session' if _is_intraday(dates) else None
+    returns = compute_returns(df, rule=rule, date_col=date_col, close_col=close_col)
+    returns[date_col] = returns[date_col].dt.date
+    return returns
 
 def merge_sentiment_returns(sentiment_df, returns_df, date_col='date', stock_col='stock'):
     """
@@ -0,0 +1,461 @@
+"""
+Streaming Summary Sketches for Financial News and Price Data
+
+Mergeable summaries that are filled chunk by chunk and combined across
+worker processes (all state is plain numpy, so they pickle cleanly):
+
+- RunningStats: exact count, mean, variance, min and max (Welford / Chan).
+- KLLSketch: approximate quantiles in O(k log(n/k)) memory.
+- StreamingSummary: both together, producing a describe()-style Series.
+- CountMinSketch: approximate counts of any item in fixed memory.
+- SpaceSaving: the k most frequent items with per-item error bounds.
+- HeavyHitters: both together, top-k items of a label stream such as
+  publishers, tickers or n-grams.
+
+Error bounds: a KLLSketch with parameter k answers rank queries with a
+normalized rank error of about 2.296 / k**0.9723 at 99% confidence
+(the empirical fit published for Apache DataSketches KLL). For the default
+k=200 this is about 1.3%: the 25% quantile returned lies between the true
+23.7% and 26.3% quantiles. The error does not grow with the number of
+values or with the number of merges.
+
+A CountMinSketch of width w and depth d overestimates any count by at most
+e / w * n with probability 1 - exp(-d), where n is the total count; the
+defaults (2048 x 5) give 0.13% of n at 99.3% confidence. SpaceSaving with
+k counters never underestimates a monitored item, overestimates it by at
+most its recorded error, and every item it dropped has a count of at most
+its floor, which stays below about n / k.
+"""
+
+import numpy as np
+import pandas as pd
+
+_DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+def _finite(values):
+    """Return values as a flat float64 array without NaN"""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    return values[~np.isnan(values)]
+
+
+class RunningStats:
+    """
+    Exact running count, mean, variance, min and max.
+
+    Chunks are summarized with numpy and combined with Chan's parallel form
+    of Welford's update, which stays numerically stable for long streams.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Add a chunk of values (NaN are ignored) and return self"""
+        values = _finite(values)
+        if len(values):
+            other = RunningStats()
+            other.count = len(values)
+            other.mean = float(values.mean())
+            other.m2 = float(((values - other.mean) ** 2).sum())
+            other.min = float(values.min())
+            other.max = float(values.max())
+            self.merge(other)
+        return self
+
+    def merge(self, other):
+        """Fold another RunningStats into this one and return self"""
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self, ddof=1):
+        """Return the variance, NaN if there are too few values"""
+        if self.count - ddof <= 0:
+            return np.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=1):
+        """Return the standard deviation"""
+        return np.sqrt(self.variance(ddof))
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch.
+
+    Values live in a stack of compactors; an item at level h stands for 2**h
+    original values. When a level outgrows its capacity it is sorted and every
+    other item (random offset) is promoted to the next level. Whole chunks are
+    compacted as numpy arrays, so updating with large chunks is vectorized.
+    """
+
+    def __init__(self, k=200, seed=None):
+        """
+        Args:
+            k (int): Accuracy parameter, larger k means smaller error and more memory
+            seed (int, optional): Seed for the compaction coin flips
+        """
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def normalized_rank_error(k=200):
+        """Return the rank error (fraction of n) at 99% confidence for parameter k"""
+        return 2.296 / k ** 0.9723
+
+    def _capacity(self, level):
+        """Return the capacity of a level, shrinking by 2/3 away from the top"""
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compact every level that is over capacity, bottom up"""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind at this level
+                keep = items[:len(items) % 2]
+                pairs = items[len(keep):]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        """Add a chunk of values (NaN are ignored) and return self"""
+        values = _finite(values)
+        if len(values):
+            self.count += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another KLLSketch into this one and return self"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _weighted_items(self):
+        """Return all retained items sorted, with their cumulative weights"""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2 ** level, dtype=np.int64)
+            for level, level_items in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        """
+        Return approximate quantiles.
+
+        Args:
+            q (float or array-like): Quantile(s) in [0, 1]
+
+        Returns:
+            float or np.ndarray: Value(s) at the requested quantile(s)
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        items, cum_weights = self._weighted_items()
+        targets = np.asarray(q, dtype=np.float64) * cum_weights[-1]
+        idx = np.searchsorted(cum_weights, targets, side='left')
+        result = items[np.minimum(idx, len(items) - 1)]
+        return result if np.ndim(q) else float(result)
+
+    def rank(self, value):
+        """Return the approximate fraction of values <= value"""
+        if self.count == 0:
+            return np.nan
+        items, cum_weights = self._weighted_items()
+        idx = np.searchsorted(items, value, side='right')
+        return float(cum_weights[idx - 1] / cum_weights[-1]) if idx else 0.0
+
+
+class StreamingSummary:
+    """Running moments plus a quantile sketch, for describe()-style output"""
+
+    def __init__(self, k=200, seed=None):
+        self.stats = RunningStats()
+        self.sketch = KLLSketch(k, seed)
+
+    def update(self, values):
+        """Add a chunk of values and return self"""
+        values = _finite(values)
+        self.stats.update(values)
+        self.sketch.update(values)
+        return self
+
+    def merge(self, other):
+        """Fold another StreamingSummary into this one and return self"""
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def quantile(self, q):
+        """Return approximate quantiles, see KLLSketch.quantile"""
+        return self.sketch.quantile(q)
+
+    def describe(self):
+        """Return a Series laid out like pd.Series.describe()"""
+        if self.stats.count == 0:
+            return pd.Series([0] + [np.nan] * 7, index=_DESCRIBE_INDEX)
+        q1, median, q3 = self.sketch.quantile([0.25, 0.5, 0.75])
+        return pd.Series([
+            float(self.stats.count), self.stats.mean, self.stats.std(),
+            self.stats.min, q1, median, q3, self.stats.max
+        ], index=_DESCRIBE_INDEX)
+
+
+def summarize_chunks(chunks, columns, k=200, seed=None):
+    """
+    Build one StreamingSummary per column from an iterable of DataFrame chunks.
+
+    Args:
+        chunks (iterable): DataFrames, e.g. pd.read_csv(..., chunksize=n)
+        columns (list): Numeric columns to summarize
+        k (int): KLL accuracy parameter
+        seed (int, optional): Seed for the compaction coin flips
+
+    Returns:
+        dict: Column name to StreamingSummary
+    """
+    summaries = {col: StreamingSummary(k, seed) for col in columns}
+    for chunk in chunks:
+        for col in columns:
+            summaries[col].update(chunk[col].to_numpy(dtype=np.float64, na_value=np.nan))
+    return summaries
+
+
+def _label_counts(items, weights=None):
+    """Return the total count (or weight) of every distinct non-null label"""
+    items = pd.Series(items).astype(object)
+    if weights is None:
+        return items.value_counts()
+    return pd.Series(np.asarray(weights), index=items.index).groupby(items, sort=False).sum() \
+        .sort_values(ascending=False)
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch of label counts.
+
+    A depth x width table of counters; each row hashes a label to one
+    column with its own multiply-shift hash of the label's 64-bit
+    hash_pandas_object value. A label's estimate is the smallest of its
+    depth counters, which can only overestimate the true count.
+    """
+
+    def __init__(self, width=2048, depth=5, seed=0):
+        """
+        Args:
+            width (int): Counters per row, rounded up to a power of two
+            depth (int): Number of rows (independent hashes)
+            seed (int): Seed of the hash functions; only sketches with the
+                same width, depth and seed can be merged
+        """
+        self.bits = max(int(np.ceil(np.log2(width))), 1)
+        self.width = 1 << self.bits
+        self.depth = depth
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        # Odd multipliers keep multiply-shift hashing universal
+        self._multipliers = rng.integers(0, 2 ** 63, depth, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._offsets = rng.integers(0, 2 ** 63, depth, dtype=np.uint64)
+        self.table = np.zeros((depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    def _columns(self, labels):
+        """Return the (depth, len(labels)) counter columns of labels"""
+        hashes = pd.util.hash_pandas_object(pd.Index(labels, dtype=object), index=False).to_numpy()
+        mixed = hashes[None, :] * self._multipliers[:, None] + self._offsets[:, None]
+        return (mixed >> np.uint64(64 - self.bits)).astype(np.intp)
+
+    def update(self, items, weights=None):
+        """Add a chunk of labels, each counted once or with its weight, and return self"""
+        counts = _label_counts(items, weights)
+        if len(counts):
+            columns = self._columns(counts.index)
+            values = counts.to_numpy(dtype=np.int64)
+            for row in range(self.depth):
+                np.add.at(self.table[row], columns[row], values)
+            self.total += int(values.sum())
+        return self
+
+    def merge(self, other):
+        """Fold another CountMinSketch into this one and return self"""
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Can only merge Count-Min sketches with the same width, depth and seed")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def estimate(self, labels):
+        """Return the estimated counts of labels as an int64 array"""
+        labels = list(labels)
+        if not labels:
+            return np.zeros(0, dtype=np.int64)
+        columns = self._columns(labels)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def error_bound(self):
+        """Return (maximum overestimate, probability the bound holds for one label)"""
+        return np.e / self.width * self.total, 1 - np.exp(-self.depth)
+
+
+class SpaceSaving:
+    """
+    Space-Saving summary of the k most frequent labels.
+
+    Each chunk is counted exactly and summarized by its top k labels plus a
+    floor, the largest count it dropped. Summaries merge by adding counts,
+    charging a label missing from one side that side's floor as both count
+    and error, and keeping the k largest again (the mergeable form of
+    Space-Saving). For every label:
+
+        count - error <= true count <= count       (monitored labels)
+        true count <= floor                        (all other labels)
+    """
+
+    def __init__(self, k=100):
+        """
+        Args:
+            k (int): Number of labels monitored
+        """
+        self.k = k
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.floor = 0
+        self.total = 0
+
+    def _truncate(self, counts, errors, floor):
+        """Keep the k largest counts, raising the floor to the largest dropped one"""
+        counts = counts.sort_values(ascending=False, kind='stable')
+        if len(counts) > self.k:
+            floor = max(floor, int(counts.iloc[self.k]))
+            counts = counts.iloc[:self.k]
+        self.counts = counts.astype(np.int64)
+        self.errors = errors.reindex(counts.index).astype(np.int64)
+        self.floor = int(floor)
+
+    def update(self, items, weights=None):
+        """Add a chunk of labels, each counted once or with its weight, and return self"""
+        counts = _label_counts(items, weights)
+        chunk = SpaceSaving(self.k)
+        chunk.total = int(counts.sum())
+        chunk._truncate(counts, pd.Series(0, index=counts.index), 0)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Fold another SpaceSaving summary into this one and return self"""
+        labels = self.counts.index.union(other.counts.index, sort=False)
+        counts = (self.counts.reindex(labels, fill_value=self.floor)
+                  + other.counts.reindex(labels, fill_value=other.floor))
+        errors = (self.errors.reindex(labels, fill_value=self.floor)
+                  + other.errors.reindex(labels, fill_value=other.floor))
+        self.total += other.total
+        self._truncate(counts, errors, self.floor + other.floor)
+        return self
+
+    def top(self, n=None):
+        """Return the n largest monitored labels with count and error columns"""
+        frame = pd.DataFrame({'count': self.counts, 'error': self.errors})
+        return frame if n is None else frame.head(n)
+
+
+class HeavyHitters:
+    """
+    Top-k labels of a stream with error bounds, in fixed memory.
+
+    Space-Saving picks the candidates and bounds their counts from below;
+    a Count-Min sketch over the same stream tightens the upper bound.
+    Both merge across chunks and worker processes.
+    """
+
+    def __init__(self, k=100, width=2048, depth=5, seed=0):
+        """
+        Args:
+            k (int): Number of labels monitored by Space-Saving
+            width, depth, seed: Count-Min sketch parameters, see CountMinSketch
+        """
+        self.space_saving = SpaceSaving(k)
+        self.count_min = CountMinSketch(width, depth, seed)
+
+    def update(self, items, weights=None):
+        """Add a chunk of labels, each counted once or with its weight, and return self"""
+        counts = _label_counts(items, weights)
+        self.space_saving.update(counts.index, counts.to_numpy())
+        self.count_min.update(counts.index, counts.to_numpy())
+        return self
+
+    def merge(self, other):
+        """Fold another HeavyHitters into this one and return self"""
+        self.space_saving.merge(other.space_saving)
+        self.count_min.merge(other.count_min)
+        return self
+
+    @property
+    def total(self):
+        """Total count of the stream"""
+        return self.count_min.total
+
+    def top(self, n=10):
+        """
+        Return the n most frequent labels.
+
+        Returns:
+            pd.DataFrame: count (best estimate, never below the true count),
+            lower_bound and upper_bound per label, most frequent first
+        """
+        candidates = self.space_saving.top()
+        upper = np.minimum(candidates['count'].to_numpy(),
+                           self.count_min.estimate(candidates.index))
+        frame = pd.DataFrame({
+            'count': upper,
+            'lower_bound': (candidates['count'] - candidates['error']).to_numpy(),
+            'upper_bound': upper,
+        }, index=candidates.index)
+        return frame.sort_values('count', ascending=False, kind='stable').head(n)
+
+    def counts(self, n=10):
+        """Return the estimated counts of the n most frequent labels, like value_counts().head(n)"""
+        return self.top(n)['count'].rename('count')
+
+    def error_bounds(self):
+        """
+        Return the error guarantees of the summary.
+
+        Returns:
+            dict: total, space_saving_floor (no unlisted label exceeds it),
+            count_min_error and count_min_confidence
+        """
+        count_min_error, confidence = self.count_min.error_bound()
+        return {
+            'total': self.total,
+            'space_saving_floor': self.space_saving.floor,
+            'count_min_error': count_min_error,
+            'count_min_confidence': confidence,
+        }
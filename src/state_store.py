@@ -0,0 +1,245 @@
+"""
+Incremental Analytics State for Financial News Data
+
+Holds the running aggregates behind the news reports so a daily batch of
+headlines updates them in time proportional to the batch, not to the full
+history:
+
+- article counts per publisher (domain counts are derived from these)
+- a weekday x hour count matrix (hourly and weekday counts are its margins)
+- daily article counts and per-stock daily sentiment sums and counts
+- a mergeable headline length summary (see src.sketches)
+- document frequencies of headline terms, from which TF-IDF weights follow;
+  terms come from the keyword preprocessing (see src.text_preprocessing)
+
+Every aggregate but the length summary is a sum, so applying deltas in any
+split gives the same counts as one pass over the concatenated data. The
+length summary's count, mean and extremes are exact too; its quantiles
+come from a KLL sketch whose estimates depend on the split, within the
+sketch's error bound. Applied delta files are remembered by name, size and
+modification time: re-running a day is a no-op, and a file changed after
+it was applied is skipped with a warning, since folding it in again would
+count its rows twice. Rebuild the state from all deltas to pick it up.
+The state pickles to a single file.
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import CountVectorizer
+
+from .binning import bin_counts, weekday_hour_counts
+from .schema import ARTICLE_TIMESTAMPS, WEEKDAYS, load_article_data, publisher_domain
+from .sketches import StreamingSummary
+from .text_preprocessing import preprocess_text
+from .timestamps import exchange_dates
+
+logger = logging.getLogger(__name__)
+
+
+def _add(total, delta):
+    """Add two count Series, aligning on the union of their labels"""
+    return total.add(delta, fill_value=0) if len(total) else delta.astype(np.float64)
+
+
+class AnalyticsState:
+    """
+    Running aggregates of the news analyses, updated one delta at a time.
+
+    Example:
+        state = AnalyticsState.load('data/state/news_state.pkl')
+        state.update_file('data/deltas/2024-06-03.csv')
+        state.save('data/state/news_state.pkl')
+        report = state.report()
+    """
+
+    def __init__(self, text_col='headline', date_col=None, k=200):
+        """
+        Args:
+            text_col: Column holding the headline text
+            date_col: Timestamp column, defaults to the first of ARTICLE_TIMESTAMPS present
+            k: Accuracy parameter of the headline length quantile sketch
+        """
+        self.text_col = text_col
+        self.date_col = date_col
+        self.n_articles = 0
+        self.publisher_counts = pd.Series(dtype=np.float64)
+        self.weekday_hour = np.zeros((7, 24), dtype=np.int64)
+        self.daily_counts = pd.Series(dtype=np.float64)
+        self.sentiment_sums = pd.DataFrame(columns=['sum', 'count'], dtype=np.float64)
+        self.headline_lengths = StreamingSummary(k=k, seed=0)
+        self.document_frequency = pd.Series(dtype=np.float64)
+        self.applied = {}
+
+    def _date_column(self, df):
+        """Resolve the timestamp column of a delta"""
+        if self.date_col is not None:
+            return self.date_col
+        return next((col for col in ARTICLE_TIMESTAMPS if col in df.columns), None)
+
+    def update(self, df):
+        """
+        Fold a delta of articles into the state.
+
+        Args:
+            df: New articles, with an optional 'sentiment' column
+
+        Returns:
+            AnalyticsState: self
+        """
+        if df.empty:
+            return self
+        self.n_articles += len(df)
+
+        if 'publisher' in df.columns:
+            # Plain labels, so categoricals from different deltas align
+            counts = df['publisher'].astype(object).value_counts()
+            self.publisher_counts = _add(self.publisher_counts, counts)
+
+        date_col = self._date_column(df)
+        if date_col is not None:
+            dates = exchange_dates(df, date_col)
+            self.weekday_hour += weekday_hour_counts(dates).to_numpy()
+            daily = bin_counts(dates, 'D')
+            self.daily_counts = _add(self.daily_counts, daily[daily > 0])
+
+            if 'sentiment' in df.columns and 'stock' in df.columns:
+                sentiment = df.groupby([dates.dt.floor('D'), df['stock'].astype(object)])['sentiment']
+                delta = pd.DataFrame({'sum': sentiment.sum(), 'count': sentiment.count()})
+                delta.index.names = ['date', 'stock']
+                if len(self.sentiment_sums):
+                    delta = self.sentiment_sums.add(delta, fill_value=0)
+                self.sentiment_sums = delta
+
+        if self.text_col in df.columns:
+            text = df[self.text_col].astype(object).fillna('')
+            self.headline_lengths.update(text.str.len().to_numpy(dtype=np.float64))
+            try:
+                # Same terms as extract_keywords, which tokenizes the
+                # preprocessed text with the default token pattern
+                vectorizer = CountVectorizer(binary=True, preprocessor=preprocess_text)
+                presence = vectorizer.fit_transform(text)
+            except ValueError:
+                # Nothing but stop words in this delta
+                presence = None
+            if presence is not None:
+                frequency = pd.Series(np.asarray(presence.sum(axis=0)).ravel(),
+                                      index=vectorizer.get_feature_names_out())
+                self.document_frequency = _add(self.document_frequency, frequency)
+
+        return self
+
+    def update_file(self, path, **read_kwargs):
+        """
+        Load a delta file and fold it in, unless a file of that name was applied before.
+
+        A file changed since it was applied is skipped too: its rows are
+        already in the state, so only a rebuild from all deltas can pick up
+        the change.
+
+        Returns:
+            bool: True if the file was applied
+        """
+        path = Path(path)
+        stat = path.stat()
+        fingerprint = (stat.st_size, stat.st_mtime)
+        applied = self.applied.get(path.name)
+        if applied == fingerprint:
+            logger.info("Skipping %s, already applied", path.name)
+            return False
+        if applied is not None:
+            logger.warning("Skipping %s, changed since it was applied; rebuild the state to include it",
+                           path.name)
+            return False
+        df = load_article_data(path, **read_kwargs)
+        self.update(df)
+        self.applied[path.name] = fingerprint
+        logger.info("Applied %s: %d articles, %d in total", path.name, len(df), self.n_articles)
+        return True
+
+    def save(self, path):
+        """Pickle the state, replacing the file atomically"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(path.suffix + '.tmp')
+        with open(temp, 'wb') as handle:
+            pickle.dump(self, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Load a pickled state, or start an empty one if the file does not exist"""
+        path = Path(path)
+        if not path.exists():
+            return cls(**kwargs)
+        with open(path, 'rb') as handle:
+            return pickle.load(handle)
+
+    def idf(self):
+        """Return smoothed inverse document frequencies, as TfidfVectorizer computes them"""
+        return np.log((1 + self.n_articles) / (1 + self.document_frequency)) + 1
+
+    def daily_sentiment(self):
+        """Return mean sentiment per date and stock"""
+        sums = self.sentiment_sums
+        return (sums['sum'] / sums['count']).rename('sentiment').sort_index()
+
+    def report(self, top_n=20):
+        """
+        Build the report tables from the state alone.
+
+        Returns:
+            dict: publisher_counts, publisher_percentages, domain_counts, hourly_counts,
+            weekday_counts, weekday_hour, daily_counts, headline_length, daily_sentiment
+            and top_terms (document frequency and idf)
+        """
+        publishers = self.publisher_counts.astype(np.int64).sort_values(ascending=False)
+        domains = publishers.groupby(publishers.index.map(publisher_domain)).sum()
+        heatmap = pd.DataFrame(self.weekday_hour, index=pd.Index(WEEKDAYS, name='day_of_week'),
+                               columns=pd.RangeIndex(24, name='hour'))
+        terms = pd.DataFrame({'document_frequency': self.document_frequency.astype(np.int64),
+                              'idf': self.idf()})
+        return {
+            'n_articles': self.n_articles,
+            'publisher_counts': publishers,
+            'publisher_percentages': (publishers / self.n_articles * 100).round(2) if self.n_articles else publishers,
+            'domain_counts': domains.sort_values(ascending=False),
+            'hourly_counts': heatmap.sum(axis=0),
+            'weekday_counts': heatmap.sum(axis=1),
+            'weekday_hour': heatmap,
+            'daily_counts': self.daily_counts.astype(np.int64).sort_index(),
+            'headline_length': self.headline_lengths.describe(),
+            'daily_sentiment': self.daily_sentiment(),
+            'top_terms': terms.sort_values('document_frequency', ascending=False).head(top_n),
+        }
+
+    def write_report(self, path='results/incremental_analysis.txt', top_n=20):
+        """Write the report tables to a text file"""
+        report = self.report(top_n)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(f"Articles: {report['n_articles']}\n")
+            f.write("\nTop Publishers by Article Count:\n")
+            f.write(str(report['publisher_counts'].head(10)))
+            f.write("\n\nPublisher Percentages:\n")
+            f.write(str(report['publisher_percentages'].head(10)))
+            f.write("\n\nTop Publisher Domains:\n")
+            f.write(str(report['domain_counts'].head(10)))
+            f.write("\n\nHeadline Length Statistics:\n")
+            f.write(str(report['headline_length']))
+            f.write("\n\nArticles by Day of Week:\n")
+            f.write(str(report['weekday_counts']))
+            f.write("\n\nArticles by Hour:\n")
+            f.write(str(report['hourly_counts']))
+            f.write("\n\nDaily Publication Frequency:\n")
+            f.write(str(report['daily_counts'].describe()))
+            f.write("\n\nTop Terms:\n")
+            f.write(str(report['top_terms']))
+            if len(report['daily_sentiment']):
+                f.write("\n\nDaily Sentiment:\n")
+                f.write(str(report['daily_sentiment'].tail(20)))
+        return report
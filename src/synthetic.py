@@ -0,0 +1,310 @@
+"""
+Synthetic Data Generator for Financial News and Price Data
+
+Seeded, vectorized generators of article frames shaped like the analyst
+ratings data and of matching daily OHLCV panels, for load tests on data
+sizes the repository does not ship:
+
+- publishers and tickers follow Zipf popularity, so a few dominate
+- timestamps follow a market-hours profile in US/Eastern time, with a
+  pre-market ramp, a trading-session plateau and quiet weekends
+- headlines come from templates with positive, negative or neutral phrases
+  that TextBlob scores with the matching sign
+- prices are geometric Brownian motions with per-ticker drift and
+  volatility, and volume rises with the size of the day's move
+
+Large outputs are generated and written chunk by chunk (see iter_articles,
+iter_ohlcv and write_frames), so memory is bounded by the chunk size and
+not by the total row count. Article chunks cover consecutive time slices,
+so a written file is sorted by date. For a given seed the output is
+reproducible for the same chunk size.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Relative article volume per hour of day, US/Eastern
+HOUR_WEIGHTS = np.array([
+    0.3, 0.2, 0.2, 0.2, 0.4, 0.8,      # 00-05 overnight
+    2.0, 3.5, 5.0, 6.0, 5.5, 5.0,      # 06-11 pre-market and open
+    4.5, 4.5, 4.5, 5.0, 5.5, 3.0,      # 12-17 session and close
+    1.5, 1.0, 0.8, 0.6, 0.5, 0.4,      # 18-23 after hours
+])
+
+# Relative article volume per weekday, Monday first
+WEEKDAY_WEIGHTS = np.array([1.0, 1.0, 1.0, 1.0, 0.95, 0.08, 0.06])
+
+PREFIXES = ['', '', '', 'UPDATE: ', 'Why ', 'Stocks To Watch: ']
+
+PHRASES = {
+    'positive': [
+        'shares surge after strong earnings',
+        'beats estimates with best quarter yet',
+        'hits new high on upbeat guidance',
+        'shares trading higher after good sales',
+        'upgraded as analysts see great upside',
+        'posts strong revenue growth',
+    ],
+    'negative': [
+        'falls after weak sales',
+        'shares plunge on disappointing guidance',
+        'cuts outlook amid poor demand',
+        'downgraded after bad quarter',
+        'reports worst quarter in years',
+        'slides on weak margins',
+    ],
+    'neutral': [
+        'to report earnings on Tuesday',
+        'announces quarterly dividend',
+        'sets date for annual meeting',
+        'files quarterly report',
+        'completes acquisition',
+        'shares are trading',
+    ],
+}
+
+SENTIMENTS = list(PHRASES)
+
+_ARTICLES, _PRICES, _UNIVERSE = 0, 1, 2
+
+
+def zipf_weights(n, a=1.1):
+    """Return normalized Zipf weights 1 / rank**a for ranks 1..n"""
+    weights = 1.0 / np.arange(1, n + 1) ** a
+    return weights / weights.sum()
+
+
+def ticker_symbols(n, seed=0):
+    """
+    Return n distinct uppercase ticker symbols of one to four letters.
+
+    The same seed always gives the same symbols, so articles and prices
+    generated separately refer to the same tickers.
+    """
+    rng = np.random.default_rng([seed, _UNIVERSE])
+    letters = np.array(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+    symbols = []
+    seen = set()
+    while len(symbols) < n:
+        length = rng.integers(1, 5)
+        symbol = ''.join(rng.choice(letters, length))
+        if symbol not in seen:
+            seen.add(symbol)
+            symbols.append(symbol)
+    return np.array(symbols, dtype=object)
+
+
+def publisher_names(n, seed=0, email_share=0.2):
+    """
+    Return n distinct publisher names, a share of them e-mail addresses.
+
+    E-mail publishers exercise the domain analyses, as in the real data.
+    """
+    rng = np.random.default_rng([seed, _UNIVERSE, 1])
+    is_email = rng.random(n) < email_share
+    outlets = rng.integers(0, max(n // 20, 1), n)
+    return np.array([f'writer{i}@outlet{o}.com' if email else f'Writer {i}'
+                     for i, (email, o) in enumerate(zip(is_email, outlets))], dtype=object)
+
+
+def _timestamps(n, days, rng, tz):
+    """Draw n sorted timestamps over the given calendar days with a market-hours profile"""
+    day_weights = WEEKDAY_WEIGHTS[days.dayofweek]
+    day = rng.choice(days.asi8, n, p=day_weights / day_weights.sum())
+    hour = rng.choice(24, n, p=HOUR_WEIGHTS / HOUR_WEIGHTS.sum())
+    seconds = hour * 3600 + rng.integers(0, 3600, n)
+    local = np.sort(day + seconds * 1_000_000_000)
+    # Wall-clock times in the DST gap move forward, repeated hours take standard time
+    return pd.DatetimeIndex(local).tz_localize(tz, ambiguous=np.zeros(n, dtype=bool),
+                                               nonexistent='shift_forward')
+
+
+def generate_articles(n, seed=0, start='2020-01-01', end='2024-01-01', n_publishers=1_000,
+                      tickers=5_000, zipf_a=1.1, sentiment_shares=(0.35, 0.25, 0.4),
+                      tz='America/New_York', chunk=0):
+    """
+    Generate a frame of articles shaped like the analyst ratings data.
+
+    Args:
+        n (int): Number of articles
+        seed (int): Random seed
+        start, end (str): Date range of the articles, end exclusive
+        n_publishers (int): Number of distinct publishers
+        tickers (int or list): Number of tickers, or the ticker symbols to use
+        zipf_a (float): Zipf exponent of publisher and ticker popularity
+        sentiment_shares (tuple): Shares of positive, negative and neutral headlines
+        tz (str): Time zone of the 'date' column
+        chunk (int): Chunk number, selects an independent random stream
+
+    Returns:
+        pd.DataFrame: headline, url, publisher, date and stock columns
+    """
+    rng = np.random.default_rng([seed, _ARTICLES, chunk])
+    symbols = ticker_symbols(tickers, seed) if np.isscalar(tickers) else np.asarray(tickers, dtype=object)
+    publishers = publisher_names(n_publishers, seed)
+    days = pd.date_range(start, end, freq='D', inclusive='left')
+
+    stock = symbols[rng.choice(len(symbols), n, p=zipf_weights(len(symbols), zipf_a))]
+    publisher = publishers[rng.choice(n_publishers, n, p=zipf_weights(n_publishers, zipf_a))]
+
+    # Build headlines from object arrays, element-wise in C rather than per row in Python
+    sentiment = rng.choice(len(SENTIMENTS), n, p=np.asarray(sentiment_shares) / np.sum(sentiment_shares))
+    phrase_table = np.array([PHRASES[s] for s in SENTIMENTS], dtype=object)
+    phrase = phrase_table[sentiment, rng.integers(0, phrase_table.shape[1], n)]
+    prefix = np.array(PREFIXES, dtype=object)[rng.integers(0, len(PREFIXES), n)]
+    headline = prefix + stock + ' ' + phrase
+
+    ids = pd.Series(rng.integers(10_000_000, 100_000_000, n)).astype(str).to_numpy(dtype=object)
+    return pd.DataFrame({
+        'headline': headline,
+        'url': 'https://news.example.com/article/' + ids,
+        'publisher': publisher,
+        'date': _timestamps(n, days, rng, tz),
+        'stock': stock,
+    })
+
+
+def iter_articles(n, chunksize=1_000_000, seed=0, start='2020-01-01', end='2024-01-01', **kwargs):
+    """
+    Yield n articles in chunks of at most chunksize rows, oldest first.
+
+    Each chunk covers its own slice of the date range, so the chunks
+    concatenate to a frame sorted by date.
+
+    Args:
+        n (int): Total number of articles
+        chunksize (int): Rows per chunk
+        seed (int): Random seed
+        start, end (str): Date range of the articles, end exclusive
+        **kwargs: Passed to generate_articles
+
+    Yields:
+        pd.DataFrame: Article chunks
+    """
+    days = pd.date_range(start, end, freq='D', inclusive='left')
+    n_chunks = max(-(-n // chunksize), 1)
+    # Give every chunk at least one day, spreading rows evenly over days
+    n_chunks = min(n_chunks, len(days))
+    day_edges = np.linspace(0, len(days), n_chunks + 1).round().astype(int)
+    row_edges = np.linspace(0, n, n_chunks + 1).round().astype(int)
+    for i in range(n_chunks):
+        rows = row_edges[i + 1] - row_edges[i]
+        if rows == 0:
+            continue
+        chunk_start = days[day_edges[i]]
+        chunk_end = days[day_edges[i + 1]] if day_edges[i + 1] < len(days) else pd.Timestamp(end)
+        yield generate_articles(rows, seed=seed, start=chunk_start, end=chunk_end, chunk=i, **kwargs)
+
+
+def generate_ohlcv(tickers, start='2015-01-01', end='2024-01-01', seed=0, chunk=0,
+                   mean_drift=0.07, mean_volatility=0.3):
+    """
+    Generate a long daily OHLCV panel of geometric Brownian motion prices.
+
+    Args:
+        tickers (int or list): Number of tickers, or the ticker symbols to use
+        start, end (str): Business day range, end exclusive
+        seed (int): Random seed
+        chunk (int): Chunk number, selects an independent random stream
+        mean_drift (float): Mean annual drift across tickers
+        mean_volatility (float): Typical annual volatility across tickers
+
+    Returns:
+        pd.DataFrame: ticker, Date, Open, High, Low, Close, Adj Close and
+        Volume, sorted by ticker and date
+    """
+    rng = np.random.default_rng([seed, _PRICES, chunk])
+    symbols = ticker_symbols(tickers, seed) if np.isscalar(tickers) else np.asarray(tickers, dtype=object)
+    dates = pd.bdate_range(start, end, inclusive='left')
+    n_tickers, n_days = len(symbols), len(dates)
+    dt = 1 / 252
+
+    drift = rng.normal(mean_drift, 0.1, (n_tickers, 1))
+    volatility = mean_volatility * rng.lognormal(0, 0.4, (n_tickers, 1))
+    log_returns = rng.normal((drift - volatility ** 2 / 2) * dt, volatility * np.sqrt(dt), (n_tickers, n_days))
+    close = rng.lognormal(np.log(50), 1.0, (n_tickers, 1)) * np.exp(np.cumsum(log_returns, axis=1))
+
+    # Opens gap from the previous close; highs and lows extend past both
+    previous = np.concatenate([close[:, :1], close[:, :-1]], axis=1)
+    intraday = volatility * np.sqrt(dt)
+    open_ = previous * np.exp(rng.normal(0, 0.3, close.shape) * intraday)
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, 0.5, close.shape)) * intraday)
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, 0.5, close.shape)) * intraday)
+
+    # Popular tickers trade more, and every ticker trades more on big moves
+    base_volume = 5e6 * zipf_weights(n_tickers)[rng.permutation(n_tickers)][:, None] * n_tickers
+    move = np.abs(log_returns) / (volatility * np.sqrt(dt))
+    volume = base_volume * rng.lognormal(0, 0.3, close.shape) * (1 + 0.5 * move)
+
+    return pd.DataFrame({
+        'ticker': np.repeat(symbols, n_days),
+        'Date': np.tile(dates.to_numpy(), n_tickers),
+        'Open': open_.ravel(),
+        'High': high.ravel(),
+        'Low': low.ravel(),
+        'Close': close.ravel(),
+        'Adj Close': close.ravel(),
+        'Volume': volume.ravel().astype(np.int64) + 100,
+    })
+
+
+def iter_ohlcv(tickers, start='2015-01-01', end='2024-01-01', seed=0, chunksize=1_000_000, **kwargs):
+    """
+    Yield an OHLCV panel in chunks of whole tickers of about chunksize rows.
+
+    Args:
+        tickers (int or list): Number of tickers, or the ticker symbols to use
+        start, end (str): Business day range, end exclusive
+        seed (int): Random seed
+        chunksize (int): Approximate rows per chunk
+        **kwargs: Passed to generate_ohlcv
+
+    Yields:
+        pd.DataFrame: Panel chunks
+    """
+    symbols = ticker_symbols(tickers, seed) if np.isscalar(tickers) else np.asarray(tickers, dtype=object)
+    n_days = len(pd.bdate_range(start, end, inclusive='left'))
+    per_chunk = max(chunksize // max(n_days, 1), 1)
+    for i, first in enumerate(range(0, len(symbols), per_chunk)):
+        yield generate_ohlcv(symbols[first:first + per_chunk], start, end, seed=seed, chunk=i, **kwargs)
+
+
+def write_frames(chunks, path, file_format=None):
+    """
+    Write a stream of frames to one CSV or Parquet file, one chunk at a time.
+
+    Args:
+        chunks (iterable): DataFrames with the same columns
+        path (str): Output file
+        file_format (str, optional): 'csv' or 'parquet', inferred from the suffix by default
+
+    Returns:
+        int: Number of rows written
+    """
+    if file_format is None:
+        file_format = 'parquet' if str(path).endswith(('.parquet', '.pq')) else 'csv'
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError("file_format must be 'csv' or 'parquet'")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            if file_format == 'csv':
+                chunk.to_csv(path, mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
@@ -1,18 +1,37 @@
 import pandas as pd
 import numpy as np
+from .bars import resample_bars
 
 class TechnicalIndicators:
     
     def __init__(self, ohlc: pd.DataFrame):
         """
         Initialize with OHLC data.
+
+        ohlc may also be a mapping of column arrays with an optional 'Date'
+        array, e.g. PriceStore.columns(); the arrays are wrapped, not copied.
         """
+        if not isinstance(ohlc, pd.DataFrame):
+            index = pd.DatetimeIndex(ohlc['Date'], name='Date') if 'Date' in ohlc else None
+            ohlc = {col: pd.Series(values, index=index, name=col, copy=False)
+                    for col, values in ohlc.items() if col != 'Date'}
         self.ohlc = ohlc
         self.close = ohlc['Close']
         self.high = ohlc['High']
         self.low = ohlc['Low']
         self.open = ohlc['Open']
-        self.volume = ohlc['Volume'] if 'Volume' in ohlc.columns else None
+        self.volume = ohlc['Volume'] if 'Volume' in ohlc else None
+
+    def resample(self, rule: str, **kwargs) -> 'TechnicalIndicators':
+        """
+        Indicators over coarser bars, e.g. '5min', '1h' or 'session' bars of minute data.
+
+        kwargs are passed to src.bars.resample_bars.
+        """
+        frame = pd.DataFrame({col: self.ohlc[col] for col in ('Date', 'Open', 'High', 'Low', 'Close', 'Volume')
+                              if col in self.ohlc}, copy=False)
+        bars = resample_bars(frame, rule, **kwargs)
+        return TechnicalIndicators(bars.set_index('Date').drop(columns='ticks'))
         
     def moving_average(self, period: int) -> pd.Series:
         """Simple Moving Average (SMA)"""
@@ -44,4 +63,4 @@ class TechnicalIndicators:
             'MACD': macd,
             'Signal_Line': signal,
             'MACD_Histogram': hist
-        }, index=self.ohlc.index)
+        }, index=self.close.index)
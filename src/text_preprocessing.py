@@ -0,0 +1,31 @@
+"""
+Text Preprocessing Module for Financial News Data
+
+Lowercases, tokenizes and removes stop words with NLTK. Keyword
+extraction (see src.analytics.text_analysis) and the incremental term
+counts (see src.state_store) share this preprocessing, so both see the
+same terms.
+"""
+
+import nltk
+from nltk.corpus import stopwords
+from nltk.tokenize import word_tokenize
+
+# Download required NLTK data
+nltk.download('punkt')
+nltk.download('stopwords')
+
+
+def preprocess_text(text):
+    """Preprocess text for analysis"""
+    # Convert to lowercase
+    text = text.lower()
+
+    # Tokenize
+    tokens = word_tokenize(text)
+
+    # Remove stopwords
+    stop_words = set(stopwords.words('english'))
+    tokens = [word for word in tokens if word not in stop_words]
+
+    return ' '.join(tokens)
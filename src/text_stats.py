@@ -0,0 +1,154 @@
+"""
+Text Statistics Module for Financial News Data
+
+Computes per-article text statistics with vectorized passes over the
+offsets and data buffers of an Arrow string column: every byte is
+classified with a lookup table and the flags are summed per string with
+np.add.reduceat at the string offsets, so no Python function is called per
+row.
+Character classes are ASCII; characters are counted as UTF-8 code points.
+Ticker mentions use Arrow's regex kernel. Arrow-backed string columns (see
+src.schema) are read without a copy; for categorical columns the statistics
+are computed once per category and gathered by code.
+
+Per-publisher and per-stock roll-ups are grouped sums of the per-article
+counts, divided afterwards, so every group is aggregated in one groupby.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Statistics counted per article; the roll-ups sum these
+COUNT_COLUMNS = ['char_length', 'token_count', 'upper_count', 'letter_count',
+                 'digit_count', 'ticker_mentions', 'punct_count']
+
+# Cashtags ($AAPL) and all-caps words of 2-5 letters (AAPL, NVDA, but also FDA)
+TICKER_PATTERN = r'\$[A-Z]{1,5}\b|\b[A-Z]{2,5}\b'
+
+
+def _byte_table(chars):
+    """Lookup table flagging the given ASCII characters"""
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(chars.encode('ascii'), dtype=np.uint8)] = True
+    return table
+
+
+_UPPER = _byte_table('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_LETTER = _UPPER | _byte_table('abcdefghijklmnopqrstuvwxyz')
+_DIGIT = _byte_table('0123456789')
+_PUNCT = _byte_table('!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
+_SPACE = _byte_table(' \t\n\r\x0b\x0c')
+# UTF-8 continuation bytes, which do not start a character
+_CONTINUATION = np.zeros(256, dtype=bool)
+_CONTINUATION[0x80:0xC0] = True
+
+
+def _arrow_strings(series):
+    """Return the values of a string column as one Arrow array"""
+    if series.dtype == 'string[pyarrow]' or isinstance(series.dtype, pd.ArrowDtype):
+        return pa.chunked_array(series.array.__arrow_array__()).combine_chunks()
+    return pa.array(series.astype(object), type=pa.large_string(), from_pandas=True)
+
+
+def _segment_sums(flags, offsets):
+    """Sum a flag per byte over the byte range of every string
+
+    flags has one padding byte after the last string, so every offset is a
+    valid reduceat index.
+    """
+    # reduceat returns the element at the start for empty ranges, zero those
+    sums = np.add.reduceat(flags.view(np.uint8), offsets[:-1], dtype=np.int32)
+    sums[offsets[1:] == offsets[:-1]] = 0
+    return sums
+
+
+def _count_arrays(strings):
+    """Count every statistic in one pass over the offsets and data buffers"""
+    strings = strings.cast(pa.large_string())
+    _, offset_buffer, data_buffer = strings.buffers()
+    offsets = np.frombuffer(offset_buffer, dtype=np.int64)[strings.offset:strings.offset + len(strings) + 1]
+    data = (np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None
+            else np.zeros(0, dtype=np.uint8))
+    if not len(strings):
+        return {name: np.zeros(0, dtype=np.int32) for name in COUNT_COLUMNS}
+    # Padding byte, in no character class and never a character or token start
+    data = np.append(data[offsets[0]:offsets[-1]], np.uint8(0))
+    offsets = offsets - offsets[0]
+
+    # A token starts at a non-space byte following a space or a string start
+    space = _SPACE[data]
+    after_space = np.concatenate([[True], space[:-1]])
+    after_space[offsets[:-1]] = True
+
+    char_starts = ~_CONTINUATION[data]
+    token_starts = ~space & after_space
+    char_starts[-1] = token_starts[-1] = False
+
+    counts = {
+        'char_length': _segment_sums(char_starts, offsets),
+        'token_count': _segment_sums(token_starts, offsets),
+        'upper_count': _segment_sums(_UPPER[data], offsets),
+        'letter_count': _segment_sums(_LETTER[data], offsets),
+        'digit_count': _segment_sums(_DIGIT[data], offsets),
+        'ticker_mentions': pc.fill_null(pc.count_substring_regex(strings, TICKER_PATTERN), 0).to_numpy(
+            zero_copy_only=False).astype(np.int32),
+        'punct_count': _segment_sums(_PUNCT[data], offsets),
+    }
+    if strings.null_count:
+        missing = strings.is_null().to_numpy(zero_copy_only=False)
+        for values in counts.values():
+            values[missing] = 0
+    return counts
+
+
+def text_statistics(texts):
+    """
+    Compute text statistics of every article.
+
+    Args:
+        texts (pd.Series): Article text, e.g. df['headline']
+
+    Returns:
+        pd.DataFrame: char_length, token_count, upper_count, letter_count,
+            digit_count, ticker_mentions and punct_count (int32, missing
+            text counts as empty) and upper_ratio (uppercase share of
+            letters, NaN without letters), indexed like texts
+    """
+    if isinstance(texts.dtype, pd.CategoricalDtype):
+        # Count each distinct text once, then gather by code
+        per_category = _count_arrays(_arrow_strings(texts.cat.categories.to_series()))
+        codes = texts.cat.codes.to_numpy()
+        counts = {name: np.where(codes >= 0, values[codes], 0).astype(np.int32)
+                  for name, values in per_category.items()}
+    else:
+        counts = _count_arrays(_arrow_strings(texts))
+
+    stats = pd.DataFrame(counts, index=texts.index)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stats['upper_ratio'] = (stats['upper_count'] / stats['letter_count'].where(stats['letter_count'] > 0)).astype(np.float32)
+    return stats
+
+
+def rollup_text_statistics(stats, groups):
+    """
+    Roll per-article text statistics up to groups with grouped sums.
+
+    Args:
+        stats (pd.DataFrame): Output of text_statistics
+        groups (pd.Series): Group label per article, e.g. df['publisher']
+
+    Returns:
+        pd.DataFrame: article_count, avg_<count> for each count column and
+            upper_ratio (uppercase letters over letters of the whole group)
+    """
+    grouped = stats[COUNT_COLUMNS].astype(np.int64).groupby(groups, observed=True)
+    sums = grouped.sum()
+    article_count = grouped.size()
+
+    rollup = pd.DataFrame({'article_count': article_count})
+    for column in COUNT_COLUMNS:
+        rollup[f'avg_{column}'] = sums[column] / article_count
+    rollup['upper_ratio'] = sums['upper_count'] / sums['letter_count'].where(sums['letter_count'] > 0)
+    return rollup
@@ -0,0 +1,198 @@
+"""
+Timestamp Normalization Module for Financial News and Price Data
+
+Parses raw date strings into timezone-aware datetimes in a single stage.
+The format is detected once per string layout, only the unique strings of
+a column are parsed and the results are mapped back to every row. A column
+holding a datetime dtype counts as already parsed, so calling the stage
+again on it is free.
+
+Timestamps are kept in UTC; hours, weekdays and dates are derived on the
+exchange clock with exchange_time(). News times without an offset are
+exchange wall-clock times, so the calendar analyses read them with
+exchange_dates().
+"""
+
+import datetime
+import re
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+from pandas.tseries.api import guess_datetime_format
+
+EXCHANGE_TZ = 'America/New_York'
+
+# Formats keyed by the layout of a sample string (digits replaced by 0),
+# so every column with the same layout reuses the first inference
+_FORMAT_CACHE = {}
+_DIGITS = re.compile(r'\d')
+# A trailing UTC offset or zone letter, e.g. '-04:00', '+0530' or 'Z'
+_ZONE_SUFFIX = r'(?:[+-]\d{2}:?\d{2}|Z|UTC)$'
+
+
+def infer_timestamp_format(sample):
+    """Return the strftime format of a sample timestamp string, or None"""
+    layout = _DIGITS.sub('0', sample)
+    if layout not in _FORMAT_CACHE:
+        _FORMAT_CACHE[layout] = guess_datetime_format(sample)
+    return _FORMAT_CACHE[layout]
+
+
+def _convert_tz(values, tz):
+    """Convert UTC datetimes to tz, or to naive UTC when tz is None"""
+    if tz is None:
+        return values.tz_convert(None)
+    return values.tz_convert(tz)
+
+
+def parse_timestamps(values, tz='UTC', format=None, errors='raise', naive_tz='UTC'):
+    """
+    Parse timestamps by converting each unique string only once.
+
+    Strings with mixed UTC offsets are all brought to UTC first and then
+    converted to tz.
+
+    Args:
+        values (pd.Series): Raw timestamp strings or datetimes
+        tz (str, optional): Target timezone, e.g. 'UTC' or EXCHANGE_TZ. None gives naive UTC
+        format (str, optional): strftime format, inferred from the data if omitted
+        errors (str): 'raise' or 'coerce', as in pd.to_datetime
+        naive_tz (str): Timezone of strings without a UTC offset
+
+    Returns:
+        pd.Series: Parsed datetimes aligned with values
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values)
+
+    if is_datetime64_any_dtype(values.dtype):
+        if values.dt.tz is None:
+            return values if tz is None else values.dt.tz_localize('UTC').dt.tz_convert(tz)
+        return values.dt.tz_convert(tz) if tz is not None else values.dt.tz_convert(None)
+
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Index(uniques).astype(str)
+
+    if format is None and len(uniques):
+        format = infer_timestamp_format(uniques[0])
+
+    try:
+        parsed = pd.to_datetime(uniques, format=format, utc=True)
+    except (ValueError, TypeError):
+        # The inferred layout does not hold for every row
+        parsed = pd.to_datetime(uniques, format='mixed', utc=True, errors=errors)
+
+    if naive_tz != 'UTC' and len(uniques):
+        # Strings without an offset were read as UTC wall times, move them to naive_tz
+        naive = ~uniques.str.strip().str.contains(_ZONE_SUFFIX, regex=True)
+        if naive.any():
+            local = parsed[naive].tz_localize(None).tz_localize(naive_tz, ambiguous='NaT',
+                                                               nonexistent='shift_forward')
+            nanos = parsed.asi8.copy()
+            nanos[naive] = local.asi8
+            parsed = pd.to_datetime(nanos, utc=True)
+
+    parsed = _convert_tz(parsed, tz)
+    result = parsed.array.take(codes, allow_fill=True)
+
+    return pd.Series(result, index=values.index, name=values.name)
+
+
+def normalize_timestamps(df, column, tz='UTC', format=None, errors='raise', naive_tz='UTC'):
+    """
+    Replace a timestamp column with parsed datetimes in place.
+
+    Args:
+        df (pd.DataFrame): Frame holding the column
+        column (str): Name of the timestamp column
+        tz (str, optional): Target timezone, None gives naive UTC
+        format (str, optional): strftime format, inferred if omitted
+        errors (str): 'raise' or 'coerce', as in pd.to_datetime
+        naive_tz (str): Timezone of strings without a UTC offset
+
+    Returns:
+        pd.DataFrame: The same frame
+    """
+    df[column] = parse_timestamps(df[column], tz=tz, format=format, errors=errors, naive_tz=naive_tz)
+    return df
+
+
+def ensure_datetime(df, column, tz='UTC', naive_tz='UTC'):
+    """
+    Normalize a timestamp column unless it is already parsed.
+
+    Columns that already hold a datetime dtype are returned untouched, so
+    analysis functions can call this on every entry without reparsing.
+
+    Args:
+        df (pd.DataFrame): Frame holding the column
+        column (str): Name of the timestamp column
+        tz (str, optional): Target timezone used when parsing
+        naive_tz (str): Timezone of strings without a UTC offset
+
+    Returns:
+        pd.Series: The datetime column
+    """
+    if not is_datetime64_any_dtype(df[column].dtype):
+        normalize_timestamps(df, column, tz=tz, naive_tz=naive_tz)
+    return df[column]
+
+
+def exchange_time(values, tz=EXCHANGE_TZ):
+    """
+    Return datetimes on the exchange clock, for deriving hours, weekdays and dates.
+
+    Timestamps are stored in UTC, but calendar fields taken from UTC move
+    evening ET news onto the next day. Naive values carry no zone and are
+    returned as they are, read as wall-clock times.
+
+    Args:
+        values (pd.Series): Parsed datetimes
+        tz (str): Exchange timezone
+
+    Returns:
+        pd.Series: The datetimes converted to tz
+    """
+    values = values if isinstance(values, pd.Series) else pd.Series(values)
+    return values if values.dt.tz is None else values.dt.tz_convert(tz)
+
+
+def _is_date_only(value):
+    """Return True for a bound without a time of day, e.g. '2020-03-31' or a datetime.date"""
+    if isinstance(value, str):
+        return ':' not in value and 'T' not in value.upper()
+    return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+
+
+def utc_bounds(start=None, end=None):
+    """
+    Turn inclusive date bounds into a half-open UTC range [start, stop).
+
+    An end without a time of day covers that whole day, so end='2020-03-31'
+    keeps every row of March 31. Naive bounds are taken as UTC.
+
+    Args:
+        start (optional): Inclusive lower bound
+        end (optional): Inclusive upper bound
+
+    Returns:
+        tuple: (start, stop) UTC Timestamps, None where unbounded
+    """
+    def to_utc(value):
+        return value.tz_localize('UTC') if value.tz is None else value.tz_convert('UTC')
+
+    first = None if start is None else to_utc(pd.Timestamp(start))
+    stop = None
+    if end is not None:
+        step = pd.Timedelta(days=1) if _is_date_only(end) else pd.Timedelta(1, 'ns')
+        stop = to_utc(pd.Timestamp(end)) + step
+    return first, stop
+
+
+def exchange_dates(df, column, tz=EXCHANGE_TZ):
+    """
+    Parse a news timestamp column unless already parsed and return it on the exchange clock.
+
+    Strings without an offset are read as exchange wall-clock times.
+    """
+    return exchange_time(ensure_datetime(df, column, naive_tz=tz), tz)
@@ -0,0 +1,84 @@
+"""
+Tests for the article store module
+"""
+
+import pandas as pd
+import pytest
+from src.article_store import ArticleStore, filter_articles, load_articles
+from src.synthetic import generate_articles
+
+@pytest.fixture
+def articles():
+    """Create synthetic articles over two years"""
+    return generate_articles(20_000, seed=4, start='2020-01-01', end='2022-01-01',
+                             tickers=['AAPL', 'MSFT', 'TSLA', 'AMZN', 'NVDA', 'META'])
+
+@pytest.fixture
+def store(tmp_path, articles):
+    """Write the articles to a store in two appends with different dtypes"""
+    store = ArticleStore(tmp_path / 'store', n_buckets=4)
+    first = articles.iloc[:8000].copy()
+    first['stock'] = first['stock'].astype('category')
+    first['headline'] = first['headline'].astype('string[pyarrow]')
+    store.write(first)
+    store.write(articles.iloc[8000:])
+    return store
+
+def test_round_trip(store, articles):
+    """Test that every article comes back in date order with canonical dtypes"""
+    loaded = store.load()
+    assert len(loaded) == len(articles)
+    assert loaded['date'].is_monotonic_increasing
+    assert str(loaded['date'].dt.tz) == 'UTC'
+    assert isinstance(loaded['stock'].dtype, pd.CategoricalDtype)
+    assert sorted(loaded['url']) == sorted(articles['url'])
+    # Settings are read back from the store metadata
+    assert ArticleStore(store.root).n_buckets == 4
+
+def test_filters_match_in_memory_filter(store, articles):
+    """Test pushed-down date and ticker filters against filter_articles"""
+    query = {'start': '2021-02-01', 'end': pd.Timestamp('2021-04-30 23:59', tz='America/New_York'),
+             'tickers': ['NVDA', 'TSLA']}
+    loaded = store.load(columns=['url', 'stock'], **query)
+    expected = filter_articles(articles, **query)
+
+    assert list(loaded.columns) == ['url', 'stock']
+    assert sorted(loaded['url']) == sorted(expected['url'])
+    assert set(loaded['stock']) == {'NVDA', 'TSLA'}
+    assert store.load(tickers='XYZ').empty
+
+def test_partitions_are_pruned(store):
+    """Test that a query touches only the month and bucket directories it needs"""
+    dataset = store.dataset()
+    all_files = list(dataset.get_fragments())
+    query = list(dataset.get_fragments(filter=store._filter('2021-03-01', '2021-03-31', ['AAPL'])))
+    assert len(query) == 1
+    assert len(all_files) > 24
+    assert 'month=2021-03' in query[0].path
+
+def test_load_articles_sources(tmp_path, store, articles):
+    """Test that CSV and store sources give the same filtered articles"""
+    path = tmp_path / 'articles.csv'
+    articles.to_csv(path, index=False)
+    query = {'start': '2020-06-01', 'end': '2020-06-30', 'tickers': 'AAPL'}
+
+    from_csv = load_articles(path, columns=['url', 'stock'], **query)
+    from_store = load_articles(store.root, columns=['url', 'stock'], **query)
+    assert len(from_csv) > 0
+    assert sorted(from_csv['url']) == sorted(from_store['url'])
+    assert store.tickers().to_dict() == articles['stock'].value_counts().to_dict()
+
+def test_date_only_end_covers_the_day(tmp_path):
+    """Test that a date-only end keeps intraday rows of the end date in the store and in memory"""
+    articles = pd.DataFrame({
+        'url': ['a', 'b', 'c', 'd', 'e'],
+        'stock': 'AAPL',
+        'date': pd.to_datetime(['2020-03-30 12:00', '2020-03-31 00:00', '2020-03-31 10:00',
+                                '2020-03-31 23:59', '2020-04-01 00:00'], utc=True),
+    })
+    store = ArticleStore(tmp_path / 'store', n_buckets=2)
+    store.write(articles)
+
+    for end, expected in [('2020-03-31', ['a', 'b', 'c', 'd']), ('2020-03-31 10:00', ['a', 'b', 'c'])]:
+        assert store.load(columns=['url'], start='2020-03-30', end=end)['url'].tolist() == expected
+        assert filter_articles(articles, start='2020-03-30', end=end)['url'].tolist() == expected
@@ -0,0 +1,112 @@
+"""
+Tests for the bars module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.bars import resample_bars, resample_chunks, resample_store
+from src.price_store import PriceStore
+from src.sentiment_analysis import compute_daily_returns
+from src.technical_indicators import TechnicalIndicators
+
+@pytest.fixture
+def minute_bars():
+    """Create three days of round-the-clock UTC minute bars for two tickers"""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2024-03-08', '2024-03-11', freq='min', tz='UTC', inclusive='left')
+    frames = []
+    for ticker in ['AAPL', 'MSFT']:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, len(dates))))
+        frames.append(pd.DataFrame({
+            'Date': dates, 'ticker': ticker,
+            'Open': close * (1 + rng.normal(0, 0.001, len(dates))),
+            'High': close * 1.002, 'Low': close * 0.998, 'Close': close,
+            'Volume': rng.integers(1, 1000, len(dates)).astype(float),
+        }))
+    return pd.concat(frames).sort_values('Date', kind='stable').reset_index(drop=True)
+
+def pandas_bars(df, rule):
+    """Reference OHLCV bars from pandas resample, aligned in exchange time"""
+    local = df.set_index(df['Date'].dt.tz_convert('America/New_York'))
+    bars = local.groupby('ticker').resample(rule).agg(
+        {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'})
+    return bars.dropna().reset_index()
+
+@pytest.mark.parametrize('rule', ['5min', '1h', '1D'])
+def test_matches_pandas_resample(minute_bars, rule):
+    """Test the segment reductions against pandas resample"""
+    bars = resample_bars(minute_bars, rule, ticker_col='ticker')
+    expected = pandas_bars(minute_bars, rule)
+
+    assert len(bars) == len(expected)
+    np.testing.assert_array_equal(bars['Date'].dt.tz_convert('America/New_York'), expected['Date'])
+    for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
+        np.testing.assert_allclose(bars[col], expected[col])
+    assert bars['ticks'].sum() == len(minute_bars)
+
+def test_chunked_equals_one_shot(minute_bars):
+    """Test that bars merged across chunk boundaries equal the one-shot bars"""
+    one_shot = resample_bars(minute_bars, '1h', ticker_col='ticker')
+    chunks = (minute_bars.iloc[i:i + 777] for i in range(0, len(minute_bars), 777))
+    chunked = pd.concat(resample_chunks(chunks, '1h', ticker_col='ticker'))
+    chunked = chunked.sort_values(['ticker', 'Date'], kind='stable').reset_index(drop=True)
+    pd.testing.assert_frame_equal(chunked, one_shot)
+
+def test_session_bars_and_dst():
+    """Test regular-hours session bars and hourly bars across a DST change"""
+    # 2024-03-10 is the spring-forward Sunday in New York
+    dates = pd.date_range('2024-03-08 13:00', '2024-03-11 22:00', freq='30min', tz='UTC')
+    ticks = pd.DataFrame({'Date': dates, 'Price': np.arange(len(dates), dtype=float)})
+
+    sessions = resample_bars(ticks, 'session', price_col='Price')
+    local = dates.tz_convert('America/New_York')
+    regular = (local.hour * 60 + local.minute >= 570) & (local.hour < 16)
+    assert sessions['ticks'].sum() == regular.sum()
+    assert [d.strftime('%Y-%m-%d %H:%M') for d in sessions['Date'].dt.tz_convert('America/New_York')] == \
+        ['2024-03-08 00:00', '2024-03-09 00:00', '2024-03-10 00:00', '2024-03-11 00:00']
+    # Hourly bars start on the local hour on both sides of the change
+    hourly = resample_bars(ticks, '1h', price_col='Price')
+    assert (hourly['Date'].dt.tz_convert('America/New_York').dt.minute == 0).all()
+    assert (hourly['ticks'] == 2).sum() >= len(hourly) - 2
+
+def test_returns_and_indicators_on_minute_bars(minute_bars, tmp_path):
+    """Test daily returns and indicators of minute data"""
+    aapl = minute_bars[minute_bars['ticker'] == 'AAPL'].drop(columns='ticker')
+    returns = compute_daily_returns(aapl)
+    sessions = resample_bars(aapl, 'session')
+    # Round-the-clock data has a session every day, the first has no return
+    assert returns['Date'].tolist() == sessions['Date'].dt.tz_convert('America/New_York').dt.date.tolist()[1:]
+    np.testing.assert_allclose(returns['return'], sessions['Close'].pct_change().iloc[1:])
+
+    hourly = TechnicalIndicators(aapl.set_index('Date')).resample('1h')
+    assert len(hourly.close) == 72
+    store = PriceStore(tmp_path)
+    store.write('AAPL', aapl.set_index('Date'))
+    from_store = resample_store(store, 'AAPL', '1h', chunksize=1000)
+    np.testing.assert_allclose(from_store['Close'], hourly.close)
+    np.testing.assert_allclose(from_store['High'], hourly.high)
+
+def test_time_column_or_datetime_index_required(minute_bars):
+    """Test that a Date column is carried through and a missing time raises"""
+    aapl = minute_bars[minute_bars['ticker'] == 'AAPL'].drop(columns='ticker')
+    from_column = TechnicalIndicators(aapl.reset_index(drop=True)).resample('1h')
+    from_index = TechnicalIndicators(aapl.set_index('Date')).resample('1h')
+    pd.testing.assert_series_equal(from_column.close, from_index.close)
+    with pytest.raises(TypeError):
+        resample_bars(aapl.drop(columns='Date'), '1h')
+
+def test_daily_returns_with_utc_offsets():
+    """Test that daily dates with an exchange UTC offset are not taken for intraday bars"""
+    close = np.array([100.0, 101.0, 99.0, 102.0])
+    daily = pd.DataFrame({'Date': ['2020-01-02 00:00:00-05:00', '2020-01-03 00:00:00-05:00',
+                                   '2020-01-06 00:00:00-05:00', '2020-01-07 00:00:00-05:00'],
+                          'Close': close})
+    returns = compute_daily_returns(daily)
+    assert returns['Date'].tolist() == [pd.Timestamp(d).date() for d in ['2020-01-03', '2020-01-06', '2020-01-07']]
+    np.testing.assert_allclose(returns['return'], close[1:] / close[:-1] - 1)
+
+    # Intraday bars outside regular hours leave no sessions, and no returns
+    night = pd.DataFrame({'Date': pd.date_range('2020-01-02 02:00', periods=3, freq='h', tz='UTC'),
+                          'Close': close[:3]})
+    assert compute_daily_returns(night).empty
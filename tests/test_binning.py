@@ -0,0 +1,65 @@
+"""
+Tests for the binning module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.binning import bin_counts, weekday_hour_counts
+
+
+@pytest.fixture
+def sample_data():
+    """Create random publication times over 20 days with missing dates"""
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2024-01-01', tz='UTC').value
+    seconds = rng.integers(0, 20 * 86400, 5000)
+    dates = pd.Series(pd.to_datetime(start + seconds * 1_000_000_000, utc=True))
+    dates.iloc[[3, 7]] = pd.NaT
+    return pd.DataFrame({
+        'publication_date': dates,
+        'publisher': rng.choice(['Reuters', 'Benzinga', 'Zacks'], len(dates)),
+    })
+
+
+def test_bin_counts_match_resample(sample_data):
+    """Test counts at several frequencies against resample"""
+    dates = sample_data['publication_date']
+    result = bin_counts(dates, ['D', 'h', '15min'])
+    for freq, counts in result.items():
+        expected = dates.dropna().to_frame().set_index('publication_date').resample(freq).size()
+        pd.testing.assert_series_equal(counts, expected, check_names=False, check_freq=False)
+    assert result['D'].index.freq == 'D'
+
+
+def test_bin_counts_per_group(sample_data):
+    """Test per-publisher daily counts"""
+    counts = bin_counts(sample_data['publication_date'], 'D', groups=sample_data['publisher'])
+    assert counts.columns.tolist() == ['Benzinga', 'Reuters', 'Zacks']
+    valid = sample_data.dropna()
+    expected = valid[valid['publisher'] == 'Zacks'].groupby(
+        valid['publication_date'].dt.floor('D')).size()
+    np.testing.assert_array_equal(counts['Zacks'], expected.reindex(counts.index, fill_value=0))
+
+
+def test_weekday_hour_counts(sample_data):
+    """Test the weekday by hour heatmap against crosstab"""
+    dates = sample_data['publication_date'].dt.tz_convert('America/New_York')
+    heatmap = weekday_hour_counts(dates)
+    assert heatmap.shape == (7, 24)
+    assert heatmap.index[0] == 'Monday'
+    expected = pd.crosstab(dates.dt.day_name(), dates.dt.hour)
+    np.testing.assert_array_equal(heatmap.loc[expected.index, expected.columns], expected)
+    assert heatmap.to_numpy().sum() == dates.notna().sum()
+
+    grouped = weekday_hour_counts(dates, groups=sample_data['publisher'])
+    pd.testing.assert_frame_equal(grouped.groupby(level='day_of_week', sort=False).sum(), heatmap,
+                                  check_names=False)
+
+
+def test_strings_and_empty_input():
+    """Test string timestamps and empty input"""
+    counts = bin_counts(pd.Series(['2024-01-01 10:00:00', '2024-01-03 09:00:00']), 'D')
+    assert counts.tolist() == [1, 0, 1]
+    assert bin_counts(pd.Series([], dtype='datetime64[ns]'), 'h').empty
@@ -0,0 +1,110 @@
+"""
+Tests for the catalog module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.catalog import DatasetCatalog, scan_file
+
+
+@pytest.fixture
+def sample_data(tmp_path):
+    """Write two price files from 2020 and one older file"""
+    dates = pd.bdate_range('2020-01-01', periods=3000)
+    rng = np.random.default_rng(0)
+    for i, ticker in enumerate(['AAPL', 'MSFT']):
+        pd.DataFrame({
+            'Date': dates.strftime('%Y-%m-%d'),
+            'Open': rng.normal(100, 1, len(dates)),
+            'Close': rng.normal(100, 1, len(dates)) + i,
+            'Volume': rng.integers(1000, 2000, len(dates)),
+        }).to_csv(tmp_path / f'{ticker}.csv', index=False)
+    # An older file that ends before 2020
+    pd.DataFrame({
+        'Date': pd.bdate_range('2010-01-01', periods=500).strftime('%Y-%m-%d'),
+        'Open': 1.0, 'Close': 1.0, 'Volume': 1,
+    }).to_csv(tmp_path / 'OLD.csv', index=False)
+    return tmp_path
+
+
+def test_scan_file_estimates_from_sample(sample_data):
+    """Test columns, row estimate and date range from a sampled scan"""
+    entry = scan_file(sample_data / 'AAPL.csv', sample_rows=200)
+    assert entry['columns'] == ['Date', 'Open', 'Close', 'Volume']
+    assert not entry['rows_exact']
+    assert abs(entry['rows'] - 3000) < 100
+    assert entry['date_sorted'] and not entry['dates_exact']
+    assert entry['min_date'] == pd.Timestamp('2020-01-01', tz='UTC')
+    assert entry['max_date'] == pd.Timestamp(pd.bdate_range('2020-01-01', periods=3000)[-1], tz='UTC')
+
+    exact = scan_file(sample_data / 'AAPL.csv', sample_rows=200, exact_rows=True)
+    assert exact['rows'] == 3000 and exact['rows_exact']
+
+
+def test_catalog_is_lazy_and_refreshes(sample_data):
+    """Test that entries are built on first use and rebuilt on change"""
+    catalog = DatasetCatalog(sample_data, sample_rows=100)
+    assert catalog._entries == {}
+    assert catalog.entries.loc['OLD', 'rows'] == 500
+    pd.DataFrame({'Date': ['2011-01-03'], 'Open': [1.0], 'Close': [1.0], 'Volume': [1]}).to_csv(
+        sample_data / 'OLD.csv', index=False)
+    assert catalog.entry('OLD')['rows'] == 1
+
+
+def test_load_projection_and_date_pushdown(sample_data):
+    """Test column projection, date filtering and file skipping"""
+    catalog = DatasetCatalog(sample_data, sample_rows=100)
+    df = catalog.load('AAPL', columns=['Close'], start='2021-01-01', end='2021-12-31', chunksize=500)
+    full = pd.read_csv(sample_data / 'AAPL.csv')
+    in_range = full['Date'].between('2021-01-01', '2021-12-31')
+    assert df.columns.tolist() == ['Close']
+    np.testing.assert_allclose(df['Close'], full.loc[in_range, 'Close'])
+    # The old file is skipped from its catalog range
+    assert catalog.load('OLD', columns=['Close'], start='2020-01-01').empty
+
+
+def test_load_many_adds_categorical_ticker(sample_data):
+    """Test loading several files with a categorical ticker column"""
+    catalog = DatasetCatalog(sample_data, sample_rows=100)
+    df = catalog.load_many(['AAPL', 'MSFT', 'OLD'], columns=['Date', 'Close'],
+                           start='2020-06-01', max_workers=2)
+    assert isinstance(df['ticker'].dtype, pd.CategoricalDtype)
+    assert df['ticker'].cat.categories.tolist() == ['AAPL', 'MSFT', 'OLD']
+    expected = (pd.bdate_range('2020-01-01', periods=3000) >= '2020-06-01').sum()
+    assert df['ticker'].value_counts().to_dict() == {'AAPL': expected, 'MSFT': expected, 'OLD': 0}
+    assert str(df['Date'].dt.tz) == 'UTC'
+    assert df['Date'].min() == pd.Timestamp('2020-06-01', tz='UTC')
+
+
+def test_date_only_end_covers_the_day(tmp_path):
+    """Test that a date-only end keeps intraday rows of the end date"""
+    pd.DataFrame({'Date': ['2020-03-30 15:00', '2020-03-31 10:00', '2020-04-01 09:00'],
+                  'Close': [1.0, 2.0, 3.0]}).to_csv(tmp_path / 'A.csv', index=False)
+    catalog = DatasetCatalog(tmp_path)
+    assert catalog.load('A', start='2020-03-31', end='2020-03-31')['Close'].tolist() == [2.0]
+    assert catalog.load('A', end='2020-03-31 10:00')['Close'].tolist() == [1.0, 2.0]
+
+
+def test_load_many_keeps_stacked_ticker_column(sample_data):
+    """Test that a file with its own ticker column keeps its tickers"""
+    pd.DataFrame({'Date': ['2020-06-01', '2020-06-01'], 'ticker': ['IBM', 'AAPL'],
+                  'Close': [5.0, 6.0]}).to_csv(sample_data / 'STACKED.csv', index=False)
+    catalog = DatasetCatalog(sample_data, sample_rows=100)
+    df = catalog.load_many(['AAPL', 'STACKED'], start='2020-06-01', end='2020-06-01')
+    assert df.columns[0] == 'ticker'
+    assert df['ticker'].cat.categories.tolist() == ['AAPL', 'STACKED', 'IBM']
+    assert df['ticker'].tolist() == ['AAPL', 'IBM', 'AAPL']
+
+
+def test_sample_pruning_is_opt_in(tmp_path):
+    """Test that files are pruned by their sampled dates only on request"""
+    # Both ends are from 2010, the middle holds 2020 rows
+    dates = ['2010-01-04'] * 50 + ['2020-06-01'] * 10 + ['2010-01-05'] * 50
+    pd.DataFrame({'Date': dates, 'Close': 1.0}).to_csv(tmp_path / 'MIXED.csv', index=False)
+    assert len(DatasetCatalog(tmp_path, sample_rows=20).load('MIXED', start='2020-01-01')) == 10
+    pruned = DatasetCatalog(tmp_path, sample_rows=20, prune_by_sample=True)
+    assert pruned.load('MIXED', start='2020-01-01').empty
+    # A fully sampled file has exact bounds
+    assert DatasetCatalog(tmp_path, sample_rows=500).entry('MIXED')['dates_exact']
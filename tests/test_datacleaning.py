@@ -0,0 +1,133 @@
+"""
+Tests for the data cleaning module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.datacleaning import (
+    DataCleaning,
+    CleaningPlan,
+    fill_panel,
+    align_to_calendar,
+    exchange_calendar
+)
+from src.outlier import OutlierDetection
+
+@pytest.fixture
+def sample_data():
+    """Create sample price data with NaN, outliers and duplicates"""
+    rng = np.random.default_rng(11)
+    n = 500
+    data = {
+        'Date': pd.date_range('2024-01-01', periods=n, freq='D').strftime('%Y-%m-%d'),
+        'Close': rng.normal(100, 5, n),
+        'Volume': rng.normal(1e6, 1e5, n)
+    }
+    df = pd.DataFrame(data)
+    df.loc[[3, 40, 41], 'Close'] = np.nan
+    df.loc[[7, 90], 'Close'] = [400, -100]
+    df.loc[100:104] = df.loc[200:204].to_numpy()
+    return df
+
+def test_plan_matches_eager_steps(sample_data):
+    """Test that the merged plan gives the same rows as eager cleaning"""
+    eager = DataCleaning(sample_data.copy())
+    eager.remove_nan_values(['Close'])
+    eager.df = OutlierDetection(eager.df).remove_outliers('iqr', ['Close', 'Volume'])
+    eager.remove_duplicates()
+    eager.reset_index()
+
+    planned = (DataCleaning(sample_data.copy()).plan()
+               .remove_nan_values(['Close'])
+               .remove_outliers('iqr', ['Close', 'Volume'])
+               .remove_duplicates()
+               .reset_index()
+               .execute())
+
+    pd.testing.assert_frame_equal(planned, eager.df)
+
+def test_plan_records_steps_lazily(sample_data):
+    """Test that nothing runs before execute"""
+    cleaner = DataCleaning(sample_data)
+    plan = cleaner.plan().remove_nan_values(['Close']).remove_duplicates()
+
+    assert isinstance(plan, CleaningPlan)
+    assert len(cleaner.df) == len(sample_data)
+    assert plan.report is None
+
+def test_plan_report(sample_data):
+    """Test that execute reports rows and peak memory"""
+    cleaner = DataCleaning(sample_data)
+    plan = (cleaner.plan()
+            .remove_nan_values(['Close'])
+            .convert_to_datetime('Date')
+            .fill_missing_values('ffill'))
+    df = plan.execute()
+
+    assert plan.report['rows_in'] == 500
+    assert plan.report['rows_out'] == 497
+    assert plan.report['peak_bytes'] > 0
+    assert pd.api.types.is_datetime64_any_dtype(df['Date'])
+    assert cleaner.df is df
+
+def test_plan_rejects_invalid_fill(sample_data):
+    """Test invalid fill settings fail when recorded"""
+    with pytest.raises(ValueError):
+        DataCleaning(sample_data).plan().fill_missing_values('median')
+
+def test_remove_duplicates_hash_matches_exact(sample_data):
+    """Test fingerprint deduplication against drop_duplicates"""
+    exact = DataCleaning(sample_data.copy()).remove_duplicates()
+    hashed = DataCleaning(sample_data.copy()).remove_duplicates(method='hash')
+
+    pd.testing.assert_frame_equal(hashed, exact)
+    assert len(hashed) == len(sample_data) - 5
+    planned = DataCleaning(sample_data.copy()).plan().remove_duplicates(method='hash').execute()
+    pd.testing.assert_frame_equal(planned, exact)
+
+@pytest.fixture
+def panel_data():
+    """Create a stacked two-ticker panel with gaps"""
+    data = {
+        'ticker': ['MSFT'] * 4 + ['AAPL'] * 4,
+        'Date': ['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05'] * 2,
+        'Close': [10.0, np.nan, np.nan, 16.0, np.nan, 20.0, np.nan, 22.0]
+    }
+    return pd.DataFrame(data)
+
+def test_fill_panel_does_not_cross_tickers(panel_data):
+    """Test group-aware forward fill against groupby().ffill()"""
+    filled = fill_panel(panel_data, method='ffill')
+    expected = (panel_data.sort_values(['ticker', 'Date'])
+                .groupby('ticker')['Close'].ffill().to_numpy())
+
+    np.testing.assert_array_equal(filled['Close'].to_numpy(), expected)
+    # AAPL's first bar has nothing before it, MSFT's values never leak in
+    assert np.isnan(filled['Close'].iloc[0])
+
+def test_fill_panel_limit_and_time(panel_data):
+    """Test fill limits and linear time interpolation"""
+    limited = fill_panel(panel_data, method='ffill', limit=1)
+    msft = limited[limited['ticker'] == 'MSFT']['Close'].to_numpy()
+    np.testing.assert_array_equal(msft, [10.0, 10.0, np.nan, 16.0])
+
+    interpolated = fill_panel(panel_data, method='time')
+    msft = interpolated[interpolated['ticker'] == 'MSFT']['Close'].to_numpy()
+    np.testing.assert_allclose(msft, [10.0, 12.0, 14.0, 16.0])
+
+    backward = fill_panel(panel_data, method='bfill')
+    assert backward['Close'].iloc[0] == 20.0
+
+def test_align_to_calendar(panel_data):
+    """Test reindexing onto sessions with a missing day"""
+    gappy = panel_data.drop(index=[2, 6])
+    aligned = align_to_calendar(gappy, calendar=exchange_calendar('2024-01-01', '2024-01-31'))
+
+    assert len(aligned) == 8
+    assert aligned['Close'].isna().sum() == 4
+
+    cleaner = DataCleaning(gappy)
+    cleaner.align_to_calendar()
+    df = cleaner.fill_missing_values('ffill', group_col='ticker')
+    assert df['Close'].isna().sum() == 1
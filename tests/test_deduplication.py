@@ -0,0 +1,69 @@
+"""
+Tests for the duplicate detection module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.deduplication import (
+    row_fingerprints,
+    duplicate_mask,
+    minhash_signatures,
+    near_duplicate_groups,
+    near_duplicate_mask
+)
+
+@pytest.fixture
+def sample_data():
+    """Create sample articles with exact and syndicated duplicates"""
+    data = {
+        'headline': [
+            'Apple raises guidance after strong iPhone sales',
+            'Tesla misses delivery estimates for the quarter',
+            'Apple raises guidance after strong iPhone sales',
+            'APPLE raises guidance after strong iPhone sales!',
+            'Apple raises guidance after strong iPhone sales, shares jump',
+            'Nvidia price target raised by analysts',
+            None
+        ],
+        'stock': ['AAPL', 'TSLA', 'AAPL', 'AAPL', 'AAPL', 'NVDA', 'NVDA'],
+        'date': ['2024-01-02'] * 7
+    }
+    return pd.DataFrame(data)
+
+def test_row_fingerprints(sample_data):
+    """Test that equal rows get equal 64-bit fingerprints"""
+    hashes = row_fingerprints(sample_data)
+
+    assert hashes.dtype == np.uint64
+    assert hashes[0] == hashes[2]
+    assert hashes[0] != hashes[3]
+
+def test_duplicate_mask_matches_pandas(sample_data):
+    """Test fingerprint duplicates against DataFrame.duplicated"""
+    assert (duplicate_mask(sample_data) == sample_data.duplicated().to_numpy()).all()
+
+    keys = ['stock', 'date']
+    expected = sample_data.duplicated(subset=keys).to_numpy()
+    assert (duplicate_mask(sample_data, keys) == expected).all()
+
+def test_minhash_similarity(sample_data):
+    """Test that signature agreement tracks shingle overlap"""
+    signatures = minhash_signatures(sample_data['headline'], num_perm=128)
+
+    assert signatures.shape == (7, 128)
+    assert (signatures[0] == signatures[3]).all()
+    assert (signatures[0] == signatures[4]).mean() > 0.5
+    assert (signatures[0] == signatures[1]).mean() < 0.2
+
+def test_near_duplicate_groups(sample_data):
+    """Test that syndicated rewrites fall into one group"""
+    groups = near_duplicate_groups(sample_data['headline'], threshold=0.6)
+
+    assert list(groups[[0, 2, 3, 4]]) == [0, 0, 0, 0]
+    assert groups[1] == 1
+    assert groups[5] == 5
+    assert groups[6] == 6
+
+    mask = near_duplicate_mask(sample_data['headline'], threshold=0.6)
+    assert mask.sum() == 3
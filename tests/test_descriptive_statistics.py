@@ -8,7 +8,8 @@ import numpy as np
 from src.analytics.descriptive_statistics import (
     analyze_headline_lengths,
     analyze_publishers,
-    analyze_publication_dates
+    analyze_publication_dates,
+    analyze_text_statistics
 )
 
 @pytest.fixture
@@ -89,4 +90,13 @@ def test_analyze_publication_dates(sample_data):
     
     # Check if counts are correct
     assert daily_counts['Monday'] == 2  # Two articles on Monday
-    assert daily_counts['Tuesday'] == 2  # Two articles on Tuesday 
\ No newline at end of file
+    assert daily_counts['Tuesday'] == 2  # Two articles on Tuesday 
+
+def test_analyze_text_statistics(sample_data):
+    """Test text statistics overall and per publisher"""
+    summary = analyze_text_statistics(sample_data)
+    assert summary.loc['max', 'token_count'] == 11
+
+    by_publisher = analyze_text_statistics(sample_data, by='publisher')
+    assert by_publisher.loc['Publisher A', 'article_count'] == 2
+    assert by_publisher.loc['Publisher A', 'avg_token_count'] == 2
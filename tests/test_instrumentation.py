@@ -0,0 +1,94 @@
+"""
+Tests for the instrumentation module
+"""
+
+import json
+import pstats
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.instrumentation import (
+    enable_metrics,
+    disable_metrics,
+    instrument,
+    track,
+    profile
+)
+
+@pytest.fixture
+def metrics_path(tmp_path):
+    """Enable metrics for one test and return the records file"""
+    path = tmp_path / 'metrics.jsonl'
+    enable_metrics(path)
+    yield path
+    disable_metrics()
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def read_records(path):
+    """Load the JSON lines written so far"""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+@instrument
+def count_rows(df):
+    """Instrumented stand-in for an analysis function"""
+    return len(df)
+
+def test_instrument_records_rows(metrics_path):
+    """Test that decorated calls write one record with rows and throughput"""
+    df = pd.DataFrame({'x': np.arange(1000)})
+    assert count_rows(df) == 1000
+
+    record, = read_records(metrics_path)
+    assert record['stage'].endswith('count_rows')
+    assert record['rows'] == 1000
+    assert record['wall_s'] >= 0 and record['cpu_s'] >= 0
+    assert record['rows_per_s'] > 0
+
+def test_disabled_is_pass_through():
+    """Test that nothing is recorded until metrics are enabled"""
+    with track('noop') as record:
+        record['rows'] = 5
+    assert count_rows(pd.DataFrame({'x': [1, 2]})) == 2
+    assert 'wall_s' not in record
+
+def test_track_nested_and_errors(metrics_path):
+    """Test nested stages, tracemalloc peaks and failed stages"""
+    tracemalloc.start()
+    with track('outer') as outer:
+        with track('inner', rows=10):
+            buffer = np.ones(2_000_000)
+            del buffer
+        outer['rows'] = 20
+    with pytest.raises(ValueError):
+        with track('failing'):
+            raise ValueError('boom')
+
+    inner, outer, failing = read_records(metrics_path)
+    assert inner['stage'] == 'inner' and outer['rows'] == 20
+    # The 16 MB buffer is freed inside inner but still counts towards outer's peak
+    assert inner['tracemalloc_peak_mb'] >= 15
+    assert outer['tracemalloc_peak_mb'] >= inner['tracemalloc_peak_mb']
+    assert failing['error'] == 'ValueError'
+
+@pytest.mark.parametrize('mode', ['cprofile', 'sample'])
+def test_profile_writes_output(tmp_path, mode):
+    """Test that both profiler modes write loadable output"""
+    def busy():
+        end = time.perf_counter() + 0.2
+        while time.perf_counter() < end:
+            sum(range(1000))
+
+    with profile(tmp_path / 'run', mode=mode) as output:
+        busy()
+
+    if mode == 'cprofile':
+        stats = pstats.Stats(output)
+        assert any(func[2] == 'busy' for func in stats.stats)
+    else:
+        lines = open(output).read().splitlines()
+        assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+        assert any('busy' in line for line in lines)
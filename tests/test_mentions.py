@@ -0,0 +1,87 @@
+"""
+Tests for the mentions module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.mentions import MentionIndex, encode_varints, decode_varints
+from src.synthetic import generate_articles
+
+@pytest.fixture
+def sample_data():
+    """Create sample headlines with symbol, cashtag and alias mentions"""
+    return pd.DataFrame({
+        'headline': [
+            'Nvidia and AMD rally; $A up',
+            'Advanced Micro Devices beats, on NVDA news',
+            'On the move: A look at chip stocks',
+            None,
+            'Bank of America Merrill names Bank of America Corp analyst',
+            'advanced micro devices shares slip',
+        ],
+        'date': pd.date_range('2024-01-01', periods=6, tz='America/New_York'),
+    })
+
+@pytest.fixture
+def aliases():
+    """Company-name aliases, two of them overlapping"""
+    return {
+        'NVDA': ['Nvidia'],
+        'AMD': ['Advanced Micro Devices'],
+        'BAC': ['Bank of America'],
+        'MER': ['America Merrill'],
+    }
+
+def test_varint_round_trip():
+    """Test that varints round-trip across byte-length boundaries"""
+    values = np.array([0, 1, 127, 128, 300, 2 ** 14, 2 ** 21 - 1, 2 ** 28, 2 ** 34 - 1])
+    encoded = encode_varints(values)
+    assert encoded.dtype == np.uint8 and len(encoded) == 1 + 1 + 1 + 2 + 2 + 3 + 3 + 5 + 5
+    assert decode_varints(encoded).tolist() == values.tolist()
+
+def test_build_matches_symbols_and_aliases(sample_data, aliases):
+    """Test case-sensitive symbols, cashtags, aliases and overlapping patterns"""
+    index = MentionIndex.build(sample_data['headline'], tickers=['A', 'ON'], aliases=aliases)
+
+    assert index.rows('NVDA').tolist() == [0, 1]
+    assert index.rows('AMD').tolist() == [0, 1, 5]
+    # 'A' is too short to match as a word, but matches as a cashtag
+    assert index.rows('A').tolist() == [0]
+    # The words 'on' and 'On' are not the ticker ON
+    assert index.rows('ON').tolist() == []
+    # 'Bank of America Merrill' contains both overlapping aliases
+    assert index.rows('BAC').tolist() == [4]
+    assert index.rows('MER').tolist() == [4]
+    assert index.rows('XYZ').tolist() == []
+    assert index.rows_any(['NVDA', 'BAC']).tolist() == [0, 1, 4]
+
+def test_dotted_symbols_and_cashtags():
+    """Test that share-class symbols match as words and as cashtags"""
+    headlines = pd.Series(['$BRK.B slips', 'BRK.B and BRK.A', 'BRK alone'])
+    index = MentionIndex.build(headlines, tickers=['BRK.B', 'BRK.A'])
+    assert index.rows('BRK.B').tolist() == [0, 1]
+    assert index.rows('BRK.A').tolist() == [1]
+
+def test_select_with_date_bounds(sample_data, aliases):
+    """Test filtered retrieval by ticker and date range"""
+    index = MentionIndex.build(sample_data['headline'], aliases=aliases)
+    selected = index.select(sample_data, 'AMD', start='2024-01-02', end='2024-01-05')
+    assert selected.index.tolist() == [1]
+    with pytest.raises(ValueError):
+        index.select(sample_data.iloc[:3], 'AMD')
+
+def test_matches_stock_column_and_persists(tmp_path):
+    """Test posting lists against the stock column of synthetic articles"""
+    tickers = ['AAPL', 'MSFT', 'TSLA', 'AMZN', 'NVDA']
+    df = generate_articles(5000, seed=2, tickers=tickers)
+    index = MentionIndex.build(df['headline'], tickers=tickers)
+
+    for ticker in tickers:
+        assert index.rows(ticker).tolist() == np.flatnonzero(df['stock'] == ticker).tolist()
+    assert index.counts().sum() == len(df)
+    assert index.nbytes() < 2 * len(df)
+
+    index.save(tmp_path / 'mentions.pkl')
+    loaded = MentionIndex.load(tmp_path / 'mentions.pkl')
+    pd.testing.assert_frame_equal(loaded.pairs(), index.pairs())
@@ -0,0 +1,137 @@
+"""
+Tests for the outlier detection module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from scipy.stats import zscore
+from src.outlier import OutlierDetection, iter_rolling_outliers
+
+@pytest.fixture
+def sample_data():
+    """Create sample price data with a few injected outliers"""
+    rng = np.random.default_rng(42)
+    data = {
+        'Close': rng.normal(100, 5, 200),
+        'Volume': rng.normal(1e6, 1e5, 200),
+        'ticker': ['AAPL'] * 200
+    }
+    df = pd.DataFrame(data)
+    df.loc[10, 'Close'] = 500
+    df.loc[20, 'Volume'] = 1e8
+    df.loc[30, 'Close'] = np.nan
+    return df
+
+def test_outlier_mask_shape(sample_data):
+    """Test mask and summary layout"""
+    mask, summary = OutlierDetection(sample_data).outlier_mask('iqr')
+
+    assert mask.shape == (200, 2)
+    assert list(mask.columns) == ['Close', 'Volume']
+    assert mask.dtypes.eq(bool).all()
+    assert {'lower_bound', 'upper_bound', 'outliers'} <= set(summary.columns)
+    assert summary.loc['Close', 'outliers'] == mask['Close'].sum()
+    assert not mask.loc[30, 'Close']
+
+def test_iqr_outliers_match_pandas_quantiles(sample_data):
+    """Test IQR bounds against per-column pandas quantiles"""
+    outliers = OutlierDetection(sample_data).iqr_outliers(['Close'])
+
+    q1, q3 = sample_data['Close'].quantile([0.25, 0.75])
+    iqr = q3 - q1
+    expected = sample_data[(sample_data['Close'] < q1 - 1.5 * iqr) |
+                           (sample_data['Close'] > q3 + 1.5 * iqr)]
+    assert outliers['Close'].index.equals(expected.index)
+    assert 10 in outliers['Close'].index
+
+def test_z_score_outliers_match_scipy(sample_data):
+    """Test z-score flags against scipy.stats.zscore"""
+    outliers = OutlierDetection(sample_data).z_score_outliers(threshold=3)
+
+    for col in ['Close', 'Volume']:
+        z_scores = np.abs(zscore(sample_data[col], nan_policy='omit'))
+        expected = sample_data[z_scores > 3]
+        assert outliers[col].index.equals(expected.index)
+
+def test_remove_outliers(sample_data):
+    """Test combined-mask removal"""
+    detector = OutlierDetection(sample_data)
+    mask, _ = detector.outlier_mask('iqr')
+
+    cleaned = detector.remove_outliers('iqr')
+
+    assert len(cleaned) == len(sample_data) - mask.any(axis=1).sum()
+    assert 10 not in cleaned.index
+    assert 20 not in cleaned.index
+
+def test_invalid_method(sample_data):
+    """Test that unknown methods raise"""
+    with pytest.raises(ValueError):
+        OutlierDetection(sample_data).remove_outliers('mad')
+
+@pytest.fixture
+def drifting_prices():
+    """Create two tickers whose prices drift strongly over time"""
+    n = 600
+    rng = np.random.default_rng(0)
+    frames = []
+    for ticker, growth in [('AAPL', 0.004), ('MSFT', 0.002)]:
+        close = 100 * np.exp(growth * np.arange(n)) * (1 + rng.normal(0, 0.01, n))
+        frames.append(pd.DataFrame({'ticker': ticker, 'Close': close}))
+    df = pd.concat(frames, ignore_index=True)
+    df.loc[300, 'Close'] *= 1.4
+    return df
+
+def test_rolling_mask_ignores_drift(drifting_prices):
+    """Test that rolling bounds flag the spike but not the trend"""
+    detector = OutlierDetection(drifting_prices)
+
+    global_mask, _ = detector.outlier_mask('z_score', ['Close'], threshold=2)
+    rolling_mask, summary = detector.rolling_mask('mad', ['Close'], window=20, group_col='ticker')
+
+    assert rolling_mask.loc[300, 'Close']
+    assert summary.loc['Close', 'outliers'] < 10
+    assert global_mask['Close'].sum() > summary.loc['Close', 'outliers']
+
+def test_rolling_iqr_restarts_per_group(drifting_prices):
+    """Test that windows do not span ticker boundaries"""
+    mask, _ = OutlierDetection(drifting_prices).rolling_mask(
+        'iqr', ['Close'], window=30, group_col='ticker'
+    )
+
+    # The first window-1 bars of each ticker have no bounds yet
+    assert not mask['Close'].iloc[:29].any()
+    assert not mask['Close'].iloc[600:629].any()
+    assert mask.loc[300, 'Close']
+
+def test_grouped_mask(drifting_prices):
+    """Test per-ticker static bounds"""
+    mask, summary = OutlierDetection(drifting_prices).grouped_mask('ticker', 'iqr', ['Close'])
+
+    assert mask.shape == (1200, 1)
+    assert set(summary.index) == {'AAPL', 'MSFT'}
+
+def test_grouped_mask_missing_group(drifting_prices):
+    """Test that a row without a group label leaves the other groups' bounds alone"""
+    unlabeled = drifting_prices.copy()
+    unlabeled.loc[0, 'ticker'] = None
+    expected, _ = OutlierDetection(drifting_prices.iloc[1:]).grouped_mask('ticker', 'iqr', ['Close'])
+    mask, summary = OutlierDetection(unlabeled).grouped_mask('ticker', 'iqr', ['Close'])
+
+    assert not mask.loc[0, 'Close']
+    pd.testing.assert_frame_equal(mask.iloc[1:], expected)
+    assert set(summary.index) == {'AAPL', 'MSFT'}
+
+def test_iter_rolling_outliers_matches_in_memory(drifting_prices):
+    """Test that streaming chunks give the same mask as one pass"""
+    expected, _ = OutlierDetection(drifting_prices).rolling_mask(
+        'mad', ['Close'], window=40, group_col='ticker'
+    )
+
+    chunks = (drifting_prices.iloc[i:i + 250] for i in range(0, len(drifting_prices), 250))
+    streamed = pd.concat(mask for _, mask in iter_rolling_outliers(
+        chunks, 'mad', ['Close'], window=40, group_col='ticker'
+    ))
+
+    assert streamed.equals(expected)
@@ -0,0 +1,64 @@
+"""
+Tests for the phrases module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+from src.phrases import PhraseMiner
+from src.synthetic import generate_articles
+
+@pytest.fixture(scope='module')
+def articles():
+    """Create synthetic articles"""
+    return generate_articles(5000, seed=11, tickers=['AAPL', 'MSFT', 'TSLA', 'AMZN'])
+
+@pytest.fixture(scope='module')
+def miner(articles):
+    """Fit a phrase miner in several chunks"""
+    return PhraseMiner(chunksize=1500).fit(articles['headline'])
+
+def test_top_phrases_match_exact_counts(articles, miner):
+    """Test that hashed counts equal exact n-gram counts"""
+    top = miner.top_phrases(10, min_n=2)
+    vectorizer = CountVectorizer(ngram_range=(1, 3))
+    counts = vectorizer.fit_transform(articles['headline'])
+    exact = pd.Series(np.asarray(counts.sum(axis=0)).ravel(), index=vectorizer.get_feature_names_out())
+    doc_freq = pd.Series(np.asarray((counts > 0).sum(axis=0)).ravel(), index=exact.index)
+
+    assert (top['n_words'] >= 2).all()
+    assert top['count'].tolist() == exact[top['phrase']].tolist()
+    assert top['doc_freq'].tolist() == doc_freq[top['phrase']].tolist()
+    assert top['count'].is_monotonic_decreasing
+
+def test_collocation_scores(miner):
+    """Test PMI ordering and the normalized PMI range"""
+    top = miner.top_phrases(20, min_n=2, sort_by='npmi')
+    assert top['npmi'].is_monotonic_decreasing
+    assert (top['npmi'] <= 1 + 1e-9).all() and (top['npmi'] > 0).all()
+    assert (top['pmi'] > 0).all()
+    for phrase in top['phrase']:
+        words = phrase.split(' ')
+        assert words[0] not in miner.stop_words and words[-1] not in miner.stop_words
+
+def test_group_tfidf_matches_groupby(articles, miner):
+    """Test per-group counts against exact per-group counts"""
+    result = miner.group_tfidf(articles['stock'], n=3, min_n=2)
+    assert sorted(result['group'].unique()) == sorted(articles['stock'].unique())
+    assert result.groupby('group').size().eq(3).all()
+
+    for row in result.itertuples():
+        headlines = articles.loc[articles['stock'] == row.group, 'headline']
+        exact = CountVectorizer(ngram_range=(1, 3), vocabulary=[row.phrase]).transform(headlines)
+        assert row.count == exact.sum()
+    # Scores are L2-normalized per group, so the leading ones are at most 1
+    assert result['tfidf'].between(0, 1).all()
+
+def test_names_resolve_buckets(miner):
+    """Test that buckets resolve back to phrases and unseen buckets to None"""
+    phrases = ['stocks to watch', 'shares', 'price target']
+    seen = [p for p in phrases if miner.term_counts_[miner.buckets([p])[0]] > 0]
+    assert miner.names(miner.buckets(seen)) == seen
+    unused = np.flatnonzero(miner.term_counts_ == 0)[0]
+    assert miner.names([unused]) == [None]
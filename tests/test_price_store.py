@@ -0,0 +1,90 @@
+"""
+Tests for the price_store module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.price_store import PriceStore
+from src.sentiment_analysis import compute_daily_returns
+from src.technical_indicators import TechnicalIndicators
+
+
+@pytest.fixture
+def sample_data():
+    """Create 300 daily bars of a random-walk price"""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2020-01-01', periods=300)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+    return pd.DataFrame({
+        'Date': dates.strftime('%Y-%m-%d'),
+        'Open': close * 0.99,
+        'High': close * 1.01,
+        'Low': close * 0.98,
+        'Close': close,
+        'Volume': rng.integers(1_000, 5_000, len(dates)),
+    })
+
+
+def test_write_and_zero_copy_slice(sample_data, tmp_path):
+    """Test sorted writes and read-only memory-mapped date slices"""
+    store = PriceStore(tmp_path)
+    # Rows out of order are sorted on write
+    assert store.write('AAPL', sample_data.iloc[::-1]) == 300
+    assert store.tickers() == ['AAPL']
+    bars = store.columns('AAPL', start='2020-03-02', end='2020-03-31')
+    assert isinstance(bars['Close'], np.memmap)
+    assert not bars['Close'].flags.writeable
+    expected = sample_data[sample_data['Date'].between('2020-03-02', '2020-03-31')]
+    np.testing.assert_array_equal(bars['Close'], expected['Close'])
+    assert bars['Volume'].dtype == np.int64
+
+
+def test_rewrite_drops_stale_fields(sample_data, tmp_path):
+    """Test that rewriting a ticker with fewer fields removes the old field files"""
+    store = PriceStore(tmp_path)
+    store.write('AAPL', sample_data)
+    store.write('AAPL', sample_data.iloc[:50][['Date', 'Close']])
+    assert store.fields('AAPL') == ['Close']
+    assert not (tmp_path / 'AAPL' / 'Volume.npy').exists()
+    assert len(store.frame('AAPL')) == 50
+
+
+def test_append_in_place_skips_known_bars(sample_data, tmp_path):
+    """Test that appends only add bars after the stored ones"""
+    store = PriceStore(tmp_path)
+    store.write('AAPL', sample_data.iloc[:200])
+    assert store.append('AAPL', sample_data.iloc[150:]) == 100
+    assert store.append('AAPL', sample_data.iloc[250:]) == 0
+    frame = store.frame('AAPL')
+    assert len(frame) == 300
+    np.testing.assert_array_equal(frame['Close'], sample_data['Close'])
+    assert frame.index.is_monotonic_increasing
+
+
+def test_append_overwrites_interrupted_tail(sample_data, tmp_path):
+    """Test that an append repairs a tail left by an interrupted one"""
+    store = PriceStore(tmp_path)
+    store.write('AAPL', sample_data.iloc[:100])
+    # Simulate an append that wrote Close but died before the date index
+    with open(tmp_path / 'AAPL' / 'Close.npy', 'ab') as handle:
+        handle.write(np.zeros(5).tobytes())
+    store.append('AAPL', sample_data.iloc[100:])
+    np.testing.assert_array_equal(np.load(tmp_path / 'AAPL' / 'Close.npy'), sample_data['Close'])
+
+
+def test_indicators_and_returns_on_arrays(sample_data, tmp_path):
+    """Test indicators and returns on store arrays against a frame"""
+    store = PriceStore(tmp_path)
+    store.write('AAPL', sample_data)
+    bars = store.columns('AAPL')
+    from_arrays = TechnicalIndicators(bars)
+    from_frame = TechnicalIndicators(store.frame('AAPL'))
+    pd.testing.assert_series_equal(from_arrays.moving_average(20), from_frame.moving_average(20))
+    pd.testing.assert_frame_equal(
+        from_arrays.moving_average_convergence_divergence(),
+        from_frame.moving_average_convergence_divergence()
+    )
+    returns = compute_daily_returns(bars)
+    np.testing.assert_allclose(returns['return'], sample_data['Close'].pct_change().iloc[1:])
@@ -0,0 +1,92 @@
+"""
+Tests for the profiling module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.profiling import HyperLogLog, reservoir_sample, profile_frame, profile_csv
+
+
+@pytest.fixture
+def sample_data():
+    """Create headlines with repeats, tickers with nulls and ratings"""
+    rng = np.random.default_rng(0)
+    n = 5000
+    return pd.DataFrame({
+        'headline': [f'headline {i % 1500}' for i in range(n)],
+        'stock': rng.choice(['AAPL', 'MSFT', 'NVDA', None], n),
+        'rating': rng.normal(3, 1, n),
+    })
+
+
+def test_hyperloglog_estimate_and_merge():
+    """Test HyperLogLog estimates, merging and null handling"""
+    left = HyperLogLog().update(pd.Series(np.arange(60_000)))
+    right = HyperLogLog().update(pd.Series(np.arange(40_000, 100_000)))
+    assert abs(left.count() - 60_000) / 60_000 < 0.03
+    assert abs(left.merge(right).count() - 100_000) / 100_000 < 0.03
+    assert HyperLogLog().update(pd.Series(['a', 'b', 'a', None])).count() == 2
+
+
+def test_reservoir_sample_is_uniform():
+    """Test that the reservoir sample covers the stream evenly"""
+    chunks = (pd.DataFrame({'x': np.arange(start, start + 1000)}) for start in range(0, 10_000, 1000))
+    sample = reservoir_sample(chunks, 2000, seed=1)
+    assert len(sample) == 2000
+    assert sample['x'].is_unique
+    # Every tenth of the stream should be represented about equally
+    counts = np.bincount(sample['x'] // 1000, minlength=10)
+    assert counts.min() > 130 and counts.max() < 270
+
+
+def test_profile_frame_exact(sample_data):
+    """Test exact counts and statistics of a full profile"""
+    report = profile_frame(sample_data, n_jobs=2)
+    describe = report['describe']
+    assert report['info']['rows'] == len(sample_data)
+    assert describe.loc['headline', 'distinct'] == 1500
+    assert describe.loc['stock', 'nulls'] == sample_data['stock'].isna().sum()
+    assert describe.loc['rating', 'mean'] == pytest.approx(sample_data['rating'].mean())
+    assert report['duplicates'] == sample_data.duplicated().sum()
+
+
+def test_profile_frame_fast_mode(sample_data):
+    """Test sampled statistics with full-data null counts"""
+    report = profile_frame(sample_data, sample_size=1000)
+    describe = report['describe']
+    assert report['sampled_rows'] == 1000
+    # Null counts still cover every row, distinct counts are approximate
+    assert describe.loc['stock', 'nulls'] == sample_data['stock'].isna().sum()
+    assert abs(describe.loc['headline', 'distinct'] - 1500) < 50
+    assert describe.loc['rating', 'mean'] == pytest.approx(3, abs=0.15)
+
+
+def test_profile_csv_matches_frame(sample_data, tmp_path):
+    """Test that a streamed CSV profile matches the frame"""
+    path = tmp_path / 'ratings.csv'
+    sample_data.to_csv(path, index=False)
+    report = profile_csv(path, sample_size=500, chunksize=700)
+    describe = report['describe']
+    assert report['info']['rows'] == len(sample_data)
+    assert report['sampled_rows'] == 500
+    assert describe.loc['stock', 'nulls'] == sample_data['stock'].isna().sum()
+    assert abs(describe.loc['headline', 'distinct'] - 1500) < 50
+
+
+def test_profile_csv_duplicates_and_mixed_chunk_dtypes(tmp_path):
+    """Test exact duplicate counts and distinct counts when chunks infer different dtypes"""
+    volume = pd.Series(np.arange(3000) % 1000, dtype=float)
+    volume[2500] = np.nan
+    code = (np.arange(3000) % 1000).astype(object)
+    code[2600] = 'X'
+    df = pd.DataFrame({'volume': volume, 'code': code})
+    path = tmp_path / 'prices.csv'
+    df.to_csv(path, index=False, float_format='%.0f')
+
+    # The first chunk reads both columns as int64, later ones as float64 and object
+    report = profile_csv(path, sample_size=100, chunksize=1000)
+    assert abs(report['describe'].loc['volume', 'distinct'] - 1000) < 20
+    assert abs(report['describe'].loc['code', 'distinct'] - 1001) < 20
+    assert report['duplicates'] == df.astype(str).duplicated().sum()
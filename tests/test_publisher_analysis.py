@@ -9,7 +9,8 @@ from src.analytics.publisher_analysis import (
     analyze_publisher_activity,
     analyze_publisher_domains,
     analyze_publisher_content,
-    analyze_publisher_timing
+    analyze_publisher_timing,
+    publisher_heavy_hitters
 )
 
 @pytest.fixture
@@ -66,4 +67,23 @@ def test_analyze_publisher_timing(sample_data):
     # Check if timing analysis returns expected columns
     assert ('hour', 'mean') in timing.columns
     assert ('hour', 'std') in timing.columns
-    assert ('day_of_week', '<lambda>') in timing.columns 
\ No newline at end of file
+    assert ('day_of_week', '<lambda>') in timing.columns 
+
+def test_publisher_heavy_hitters(sample_data):
+    """Test top-k publishers, domains and tickers over chunks"""
+    sample_data['stock'] = ['AAPL', 'AAPL', 'MSFT', 'AAPL']
+    chunks = [sample_data.iloc[:2], sample_data.iloc[2:]]
+    sketches = publisher_heavy_hitters(chunks, k=10)
+
+    exact = sample_data['publisher'].value_counts()
+    assert sketches['publisher'].counts(3).to_dict() == exact.to_dict()
+    assert sketches['domain'].counts(1).to_dict() == {'domain1.com': 2}
+    assert sketches['stock'].counts(1).to_dict() == {'AAPL': 3}
+
+def test_publisher_content_skips_missing_text(sample_data):
+    """Test that articles without text are left out of the averages"""
+    sample_data['text'] = ['Text 1', None, 'Text 333', 'Text 4']
+    content = analyze_publisher_content(sample_data)
+    assert content.loc['publisher1@domain1.com', 'avg_text_length'] == 7
+    assert content.loc['publisher2@domain2.com', 'article_count'] == 1
+    assert np.isnan(content.loc['publisher2@domain2.com', 'avg_text_length'])
@@ -0,0 +1,81 @@
+"""
+Tests for the reporting module
+"""
+
+import json
+import threading
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+from src.reporting import ReportWriter, format_sections, finish_figure
+
+@pytest.fixture
+def sample_counts():
+    """Create sample publisher counts"""
+    return pd.Series([5, 3, 1], index=['a@x.com', 'b', 'c'], name='count')
+
+def test_format_sections(sample_counts):
+    """Test that sections render as titled blocks"""
+    text = format_sections(["Header:", ("Counts", sample_counts)])
+    assert text.startswith("Header:\n\nCounts:\n")
+    assert str(sample_counts) in text
+
+def test_writer_writes_artifacts_and_manifest(tmp_path, sample_counts):
+    """Test text, table and figure artifacts in one run directory"""
+    with ReportWriter(root=tmp_path, run_id='run1') as writer:
+        writer.write_text('report.txt', [("Counts", sample_counts)])
+        writer.write_table('counts.csv', sample_counts)
+        writer.write_table('counts.parquet', sample_counts)
+        plt.figure()
+        sample_counts.plot(kind='bar')
+        finish_figure('counts.png', writer)
+        # The figure was rendered and closed in pyplot before returning
+        assert plt.get_fignums() == []
+
+    run_dir = tmp_path / 'run1'
+    manifest = json.loads((run_dir / 'manifest.json').read_text())
+    names = [artifact['name'] for artifact in manifest['artifacts']]
+    assert names == ['counts.csv', 'counts.parquet', 'counts.png', 'report.txt']
+    assert all(artifact['bytes'] > 0 for artifact in manifest['artifacts'])
+    assert manifest['errors'] == []
+    assert str(sample_counts) in (run_dir / 'report.txt').read_text()
+    assert (run_dir / 'counts.png').read_bytes().startswith(b'\x89PNG')
+    assert pd.read_parquet(run_dir / 'counts.parquet')['count'].tolist() == [5, 3, 1]
+
+def test_pending_artifacts_are_bounded(tmp_path):
+    """Test that submitting blocks once max_pending artifacts are queued"""
+    release = threading.Event()
+
+    class Slow:
+        def __str__(self):
+            release.wait(5)
+            return 'done'
+
+    writer = ReportWriter(root=tmp_path, max_pending=1, max_workers=1)
+    writer.write_text('first.txt', [("Slow", Slow())])
+    blocked = threading.Thread(target=writer.write_text, args=('second.txt', ["fast"]))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+    release.set()
+    blocked.join(5)
+    writer.close()
+    assert (writer.run_dir / 'second.txt').read_text() == 'fast'
+
+def test_failed_artifact_is_reported(tmp_path):
+    """Test that a failed write is listed in the manifest and raised on close"""
+    class Broken:
+        def __str__(self):
+            raise ValueError('cannot render')
+
+    writer = ReportWriter(root=tmp_path, run_id='run2')
+    writer.write_text('broken.txt', [("Broken", Broken())])
+    writer.write_text('ok.txt', ["fine"])
+    with pytest.raises(RuntimeError, match='broken.txt'):
+        writer.close()
+    manifest = json.loads((tmp_path / 'run2' / 'manifest.json').read_text())
+    assert [artifact['name'] for artifact in manifest['artifacts']] == ['ok.txt']
+    assert manifest['errors'][0]['name'] == 'broken.txt'
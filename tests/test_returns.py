@@ -0,0 +1,86 @@
+"""
+Tests for the returns module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.returns import adjusted_close, price_matrix, return_matrix, returns_frame
+from src.sentiment_analysis import compute_daily_returns
+
+
+@pytest.fixture
+def sample_data():
+    """Create a shuffled two-ticker daily close panel"""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2020-01-01', periods=60)
+    frames = []
+    for ticker in ['MSFT', 'AAPL']:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+        frames.append(pd.DataFrame({'ticker': ticker, 'Date': dates, 'Close': close}))
+    # Shuffled rows, as after a concat of unsorted sources
+    return pd.concat(frames, ignore_index=True).sample(frac=1, random_state=0)
+
+
+def test_matches_pct_change_without_touching_input(sample_data):
+    """Test return horizons against pct_change, leaving the input unchanged"""
+    before = sample_data.copy()
+    result = return_matrix(sample_data, horizons=(1, 5, 21), forward_horizons=(5,))
+    pd.testing.assert_frame_equal(sample_data, before)
+
+    assert result['values'].dtype == np.float32
+    assert result['values'].shape == (2, 60, 4)
+    assert result['labels'] == ['ret_1', 'ret_5', 'ret_21', 'fwd_5']
+    assert result['tickers'].tolist() == ['AAPL', 'MSFT']
+
+    aapl = sample_data[sample_data['ticker'] == 'AAPL'].sort_values('Date')['Close']
+    for k, h in enumerate([1, 5, 21]):
+        expected = aapl.pct_change(h).to_numpy()
+        np.testing.assert_allclose(result['values'][0, :, k], expected, rtol=1e-5)
+    np.testing.assert_allclose(result['values'][0, :, 3], aapl.pct_change(5).shift(-5), rtol=1e-5)
+
+
+def test_log_returns_and_missing_bars(sample_data):
+    """Test log returns around a missing bar"""
+    dropped = sample_data.drop(sample_data.index[(sample_data['ticker'] == 'MSFT')
+                                                 & (sample_data['Date'] == '2020-01-15')])
+    result = return_matrix(dropped, horizons=(1,), kind='log')
+    matrix, tickers, dates = price_matrix(dropped)
+    msft = result['values'][tickers.get_loc('MSFT'), :, 0]
+    gap = dates.get_loc(pd.Timestamp('2020-01-15'))
+    assert np.isnan(msft[[0, gap, gap + 1]]).all()
+    np.testing.assert_allclose(np.nansum(msft), np.log(matrix[1, -1] / matrix[1, 0])
+                               - np.log(matrix[1, gap + 1] / matrix[1, gap - 1]), rtol=1e-4)
+
+
+def test_adjusted_close_column_is_preferred(sample_data):
+    """Test that an Adj Close column is used over Close"""
+    sample_data['Adj Close'] = sample_data['Close'] * 0.5
+    sample_data.loc[sample_data['Date'] == '2020-02-03', 'Close'] /= 4
+    result = return_matrix(sample_data, horizons=(1,))
+    assert np.nanmax(np.abs(result['values'])) < 0.1
+
+
+def test_adjusted_close_removes_split_and_dividend():
+    """Test back-adjustment for a split and a dividend"""
+    close = np.array([100.0, 101.0, 25.5, 25.0, 26.0])
+    splits = np.array([0, 0, 4, 0, 0])
+    dividends = np.array([0, 0, 0, 1.0, 0])
+    adjusted = adjusted_close(close, dividends, splits)
+    assert adjusted[-1] == pytest.approx(26.0)
+    gross = adjusted[1:] / adjusted[:-1]
+    np.testing.assert_allclose(gross, [1.01, 25.5 * 4 / 101, 26.0 / 25.5, 26.0 / 25.0])
+
+    frame = returns_frame(return_matrix(close[None, :], horizons=(1,)))
+    assert len(frame) == 4
+
+
+def test_compute_daily_returns_leaves_input_alone(sample_data):
+    """Test that string dates are parsed without changing the caller's frame"""
+    aapl = sample_data[sample_data['ticker'] == 'AAPL'].copy()
+    aapl['Date'] = aapl['Date'].dt.strftime('%Y-%m-%d')
+    before = aapl.copy()
+    returns = compute_daily_returns(aapl)
+    pd.testing.assert_frame_equal(aapl, before)
+    assert len(returns) == len(aapl) - 1
@@ -0,0 +1,77 @@
+"""
+Tests for the schema module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.schema import (
+    ARTICLE_SCHEMA,
+    OHLC_SCHEMA,
+    WEEKDAY_DTYPE,
+    enforce_schema,
+    compact_frame,
+    load_article_data
+)
+
+@pytest.fixture
+def sample_data():
+    """Create sample data for testing"""
+    n = 1000
+    data = {
+        'headline': [f'Stock {i % 50} rises after earnings beat' for i in range(n)],
+        'publisher': [f'publisher{i % 7}@domain{i % 3}.com' for i in range(n)],
+        'stock': [f'T{i % 20}' for i in range(n)],
+        'hour': np.arange(n) % 24,
+        'day_of_week': [['Monday', 'Friday'][i % 2] for i in range(n)],
+        'sentiment': np.linspace(-1, 1, n)
+    }
+    return pd.DataFrame(data)
+
+def test_enforce_schema(sample_data):
+    """Test that declared columns get their canonical dtypes"""
+    df = enforce_schema(sample_data)
+
+    assert df['headline'].dtype == 'string[pyarrow]'
+    assert isinstance(df['publisher'].dtype, pd.CategoricalDtype)
+    assert df['hour'].dtype == np.int8
+    assert df['day_of_week'].dtype == WEEKDAY_DTYPE
+    assert df['sentiment'].dtype == np.float32
+
+    # Values are preserved
+    assert df['day_of_week'].iloc[1] == 'Friday'
+    assert df['hour'].max() == 23
+
+def test_enforce_schema_with_missing_values():
+    """Test that integer columns with NaN fall back to nullable types"""
+    df = pd.DataFrame({'headline_length': [10.0, np.nan, 12.0]})
+    enforce_schema(df, columns=['headline_length'])
+
+    assert df['headline_length'].dtype == 'Int16'
+    assert df['headline_length'].isna().sum() == 1
+
+def test_compact_frame(sample_data):
+    """Test that compacting reports and reduces memory"""
+    report = compact_frame(sample_data)
+
+    assert report['before_bytes'] > report['after_bytes']
+    assert report['reduction'] > 3
+
+def test_load_article_data(tmp_path, sample_data):
+    """Test loading a CSV straight into the article schema"""
+    path = tmp_path / 'articles.csv'
+    sample_data.to_csv(path, index=False)
+
+    df = load_article_data(path)
+
+    assert df['headline'].dtype == 'string[pyarrow]'
+    assert isinstance(df['stock'].dtype, pd.CategoricalDtype)
+    assert len(df) == len(sample_data)
+
+def test_ohlc_schema():
+    """Test OHLC frames keep float64 prices and int64 volume"""
+    df = pd.DataFrame({'Close': [1, 2, 3], 'Volume': [10.0, 20.0, 30.0]})
+    enforce_schema(df, OHLC_SCHEMA)
+
+    assert df['Close'].dtype == np.float64
+    assert df['Volume'].dtype == np.int64
@@ -0,0 +1,151 @@
+"""
+Tests for the streaming summary sketches
+"""
+
+import pickle
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.sketches import (
+    RunningStats,
+    KLLSketch,
+    StreamingSummary,
+    summarize_chunks,
+    CountMinSketch,
+    SpaceSaving,
+    HeavyHitters
+)
+from src.outlier import OutlierDetection
+from src.analytics.descriptive_statistics import analyze_headline_lengths
+
+@pytest.fixture
+def zipf_labels():
+    """Create a Zipf-distributed stream of labels"""
+    rng = np.random.default_rng(3)
+    weights = 1 / np.arange(1, 2001) ** 1.2
+    return pd.Series(rng.choice(2000, 200_000, p=weights / weights.sum())).map('label{}'.format)
+
+@pytest.fixture
+def sample_values():
+    """Create a skewed sample of values"""
+    rng = np.random.default_rng(7)
+    return rng.lognormal(3, 0.5, 100_000)
+
+def test_running_stats_merge(sample_values):
+    """Test that merged chunk stats match numpy"""
+    left = RunningStats().update(sample_values[:30_000])
+    right = RunningStats().update(sample_values[30_000:])
+    stats = left.merge(right)
+
+    assert stats.count == len(sample_values)
+    assert stats.mean == pytest.approx(sample_values.mean())
+    assert stats.std() == pytest.approx(sample_values.std(ddof=1))
+    assert stats.min == sample_values.min()
+    assert stats.max == sample_values.max()
+
+def test_kll_quantiles_within_error_bound(sample_values):
+    """Test sketch quantiles stay inside the documented rank error"""
+    sketch = KLLSketch(k=200, seed=1)
+    for chunk in np.array_split(sample_values, 50):
+        sketch.update(chunk)
+
+    eps = KLLSketch.normalized_rank_error(200)
+    sorted_values = np.sort(sample_values)
+    for q in [0.1, 0.25, 0.5, 0.75, 0.9]:
+        estimate = sketch.quantile(q)
+        true_rank = np.searchsorted(sorted_values, estimate) / len(sorted_values)
+        assert abs(true_rank - q) <= eps
+
+    # Memory stays far below the number of values
+    assert sum(len(level) for level in sketch.levels) < 1000
+
+def test_summary_merge_across_processes(sample_values):
+    """Test that pickled summaries merge like one summary"""
+    parts = [StreamingSummary(seed=i).update(chunk)
+             for i, chunk in enumerate(np.array_split(sample_values, 4))]
+    merged = pickle.loads(pickle.dumps(parts[0]))
+    for part in parts[1:]:
+        merged.merge(pickle.loads(pickle.dumps(part)))
+
+    described = merged.describe()
+    exact = pd.Series(sample_values).describe()
+
+    assert list(described.index) == list(exact.index)
+    assert described['count'] == exact['count']
+    assert described['mean'] == pytest.approx(exact['mean'])
+    assert described['50%'] == pytest.approx(exact['50%'], rel=0.05)
+
+def test_outlier_bounds_from_summaries():
+    """Test IQR bounds from sketches against exact bounds"""
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'Close': rng.normal(100, 5, 20_000),
+                       'Volume': rng.normal(1e6, 1e5, 20_000)})
+    chunks = (df.iloc[i:i + 5000] for i in range(0, len(df), 5000))
+
+    summaries = summarize_chunks(chunks, ['Close', 'Volume'], seed=0)
+    approx = OutlierDetection.bounds_from_summaries(summaries, 'iqr')
+    exact = OutlierDetection(df).bounds('iqr')
+
+    np.testing.assert_allclose(approx.to_numpy(), exact.to_numpy(), rtol=0.02)
+
+    mask, summary = OutlierDetection(df).outlier_mask(bounds=approx)
+    assert mask.shape == (20_000, 2)
+    assert 'outliers' in summary.columns
+
+def test_approximate_headline_lengths():
+    """Test sketch-backed headline statistics"""
+    df = pd.DataFrame({'headline': ['a' * (i % 80 + 1) for i in range(5000)]})
+
+    approx = analyze_headline_lengths(df, approximate=True)
+    exact = df['headline_length'].describe()
+
+    assert approx['count'] == exact['count']
+    assert approx['mean'] == pytest.approx(exact['mean'])
+    assert approx['50%'] == pytest.approx(exact['50%'], abs=3)
+
+def test_count_min_never_underestimates(zipf_labels):
+    """Test Count-Min estimates against exact counts and the error bound"""
+    sketch = CountMinSketch(width=512, depth=4, seed=1)
+    for chunk in np.array_split(zipf_labels.to_numpy(), 7):
+        sketch.update(chunk)
+    exact = zipf_labels.value_counts()
+    estimates = sketch.estimate(exact.index)
+    error, _ = sketch.error_bound()
+
+    assert sketch.total == len(zipf_labels)
+    assert (estimates >= exact.to_numpy()).all()
+    assert np.mean(estimates - exact.to_numpy() <= error) > 0.95
+
+def test_space_saving_bounds_hold_after_merges(zipf_labels):
+    """Test Space-Saving count bounds and floor across chunk merges"""
+    parts = [SpaceSaving(k=50).update(chunk) for chunk in np.array_split(zipf_labels.to_numpy(), 8)]
+    summary = parts[0]
+    for part in parts[1:]:
+        summary.merge(part)
+    exact = zipf_labels.value_counts()
+    top = summary.top()
+
+    assert len(top) == 50
+    true = exact.reindex(top.index).to_numpy()
+    assert (top['count'].to_numpy() >= true).all()
+    assert ((top['count'] - top['error']).to_numpy() <= true).all()
+    # No label left out is more frequent than the floor
+    assert exact.drop(top.index).max() <= summary.floor
+    assert summary.floor <= len(zipf_labels) / 50
+
+def test_heavy_hitters_top_matches_value_counts(zipf_labels):
+    """Test that the heavy hitters across pickled workers find the exact top 10"""
+    parts = [pickle.loads(pickle.dumps(HeavyHitters(k=100).update(chunk)))
+             for chunk in np.array_split(zipf_labels.to_numpy(), 4)]
+    sketch = parts[0]
+    for part in parts[1:]:
+        sketch.merge(part)
+    exact = zipf_labels.value_counts().head(10)
+    top = sketch.top(10)
+
+    assert top.index.tolist() == exact.index.tolist()
+    assert (top['lower_bound'] <= exact.to_numpy()).all()
+    assert (top['upper_bound'] >= exact.to_numpy()).all()
+    assert sketch.counts(10).name == 'count'
+    assert sketch.error_bounds()['total'] == len(zipf_labels)
@@ -0,0 +1,87 @@
+"""
+Tests for the state_store module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.state_store import AnalyticsState
+
+
+@pytest.fixture
+def sample_data():
+    """Create ten days of headlines, publishers, tickers and sentiment"""
+    rng = np.random.default_rng(0)
+    n = 600
+    words = np.array(['apple', 'earnings', 'beat', 'tesla', 'recall', 'upgrade', 'the', 'on'])
+    return pd.DataFrame({
+        'headline': [' '.join(rng.choice(words, 4)) for _ in range(n)],
+        'publisher': rng.choice(['Benzinga', 'a@zacks.com', 'b@zacks.com'], n),
+        'date': pd.Series(pd.Timestamp('2024-01-01', tz='UTC')
+                          + pd.to_timedelta(np.sort(rng.integers(0, 10 * 86400, n)), unit='s')),
+        'stock': rng.choice(['AAPL', 'TSLA'], n),
+        'sentiment': rng.normal(0, 0.3, n).astype(np.float32),
+    })
+
+
+def test_deltas_match_single_pass(sample_data):
+    """Test that chunked updates give the single-pass report"""
+    single = AnalyticsState().update(sample_data.copy()).report()
+    state = AnalyticsState()
+    for start in range(0, len(sample_data), 120):
+        state.update(sample_data.iloc[start:start + 120].copy())
+    report = state.report()
+
+    pd.testing.assert_series_equal(report['publisher_counts'], single['publisher_counts'])
+    pd.testing.assert_frame_equal(report['weekday_hour'], single['weekday_hour'])
+    pd.testing.assert_series_equal(report['daily_counts'], single['daily_counts'])
+    pd.testing.assert_frame_equal(report['top_terms'], single['top_terms'])
+    np.testing.assert_allclose(report['daily_sentiment'], single['daily_sentiment'], rtol=1e-6)
+    assert report['domain_counts']['zacks.com'] == sample_data['publisher'].str.contains('zacks').sum()
+
+
+def test_report_matches_pandas(sample_data):
+    """Test report figures against pandas"""
+    report = AnalyticsState().update(sample_data.copy()).report()
+    pd.testing.assert_series_equal(report['publisher_counts'], sample_data['publisher'].value_counts(),
+                                   check_names=False, check_index_type=False)
+    # Calendar fields are on the exchange clock
+    local = sample_data['date'].dt.tz_convert('America/New_York')
+    hourly = local.dt.hour.value_counts().reindex(range(24), fill_value=0)
+    np.testing.assert_array_equal(report['hourly_counts'], hourly)
+    lengths = sample_data['headline'].str.len()
+    assert report['headline_length']['mean'] == pytest.approx(lengths.mean())
+    expected = sample_data.groupby([local.dt.floor('D'), 'stock'])['sentiment'].mean()
+    np.testing.assert_allclose(report['daily_sentiment'], expected, rtol=1e-6)
+    # Stop words are not counted as terms
+    assert 'the' not in report['top_terms'].index
+
+
+def test_update_file_is_idempotent_and_persists(sample_data, tmp_path):
+    """Test that a delta file is applied once and the state persists"""
+    delta = tmp_path / '2024-01-11.csv'
+    sample_data.drop(columns='sentiment').to_csv(delta, index=False)
+    state_path = tmp_path / 'state' / 'news_state.pkl'
+
+    state = AnalyticsState.load(state_path)
+    assert state.update_file(delta)
+    state.save(state_path)
+
+    restored = AnalyticsState.load(state_path)
+    assert not restored.update_file(delta)
+    assert restored.n_articles == len(sample_data)
+    report = restored.write_report(tmp_path / 'report.txt')
+    assert report['weekday_hour'].to_numpy().sum() == len(sample_data)
+    assert 'Top Publishers' in (tmp_path / 'report.txt').read_text()
+
+
+def test_update_file_skips_changed_file(sample_data, tmp_path):
+    """Test that a delta changed after it was applied is not counted twice"""
+    delta = tmp_path / '2024-01-11.csv'
+    sample_data.iloc[:100].to_csv(delta, index=False)
+    state = AnalyticsState()
+    assert state.update_file(delta)
+    sample_data.iloc[:150].to_csv(delta, index=False)
+    assert not state.update_file(delta)
+    assert state.n_articles == 100
@@ -0,0 +1,71 @@
+"""
+Tests for the synthetic data module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from textblob import TextBlob
+from src.synthetic import (
+    PHRASES,
+    generate_articles,
+    iter_articles,
+    generate_ohlcv,
+    iter_ohlcv,
+    write_frames
+)
+
+def test_generate_articles_shape_and_seed():
+    """Test article columns, Zipf skew and reproducibility"""
+    df = generate_articles(20_000, seed=1, n_publishers=200, tickers=300)
+    assert list(df.columns) == ['headline', 'url', 'publisher', 'date', 'stock']
+    assert str(df['date'].dt.tz) == 'America/New_York'
+    assert df['date'].is_monotonic_increasing
+
+    counts = df['publisher'].value_counts()
+    assert counts.iloc[0] > 10 * counts.median()
+    # Most articles fall on weekdays and in the daytime
+    assert (df['date'].dt.dayofweek < 5).mean() > 0.9
+    assert df['date'].dt.hour.between(6, 17).mean() > 0.7
+
+    pd.testing.assert_frame_equal(df, generate_articles(20_000, seed=1, n_publishers=200, tickers=300))
+    assert not df['headline'].equals(generate_articles(20_000, seed=2, n_publishers=200, tickers=300)['headline'])
+
+def test_phrases_score_with_their_sentiment():
+    """Test that TextBlob scores every phrase with the sign of its class"""
+    for phrase in PHRASES['positive']:
+        assert TextBlob(f'AAPL {phrase}').sentiment.polarity > 0
+    for phrase in PHRASES['negative']:
+        assert TextBlob(f'AAPL {phrase}').sentiment.polarity < 0
+    for phrase in PHRASES['neutral']:
+        assert TextBlob(f'AAPL {phrase}').sentiment.polarity == 0
+
+def test_iter_articles_chunks_are_bounded_and_ordered():
+    """Test that chunks respect chunksize and concatenate in date order"""
+    chunks = list(iter_articles(25_000, chunksize=10_000, seed=0, tickers=['AAA', 'BBB']))
+    assert all(len(chunk) <= 10_000 for chunk in chunks)
+    combined = pd.concat(chunks, ignore_index=True)
+    assert len(combined) == 25_000
+    assert combined['date'].is_monotonic_increasing
+    assert set(combined['stock']) == {'AAA', 'BBB'}
+
+def test_generate_ohlcv_is_consistent():
+    """Test OHLC ordering, positive volume and per-ticker business-day panels"""
+    prices = generate_ohlcv(['AAA', 'BBB', 'CCC'], start='2020-01-01', end='2021-01-01', seed=0)
+    dates = pd.bdate_range('2020-01-01', '2021-01-01', inclusive='left')
+    assert len(prices) == 3 * len(dates)
+    assert (prices['High'] >= prices[['Open', 'Close']].max(axis=1)).all()
+    assert (prices['Low'] <= prices[['Open', 'Close']].min(axis=1)).all()
+    assert (prices['Low'] > 0).all() and (prices['Volume'] > 0).all()
+    # Daily log returns have about the configured volatility
+    log_returns = np.log(prices['Close']).groupby(prices['ticker']).diff().dropna()
+    assert 0.05 < log_returns.std() * np.sqrt(252) < 1.5
+
+@pytest.mark.parametrize('suffix', ['csv', 'parquet'])
+def test_write_frames_streams_chunks(tmp_path, suffix):
+    """Test that streamed chunks round-trip through CSV and Parquet"""
+    path = tmp_path / f'prices.{suffix}'
+    rows = write_frames(iter_ohlcv(12, start='2020-01-01', end='2020-07-01', chunksize=500), path)
+    loaded = pd.read_parquet(path) if suffix == 'parquet' else pd.read_csv(path)
+    assert rows == len(loaded) == 12 * len(pd.bdate_range('2020-01-01', '2020-07-01', inclusive='left'))
+    assert loaded['ticker'].nunique() == 12
@@ -0,0 +1,58 @@
+"""
+Tests for the text statistics module
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.text_stats import COUNT_COLUMNS, text_statistics, rollup_text_statistics
+from src.synthetic import generate_articles
+
+@pytest.fixture
+def articles():
+    """Create synthetic articles"""
+    return generate_articles(3000, seed=5, tickers=['AAPL', 'MSFT', 'TSLA'])
+
+def test_matches_string_methods(articles):
+    """Test the byte-level counts against pandas string methods"""
+    headlines = articles['headline'].astype('string[pyarrow]')
+    stats = text_statistics(headlines)
+
+    assert stats['char_length'].tolist() == headlines.str.len().tolist()
+    assert stats['token_count'].tolist() == headlines.str.split().str.len().tolist()
+    assert stats['upper_count'].tolist() == headlines.str.count('[A-Z]').tolist()
+    assert stats['digit_count'].tolist() == headlines.str.count('[0-9]').tolist()
+    assert stats['punct_count'].tolist() == headlines.str.count(r'[^\w\s]').tolist()
+    assert stats.index.equals(articles.index)
+
+def test_edge_cases():
+    """Test missing, empty, multi-byte and whitespace-only text"""
+    texts = pd.Series(['Watch $AAPL, NVDA: up 5%', None, '', 'café  Q3\tbeat', '   '],
+                      dtype='string[pyarrow]')
+    stats = text_statistics(texts)
+
+    assert stats['char_length'].tolist() == [24, 0, 0, 13, 3]
+    assert stats['token_count'].tolist() == [5, 0, 0, 3, 0]
+    assert stats['ticker_mentions'].tolist() == [2, 0, 0, 0, 0]
+    assert stats['punct_count'].tolist() == [4, 0, 0, 0, 0]
+    assert stats['upper_ratio'].isna().tolist() == [False, True, True, False, True]
+    # A slice of the column starts at a non-zero offset
+    assert text_statistics(texts.iloc[3:]).equals(stats.iloc[3:])
+
+@pytest.mark.parametrize('dtype', [object, 'category'])
+def test_other_dtypes_match(articles, dtype):
+    """Test that object and categorical columns give the Arrow results"""
+    expected = text_statistics(articles['headline'].astype('string[pyarrow]'))
+    pd.testing.assert_frame_equal(text_statistics(articles['headline'].astype(dtype)), expected)
+
+def test_rollup_matches_groupby_mean(articles):
+    """Test grouped-sum roll-ups against a per-group mean"""
+    stats = text_statistics(articles['headline'])
+    rollup = rollup_text_statistics(stats, articles['stock'])
+    expected = stats[COUNT_COLUMNS].groupby(articles['stock']).mean()
+
+    assert rollup['article_count'].to_dict() == articles['stock'].value_counts().to_dict()
+    for column in COUNT_COLUMNS:
+        np.testing.assert_allclose(rollup[f'avg_{column}'], expected[column])
+    sums = stats.groupby(articles['stock'])[['upper_count', 'letter_count']].sum()
+    np.testing.assert_allclose(rollup['upper_ratio'], sums['upper_count'] / sums['letter_count'])
@@ -9,7 +9,11 @@ from src.analytics.time_series_analysis import (
     analyze_publication_frequency,
     analyze_publishing_times,
     detect_seasonality,
-    test_stationarity
+    test_stationarity,
+    series_matrix,
+    batch_decompose,
+    batch_stationarity,
+    seasonal_strength
 )
 
 @pytest.fixture
@@ -78,4 +82,53 @@ def test_test_stationarity(sample_data):
     
     # Check if critical values are present
     assert isinstance(result['Critical Values'], dict)
-    assert all(key in result['Critical Values'] for key in ['1%', '5%', '10%']) 
\ No newline at end of file
+    assert all(key in result['Critical Values'] for key in ['1%', '5%', '10%']) 
+
+@pytest.fixture
+def panel_data():
+    """Create daily series with weekly seasonality for several publishers"""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2024-01-01', periods=70, freq='D')
+    weekly = np.array([5, 6, 7, 6, 5, 1, 0])
+    return pd.DataFrame({
+        f'publisher_{i}': np.tile(weekly * (i + 1), 10) + rng.poisson(1, len(dates)) + 0.1 * np.arange(len(dates))
+        for i in range(3)
+    }, index=dates)
+
+def test_series_matrix(sample_data):
+    """Test one count column per group"""
+    sample_data['publisher'] = np.where(np.arange(len(sample_data)) % 3 == 0, 'A', 'B')
+    wide = series_matrix(sample_data, 'publisher')
+    assert list(wide.columns) == ['A', 'B']
+    assert wide.to_numpy().sum() == len(sample_data)
+    assert wide.index.freq == 'D'
+
+@pytest.mark.parametrize('model', ['additive', 'multiplicative'])
+def test_batch_decompose_fast_matches_statsmodels(panel_data, model):
+    """Test the matrix decomposition against one seasonal_decompose call per series"""
+    fast = batch_decompose(panel_data, model=model)
+    slow = batch_decompose(panel_data, model=model, fast=False, n_jobs=1)
+    assert list(fast.columns) == ['series', 'date', 'observed', 'trend', 'seasonal', 'resid']
+    assert len(fast) == panel_data.size
+    for component in ['trend', 'seasonal', 'resid']:
+        np.testing.assert_allclose(fast[component], slow[component], equal_nan=True)
+    if model == 'additive':
+        assert (seasonal_strength(fast) > 0.5).all()
+
+def test_batch_stationarity(panel_data):
+    """Test one ADF row per series, matching adfuller"""
+    panel_data['constant'] = 1.0
+    result = batch_stationarity(panel_data, n_jobs=1)
+    assert result['series'].tolist() == list(panel_data.columns)
+    single = test_stationarity(panel_data['publisher_0'])
+    assert result.loc[0, 'adf_statistic'] == pytest.approx(single['ADF Statistic'])
+    assert result.loc[0, 'critical_5%'] == pytest.approx(single['Critical Values']['5%'])
+    assert np.isnan(result.loc[3, 'p_value'])
+
+def test_process_pool_matches_serial(panel_data):
+    """Test that two worker processes give the serial results"""
+    serial = batch_decompose(panel_data, fast=False, n_jobs=1)
+    pooled = batch_decompose(panel_data, fast=False, n_jobs=2)
+    pd.testing.assert_frame_equal(pooled, serial)
+    pd.testing.assert_frame_equal(batch_stationarity(panel_data, n_jobs=2),
+                                  batch_stationarity(panel_data, n_jobs=1))
@@ -0,0 +1,96 @@
+"""
+Tests for the timestamp normalization module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.timestamps import (
+    EXCHANGE_TZ,
+    infer_timestamp_format,
+    parse_timestamps,
+    normalize_timestamps,
+    ensure_datetime
+)
+
+@pytest.fixture
+def sample_data():
+    """Create sample data with mixed UTC offsets"""
+    data = {
+        'date': [
+            '2020-06-05 10:30:54-04:00',
+            '2020-01-05 10:30:54-05:00',
+            '2020-06-05 10:30:54-04:00',
+            None
+        ]
+    }
+    return pd.DataFrame(data)
+
+def test_infer_timestamp_format():
+    """Test format inference"""
+    assert infer_timestamp_format('2020-06-05 10:30:54-04:00') == '%Y-%m-%d %H:%M:%S%z'
+    assert infer_timestamp_format('2024-01-01') == '%Y-%m-%d'
+
+def test_parse_timestamps(sample_data):
+    """Test parsing mixed offsets to UTC"""
+    parsed = parse_timestamps(sample_data['date'])
+
+    assert str(parsed.dt.tz) == 'UTC'
+    assert parsed.iloc[0] == pd.Timestamp('2020-06-05 14:30:54', tz='UTC')
+    assert parsed.iloc[1] == pd.Timestamp('2020-01-05 15:30:54', tz='UTC')
+    assert parsed.iloc[0] == parsed.iloc[2]
+    assert pd.isna(parsed.iloc[3])
+
+def test_parse_timestamps_exchange_time(sample_data):
+    """Test conversion to exchange time and naive output"""
+    parsed = parse_timestamps(sample_data['date'], tz=EXCHANGE_TZ)
+    assert parsed.iloc[0].hour == 10
+
+    naive = parse_timestamps(sample_data['date'], tz=None)
+    assert naive.dt.tz is None
+    assert naive.iloc[0].hour == 14
+
+def test_parse_timestamps_falls_back_to_mixed_layouts():
+    """Test rows that do not follow the inferred layout"""
+    values = pd.Series(['2024-01-01 10:00:00', '2024-01-02'])
+    parsed = parse_timestamps(values)
+
+    assert parsed.iloc[1] == pd.Timestamp('2024-01-02', tz='UTC')
+
+def test_ensure_datetime_skips_parsed_columns(sample_data):
+    """Test that already parsed columns are not parsed again"""
+    normalize_timestamps(sample_data, 'date')
+    parsed = sample_data['date']
+
+    result = ensure_datetime(sample_data, 'date')
+
+    assert result is parsed or result.equals(parsed)
+    assert str(sample_data['date'].dt.tz) == 'UTC'
+
+def test_calendar_fields_on_exchange_clock():
+    """Test that an 8pm ET article keeps its ET hour, weekday and date"""
+    from src.analytics.descriptive_statistics import analyze_publication_dates
+    from src.analytics.time_series_analysis import analyze_publishing_times
+    from src.sentiment_analysis import aggregate_daily_sentiment
+
+    # Monday 8pm ET is Tuesday 01:00 UTC
+    df = pd.DataFrame({'publication_date': ['2024-03-04 20:00:00-05:00', '2024-03-04 20:00:00'],
+                       'stock': 'AAPL', 'sentiment': [0.5, 0.1]})
+    assert str(ensure_datetime(df.copy(), 'publication_date').dt.tz) == 'UTC'
+
+    daily_counts, hourly_counts = analyze_publication_dates(df.copy())
+    assert daily_counts.to_dict() == {'Monday': 2}
+    assert hourly_counts.to_dict() == {20: 2}
+    assert analyze_publishing_times(df.copy()).loc['Monday', 20] == 2
+
+    daily = aggregate_daily_sentiment(df, date_col='publication_date')
+    assert daily['publication_date'].tolist() == [pd.Timestamp('2024-03-04').date()]
+    assert daily['sentiment'].iloc[0] == pytest.approx(0.3)
+
+def test_naive_strings_in_exchange_time():
+    """Test that strings without an offset can be read as exchange wall-clock times"""
+    values = pd.Series(['2024-07-01 09:30:00', '2024-07-01 09:30:00-04:00', None])
+    parsed = parse_timestamps(values, naive_tz=EXCHANGE_TZ)
+    assert parsed.iloc[0] == parsed.iloc[1] == pd.Timestamp('2024-07-01 13:30', tz='UTC')
+    assert pd.isna(parsed.iloc[2])
+    assert parse_timestamps(values).iloc[0] == pd.Timestamp('2024-07-01 09:30', tz='UTC')